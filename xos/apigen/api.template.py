@@ -20,6 +20,18 @@ else:
     # rest_framework 2.x
     IdField = serializers.Field
 
+validators_cache = {}
+
+def get_validators(obj):
+    # the validators only depend on the model, not on the row
+    model = obj.__class__
+    if model not in validators_cache:
+        try:
+            validators_cache[model] = obj.getValidators()
+        except:
+            validators_cache[model] = None
+    return validators_cache[model]
+
 """
     Schema of the generator object:
         all: Set of all Model objects
@@ -120,10 +132,7 @@ class {{ object.camel }}Serializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = {{ object.camel }}
         fields = ('humanReadableName', 'validators', {% for prop in object.props %}'{{ prop }}',{% endfor %}{% for ref in object.refs %}{%if ref.multi %}'{{ ref.plural }}'{% else %}'{{ ref }}'{% endif %},{% endfor %})
@@ -142,10 +151,7 @@ class {{ object.camel }}IdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = {{ object.camel }}
         fields = ('humanReadableName', 'validators', {% for prop in object.props %}'{{ prop }}',{% endfor %}{% for ref in object.refs %}{%if ref.multi %}'{{ ref.plural }}'{% else %}'{{ ref }}'{% endif %},{% endfor %})
@@ -182,7 +188,7 @@ class {{ object.camel }}List(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return {{ object.camel }}.select_by_user(self.request.user)
+        return self.optimize_queryset({{ object.camel }}.select_by_user(self.request.user))
 
 
 class {{ object.camel }}Detail(XOSRetrieveUpdateDestroyAPIView):
@@ -202,7 +208,7 @@ class {{ object.camel }}Detail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return {{ object.camel }}.select_by_user(self.request.user)
+        return self.optimize_queryset({{ object.camel }}.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -7,7 +7,17 @@ def get_request():
         raise Exception("Please add 'core.middleware.GlobalRequestMiddleware' to <XOS_DIR>/xos.settings.py:MIDDLEWARE_CLASSES")
     return _active.request
 
+def get_current_request():
+    """ The request being handled by this thread, or None outside of one """
+    return getattr(_active, "request", None)
+
 class GlobalRequestMiddleware(object):
     def process_view(self, request, view_func, view_args, view_kwargs):
         _active.request = request
         return None
+
+    def process_response(self, request, response):
+        # so that nothing kept on the request outlives it
+        if hasattr(_active, "request"):
+            del _active.request
+        return response
@@ -0,0 +1,63 @@
+from django.db import models, migrations
+
+"""
+    Operations shared by the migrations of core and of the apps whose models
+    inherit from PlCoreBase, which all add the same fields to each of their
+    models. The models must exist in the app's migration state already.
+"""
+
+def pending_operations(app_label, model_names):
+    operations = []
+    for name in model_names:
+        table = "%s_%s" % (app_label, name.lower())
+        operations.extend([
+            migrations.AddField(
+                model_name=name.lower(),
+                name='pending_sync',
+                field=models.BooleanField(default=True),
+                preserve_default=True,
+            ),
+            migrations.AddField(
+                model_name=name.lower(),
+                name='pending_policy',
+                field=models.BooleanField(default=True),
+                preserve_default=True,
+            ),
+            # carry over the old enacted/policed < updated state, and index
+            # only the (few) pending rows
+            migrations.RunSQL(
+                "UPDATE %(t)s SET pending_sync = (enacted IS NULL OR enacted < updated), "
+                "pending_policy = (policed IS NULL OR policed < updated); "
+                "CREATE INDEX %(t)s_pending_sync ON %(t)s (id) WHERE pending_sync; "
+                "CREATE INDEX %(t)s_pending_policy ON %(t)s (id) WHERE pending_policy;" % {"t": table},
+                "DROP INDEX %(t)s_pending_sync; "
+                "DROP INDEX %(t)s_pending_policy;" % {"t": table},
+            ),
+        ])
+    return operations
+
+def retry_operations(app_label, model_names):
+    operations = []
+    for name in model_names:
+        table = "%s_%s" % (app_label, name.lower())
+        operations.extend([
+            migrations.AddField(
+                model_name=name.lower(),
+                name='next_run',
+                field=models.DateTimeField(default=None, null=True, blank=True),
+                preserve_default=True,
+            ),
+            migrations.AddField(
+                model_name=name.lower(),
+                name='attempts',
+                field=models.IntegerField(default=0),
+                preserve_default=True,
+            ),
+            # only pending objects that are waiting for a retry are indexed
+            migrations.RunSQL(
+                "CREATE INDEX %(t)s_next_run ON %(t)s (next_run) WHERE pending_sync AND next_run IS NOT NULL;" % {"t": table},
+                "DROP INDEX %(t)s_next_run;" % {"t": table},
+            ),
+        ])
+    return operations
+
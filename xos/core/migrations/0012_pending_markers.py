@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+from core.migration_operations import pending_operations
+
+# Models in this app that inherit the pending_sync / pending_policy flags.
+# FlavorParameter and FlavorParameterType are left out: no migration
+# creates them yet.
+PENDING_MODELS = [
+    'Account',
+    'Charge',
+    'Controller',
+    'ControllerCredential',
+    'ControllerDashboardView',
+    'ControllerImages',
+    'ControllerNetwork',
+    'ControllerRole',
+    'ControllerSite',
+    'ControllerSitePrivilege',
+    'ControllerSlice',
+    'ControllerSlicePrivilege',
+    'ControllerUser',
+    'DashboardView',
+    'Deployment',
+    'DeploymentPrivilege',
+    'DeploymentRole',
+    'Flavor',
+    'Image',
+    'ImageDeployments',
+    'Invoice',
+    'Network',
+    'NetworkParameter',
+    'NetworkParameterType',
+    'NetworkSlice',
+    'NetworkSliver',
+    'NetworkTemplate',
+    'Node',
+    'Payment',
+    'Project',
+    'Reservation',
+    'ReservedResource',
+    'Role',
+    'Router',
+    'Service',
+    'ServiceAttribute',
+    'ServiceClass',
+    'ServiceResource',
+    'Site',
+    'SiteCredential',
+    'SiteDeployment',
+    'SitePrivilege',
+    'SiteRole',
+    'Slice',
+    'SliceCredential',
+    'SlicePrivilege',
+    'SliceRole',
+    'SliceTag',
+    'Sliver',
+    'Tag',
+    'UsableObject',
+    'User',
+    'UserCredential',
+    'UserDashboardView',
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_sliver_instance_uuid'),
+    ]
+
+    operations = pending_operations('core', PENDING_MODELS)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_retry_schedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ObserverState',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('observer', models.CharField(help_text=b'observer_name of the observer process', max_length=64, blank=True)),
+                ('step', models.CharField(help_text=b'Name of the sync step, empty for the pass as a whole', max_length=128, blank=True)),
+                ('last_run', models.FloatField(default=0)),
+                ('last_deletion_run', models.FloatField(default=0)),
+                ('last_duration', models.FloatField(default=0)),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='observerstate',
+            unique_together=set([('observer', 'step')]),
+        ),
+    ]
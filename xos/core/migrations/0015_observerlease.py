@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_observerstate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ObserverLease',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('resource', models.CharField(unique=True, max_length=128)),
+                ('holder', models.CharField(max_length=128)),
+                ('expires', models.FloatField(default=0)),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+    ]
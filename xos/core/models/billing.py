@@ -43,6 +43,8 @@ class Invoice(PlCoreBase):
     def amount(self):
         return str(self.charges.all().aggregate(Sum('amount'))["amount__sum"])
 
+    unicode_related = ('account__site',)
+
     def __unicode__(self):  return u'%s-%s' % (self.account.site.name, str(self.date))
 
 class UsableObject(PlCoreBase):
@@ -55,6 +57,8 @@ class Payment(PlCoreBase):
     amount = models.FloatField(default=0.0)
     date = models.DateTimeField(default=timezone.now)
 
+    unicode_related = ('account__site',)
+
     def __unicode__(self): return u'%s-%0.2f-%s' % (self.account.site.name, self.amount, str(self.date))
 
 class Charge(PlCoreBase):
@@ -71,6 +75,8 @@ class Charge(PlCoreBase):
     coreHours = models.FloatField(default=0.0)
     invoice = models.ForeignKey(Invoice, blank=True, null=True, related_name="charges")
 
+    unicode_related = ('account__site',)
+
     def __unicode__(self):  return u'%s-%0.2f-%s' % (self.account.site.name, self.amount, str(self.date))
 
 
@@ -42,6 +42,9 @@ class ControllerSitePrivilege(PlCoreBase):
 
     composite_primary_key = ('controller', 'site_privilege', 'role_id')
 
+    # what __unicode__ reads, to list them without a query per row
+    unicode_related = ('site_privilege__site', 'site_privilege__user', 'site_privilege__role')
+
     def __unicode__(self):  return u'%s %s' % (self.controller, self.site_privilege)
 
     def can_update(self, user):
@@ -60,8 +63,7 @@ class ControllerSitePrivilege(PlCoreBase):
         if user.is_admin:
             qs = ControllerSitePrivilege.objects.all()
         else:
-            cpriv_ids = [cp.id for cp in ControllerSitePrivilege.objects.filter(site_privilege__user=user)]
-            qs = ControllerSitePrivilege.objects.filter(id__in=cpriv_ids)
+            qs = ControllerSitePrivilege.objects.filter(site_privilege__user=user)
         return qs
 
 
@@ -75,6 +77,9 @@ class ControllerSlicePrivilege(PlCoreBase):
 
     composite_primary_key = ('controller', 'slice_privilege')
 
+    # what __unicode__ reads, to list them without a query per row
+    unicode_related = ('slice_privilege__slice', 'slice_privilege__user', 'slice_privilege__role')
+
     def __unicode__(self):  return u'%s %s' % (self.controller, self.slice_privilege)
 
     def can_update(self, user):
@@ -93,7 +98,6 @@ class ControllerSlicePrivilege(PlCoreBase):
         if user.is_admin:
             qs = ControllerSlicePrivilege.objects.all()
         else:
-            cpriv_ids = [cp.id for cp in ControllerSlicePrivilege.objects.filter(slice_privilege__user=user)]
-            qs = ControllerSlicePrivilege.objects.filter(id__in=cpriv_ids)
+            qs = ControllerSlicePrivilege.objects.filter(slice_privilege__user=user)
         return qs
 
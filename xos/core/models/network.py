@@ -199,8 +199,7 @@ class NetworkSlice(PlCoreBase):
         if user.is_admin:
             qs = NetworkSlice.objects.all()
         else:
-            slice_ids = [s.id for s in Slice.select_by_user(user)]
-            qs = NetworkSlice.objects.filter(id__in=slice_ids)
+            qs = NetworkSlice.objects.filter(slice__in=Slice.select_by_user(user))
         return qs
 
 class NetworkSliver(PlCoreBase):
@@ -236,8 +235,7 @@ class NetworkSliver(PlCoreBase):
         if user.is_admin:
             qs = NetworkSliver.objects.all()
         else:
-            sliver_ids = [s.id for s in NetworkSliver.select_by_user(user)]
-            qs = NetworkSliver.objects.filter(id__in=sliver_ids)
+            qs = NetworkSliver.objects.filter(sliver__in=Sliver.select_by_user(user))
         return qs
 
 class Router(PlCoreBase):
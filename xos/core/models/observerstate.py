@@ -0,0 +1,39 @@
+from django.db import models
+
+# step of the row that describes a whole observer pass
+PASS_STEP = ''
+
+class ObserverState(models.Model):
+    """ What an observer process remembers across passes and restarts:
+        for each of its steps, when it last ran, and in the PASS_STEP row
+        when its last pass ended and how long it took. Times are unix
+        timestamps, as the event loop keeps them.
+
+        This is bookkeeping of the observer itself, so it is a plain model:
+        saving it must not make anything pending for the observer.
+    """
+    observer = models.CharField(max_length=64, blank=True, help_text="observer_name of the observer process")
+    step = models.CharField(max_length=128, blank=True, help_text="Name of the sync step, empty for the pass as a whole")
+    last_run = models.FloatField(default=0)
+    last_deletion_run = models.FloatField(default=0)
+    last_duration = models.FloatField(default=0)
+
+    class Meta:
+        app_label = "core"
+        unique_together = (('observer', 'step'),)
+
+    def __unicode__(self):
+        return u'%s:%s' % (self.observer, self.step)
+
+class ObserverLease(models.Model):
+    """ A resource (e.g. one controller) that one process of a sharded
+        observer holds, until expires (a unix timestamp) unless renewed. """
+    resource = models.CharField(max_length=128, unique=True)
+    holder = models.CharField(max_length=128)
+    expires = models.FloatField(default=0)
+
+    class Meta:
+        app_label = "core"
+
+    def __unicode__(self):
+        return u'%s: %s' % (self.resource, self.holder)
@@ -60,20 +60,57 @@ class PlCoreBaseManager(models.Manager):
     def get_query_set(self):
         return self.get_queryset()
 
+tracked_fields_cache = {}
+
+def tracked_fields(model):
+    """ (name, attname) of the fields of model whose changes are tracked:
+        the editable ones, as in model_to_dict() """
+    if model not in tracked_fields_cache:
+        tracked_fields_cache[model] = [(field.name, field.attname) for field in model._meta.fields if getattr(field, "editable", False)]
+    return tracked_fields_cache[model]
+
+tracked_attnames_cache = {}
+
+def tracked_attnames(model):
+    """ {name: attname} of the tracked fields of model """
+    if model not in tracked_attnames_cache:
+        tracked_attnames_cache[model] = dict(tracked_fields(model))
+    return tracked_attnames_cache[model]
+
 class PlModelMixIn(object):
     # Provides useful methods for computing which objects in a model have
-    # changed. Make sure to do self._initial = self._dict in the __init__
-    # method.
+    # changed. Make sure to call self.record_initial() in the __init__
+    # method, and again after saving.
 
     # Also includes useful utility, like getValidators
 
     # This is broken out of PlCoreBase into a Mixin so the User model can
     # also make use of it.
 
+    def record_initial(self):
+        # Every row Django loads goes through here, and few are asked what
+        # changed, so only the attributes are copied now; _initial is made
+        # from them the first time it is needed. Deferred fields that were
+        # not loaded yet are not tracked.
+        self._initial_attrs = None
+        self._initial_dict = None
+        self._initial_attrs = self.__dict__.copy()
+
+    @property
+    def _initial(self):
+        if self._initial_dict is None:
+            attrs = self._initial_attrs
+            self._initial_dict = dict([(name, attrs[attname]) for (name, attname) in tracked_fields(self.__class__) if attname in attrs])
+        return self._initial_dict
+
+    @_initial.setter
+    def _initial(self, value):
+        self._initial_attrs = {}
+        self._initial_dict = value
+
     @property
     def _dict(self):
-        return model_to_dict(self, fields=[field.name for field in
-                             self._meta.fields])
+        return dict([(name, getattr(self, attname)) for (name, attname) in tracked_fields(self.__class__)])
 
     def fields_differ(self,f1,f2):
         if isinstance(f1,datetime.datetime) and isinstance(f2,datetime.datetime) and (timezone.is_aware(f1) != timezone.is_aware(f2)):
@@ -81,11 +118,20 @@ class PlModelMixIn(object):
         else:
             return (f1 != f2)
 
+    def current_value(self, name):
+        return getattr(self, tracked_attnames(self.__class__)[name])
+
     @property
     def diff(self):
         d1 = self._initial
-        d2 = self._dict
-        diffs = [(k, (v, d2[k])) for k, v in d1.items() if self.fields_differ(v,d2[k])]
+        d2 = self.__dict__
+        diffs = []
+        for (name, attname) in tracked_fields(self.__class__):
+            if (name in d1):
+                # only fields that were loaded, without loading the others
+                current = d2.get(attname, d1[name])
+                if self.fields_differ(d1[name], current):
+                    diffs.append((name, (d1[name], current)))
         return dict(diffs)
 
     @property
@@ -97,10 +143,15 @@ class PlModelMixIn(object):
         return self.diff.keys()
 
     def has_field_changed(self, field_name):
-        return field_name in self.diff.keys()
+        initial = self._initial
+        if field_name not in initial:
+            return False
+        return self.fields_differ(initial[field_name], self.current_value(field_name))
 
     def get_field_diff(self, field_name):
-        return self.diff.get(field_name, None)
+        if not self.has_field_changed(field_name):
+            return None
+        return (self._initial[field_name], self.current_value(field_name))
 
     #classmethod
     def getValidators(cls):
@@ -118,6 +169,26 @@ class PlModelMixIn(object):
             validators[field.name] = l
         return validators
 
+    def mark_pending(self, kwargs):
+        # Anything that bumps 'updated' makes the object pending for both the
+        # observer and the model policy engine. These flags are what
+        # fetch_pending and run_policy query, through partial indexes.
+        update_fields = kwargs.get("update_fields")
+        if (update_fields is not None) and ("updated" not in update_fields):
+            return
+        self.pending_sync = True
+        self.pending_policy = True
+        if (update_fields is not None):
+            kwargs["update_fields"] = list(update_fields) + ["pending_sync", "pending_policy"]
+
+    def notify_observer_of_save(self, update_fields=None):
+        # Saves restricted to bookkeeping fields (enacted, policed,
+        # backend_status, ...) leave 'updated' alone and so do not make the
+        # object pending; the observer doesn't need to hear about those.
+        if (update_fields is not None) and ("updated" not in update_fields) and ("deleted" not in update_fields):
+            return
+        notify_observer(model=self)
+
     def get_backend_icon(self):
         is_good = (self.backend_status is not None) and (self.backend_status.startswith("0 -") or self.backend_status.startswith("1 -"))
         is_provisioning = self.backend_status is None or self.backend_status == "Provisioning in progress" or self.backend_status==""
@@ -142,6 +213,17 @@ class PlCoreBase(models.Model, PlModelMixIn):
     enacted = models.DateTimeField(null=True, blank=True, default=None)
     policed = models.DateTimeField(null=True, blank=True, default=None)
 
+    # Set by save() whenever 'updated' changes, cleared once the observer has
+    # enacted the object / the model policy has run. Equivalent to
+    # enacted < updated and policed < updated, but indexable.
+    pending_sync = models.BooleanField(default=True)
+    pending_policy = models.BooleanField(default=True)
+
+    # Retry schedule kept by the observer: attempts counts the syncs that
+    # failed in a row, and the object isn't fetched again before next_run.
+    next_run = models.DateTimeField(null=True, blank=True, default=None)
+    attempts = models.IntegerField(default=0)
+
     # This is a scratchpad used by the Observer
     backend_register = models.CharField(max_length=140,
                                       default="{}", null=True)
@@ -163,7 +245,7 @@ class PlCoreBase(models.Model, PlModelMixIn):
 
     def __init__(self, *args, **kwargs):
         super(PlCoreBase, self).__init__(*args, **kwargs)
-        self._initial = self._dict # for PlModelMixIn
+        self.record_initial() # for PlModelMixIn
         self.silent = False
 
     def can_update(self, user):
@@ -221,13 +303,15 @@ class PlCoreBase(models.Model, PlModelMixIn):
 
         self.check_composite_primary_key()
 
+        self.mark_pending(kwargs)
+
         super(PlCoreBase, self).save(*args, **kwargs)
 
         # This is a no-op if observer_disabled is set
-        # if not silent:
-        #    notify_observer()
+        if not silent:
+            self.notify_observer_of_save(kwargs.get("update_fields"))
 
-        self._initial = self._dict
+        self.record_initial()
 
     def save_by_user(self, user, *args, **kwds):
         if not self.can_update(user):
@@ -27,8 +27,7 @@ class Reservation(PlCoreBase):
         if user.is_admin:
             qs = Reservation.objects.all()
         else:
-            slice_ids = [s.id for s in Slice.select_by_user(user)]
-            qs = Reservation.objects.filter(id__in=slice_ids)
+            qs = Reservation.objects.filter(slice__in=Slice.select_by_user(user))
         return qs
 
 class ReservedResource(PlCoreBase):
@@ -50,8 +49,7 @@ class ReservedResource(PlCoreBase):
         if user.is_admin:
             qs = ReservedResource.objects.all()
         else:
-            sliver_ids = [s.id for s in Sliver.select_by_user(user)]
-            qs = ReservedResource.objects.filter(id__in=sliver_ids)
+            qs = ReservedResource.objects.filter(sliver__in=Sliver.select_by_user(user))
         return qs
 
 
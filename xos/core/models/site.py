@@ -8,6 +8,7 @@ from core.models import PlCoreBase,PlCoreBaseManager,PlCoreBaseDeletionManager
 from core.models import Tag
 from core.models.plcorebase import StrippedCharField
 from core.acl import AccessControlList
+from core.visibility import get_visibility, watch_privileges
 from xos.config import Config
 
 config = Config()
@@ -146,10 +147,11 @@ class SitePrivilege(PlCoreBase):
         if user.is_admin:
             qs = SitePrivilege.objects.all()
         else:
-            sp_ids = [sp.id for sp in SitePrivilege.objects.filter(user=user)]
-            qs = SitePrivilege.objects.filter(id__in=sp_ids)
+            qs = SitePrivilege.objects.filter(user=user)
         return qs
 
+watch_privileges(SitePrivilege)
+
 class Deployment(PlCoreBase):
     #objects = Controllermanager()
     #deleted_objects = DeploymentDeletionManager()
@@ -231,10 +233,11 @@ class DeploymentPrivilege(PlCoreBase):
         if user.is_admin:
             qs = DeploymentPrivilege.objects.all()
         else:
-            dpriv_ids = [dp.id for dp in DeploymentPrivilege.objects.filter(user=user)]
-            qs = DeploymentPrivilege.objects.filter(id__in=dpriv_ids)
+            qs = DeploymentPrivilege.objects.filter(user=user)
         return qs
 
+watch_privileges(DeploymentPrivilege)
+
 class ControllerRole(PlCoreBase):
     #objects = ControllerLinkManager()
     #deleted_objects = ControllerLinkDeletionManager()
@@ -268,8 +271,8 @@ class Controller(PlCoreBase):
         if user.is_admin:
             qs = Controller.objects.all()
         else:
-            deployments = [dp.deployment for dp in DeploymentPrivilege.objects.filter(user=user, role__role__in=['Admin', 'admin'])]
-            qs = Controller.objects.filter(deployment__in=deployments)
+            deployment_ids = get_visibility(user).deployment_ids(['Admin', 'admin'])
+            qs = Controller.objects.filter(deployment_id__in=deployment_ids)
         return qs
 
 class SiteDeployment(PlCoreBase):
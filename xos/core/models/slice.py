@@ -15,6 +15,8 @@ from core.models import Controller
 from core.models import Flavor, Image
 from core.models.plcorebase import StrippedCharField
 from django.core.exceptions import PermissionDenied, ValidationError
+from django.db.models import Q
+from core.visibility import get_visibility, watch_privileges
 
 # Create your models here.
 
@@ -90,13 +92,9 @@ class Slice(PlCoreBase):
         if user.is_admin:
             qs = Slice.objects.all()
         else:
-            # users can see slices they belong to 
-            slice_ids = [sp.slice.id for sp in SlicePrivilege.objects.filter(user=user)]
-            # pis can see slices at their sites
-            sites = [sp.site for sp in SitePrivilege.objects.filter(user=user)\
-                        if sp.role.role == 'pi']
-            slice_ids.extend([s.id for s in Slice.objects.filter(site__in=sites)]) 
-            qs = Slice.objects.filter(id__in=slice_ids)
+            visibility = get_visibility(user)
+            # users can see slices they belong to, and pis the slices at their sites
+            qs = Slice.objects.filter(Q(id__in=visibility.slice_ids()) | Q(site_id__in=visibility.site_ids(['pi'])))
         return qs
 
     def delete(self, *args, **kwds):
@@ -133,7 +131,7 @@ class SlicePrivilege(PlCoreBase):
     def save(self, *args, **kwds):
         if not self.user.is_active:
             raise PermissionDenied, "Cannot modify role(s) of a disabled user"
-        super(SlicePrivilege, self).delete(*args, **kwds)    
+        super(SlicePrivilege, self).save(*args, **kwds)
 
     def can_update(self, user):
         return user.can_update_slice(self.slice)
@@ -143,10 +141,11 @@ class SlicePrivilege(PlCoreBase):
         if user.is_admin:
             qs = SlicePrivilege.objects.all()
         else:
-            sp_ids = [sp.id for sp in SlicePrivilege.objects.filter(user=user)]
-            qs = SlicePrivilege.objects.filter(id__in=sp_ids)
+            qs = SlicePrivilege.objects.filter(user=user)
         return qs
 
+watch_privileges(SlicePrivilege)
+
 class ControllerSlice(PlCoreBase):
     objects = ControllerLinkManager()
     deleted_objects = ControllerLinkDeletionManager()
@@ -15,6 +15,7 @@ from core.models.plcorebase import StrippedCharField
 from timezones.fields import TimeZoneField
 from operator import itemgetter, attrgetter
 from core.middleware import get_request
+from core.visibility import get_visibility
 import model_policy
 
 # ------ from plcorebase.py ------
@@ -120,6 +121,10 @@ class User(AbstractBaseUser, PlModelMixIn):
     updated = models.DateTimeField(auto_now=True)
     enacted = models.DateTimeField(null=True, default=None)
     policed = models.DateTimeField(null=True, default=None)
+    pending_sync = models.BooleanField(default=True)
+    pending_policy = models.BooleanField(default=True)
+    next_run = models.DateTimeField(null=True, blank=True, default=None)
+    attempts = models.IntegerField(default=0)
     backend_status = StrippedCharField(max_length=1024,
                                       default="Provisioning in progress")
     deleted = models.BooleanField(default=False)
@@ -140,7 +145,7 @@ class User(AbstractBaseUser, PlModelMixIn):
 
     def __init__(self, *args, **kwargs):
         super(User, self).__init__(*args, **kwargs)
-        self._initial = self._dict # for PlModelMixIn
+        self.record_initial() # for PlModelMixIn
 
     def isReadOnlyUser(self):
         return self.is_readonly
@@ -227,9 +232,12 @@ class User(AbstractBaseUser, PlModelMixIn):
             self.is_registering=False
 
         self.username = self.email
+        self.mark_pending(kwds)
         super(User, self).save(*args, **kwds)
 
-        self._initial = self._dict
+        self.notify_observer_of_save(kwds.get("update_fields"))
+
+        self.record_initial()
 
     def send_temporary_password(self):
         password = User.objects.make_random_password()
@@ -243,25 +251,23 @@ class User(AbstractBaseUser, PlModelMixIn):
         msg.send()
 
     def can_update(self, user):
-        from core.models import SitePrivilege
         _cant_update_fieldName = None
         if user.can_update_root():
             return True
 
         # site pis can update
-        site_privs = SitePrivilege.objects.filter(user=user, site=self.site)
-        for site_priv in site_privs:
-            if site_priv.role.role == 'admin':
-                return True 
-            if site_priv.role.role == 'pi':
-                for fieldName in self.diff.keys():
-                    if fieldName in self.PI_FORBIDDEN_FIELDS:
-                        _cant_update_fieldName = fieldName
-                        return False
-                return True
+        visibility = get_visibility(user)
+        if visibility.has_role("site", self.site_id, ['admin']):
+            return True
+        if visibility.has_role("site", self.site_id, ['pi']):
+            for fieldName in self.PI_FORBIDDEN_FIELDS:
+                if self.has_field_changed(fieldName):
+                    _cant_update_fieldName = fieldName
+                    return False
+            return True
         if (user.id == self.id):
-            for fieldName in self.diff.keys():
-                if fieldName in self.USER_FORBIDDEN_FIELDS:
+            for fieldName in self.USER_FORBIDDEN_FIELDS:
+                if self.has_field_changed(fieldName):
                     _cant_update_fieldName = fieldName
                     return False
             return True
@@ -279,54 +285,40 @@ class User(AbstractBaseUser, PlModelMixIn):
 
         return False 
 
+    # The privileges come from the user's Visibility, read once per request
+    # and indexed by site, slice and deployment, so that checking a page
+    # full of objects costs no more queries than checking one.
+
     def can_update_deployment(self, deployment):
-        from core.models.site import DeploymentPrivilege
         if self.can_update_root():
             return True    
-                          
-        if DeploymentPrivilege.objects.filter(
-            deployment=deployment,
-            user=self,
-            role__role__in=['admin', 'Admin']):
-            return True
-        return False    
+        return get_visibility(self).has_role("deployment", deployment.pk, ['admin', 'Admin'])
 
     def can_update_site(self, site, allow=[]):
-        from core.models.site import SitePrivilege
         if self.can_update_root():
             return True
-        if SitePrivilege.objects.filter(
-            site=site, user=self, role__role__in=['admin', 'Admin']+allow):
-            return True
-        return False
+        return get_visibility(self).has_role("site", site.pk, ['admin', 'Admin']+allow)
     
     def can_update_slice(self, slice):
-        from core.models.slice import SlicePrivilege
         if self.can_update_root():
             return True
-        if self == slice.creator:
+        if (self.id is not None) and (self.id == slice.creator_id):
             return True
-        if self.can_update_site(slice.site, allow=['pi']):
+        if get_visibility(self).has_role("site", slice.site_id, ['admin', 'Admin', 'pi']):
             return True
-                     
-        if SlicePrivilege.objects.filter(
-            slice=slice, user=self, role__role__in=['admin', 'Admin']):
-            return True
-        return False
+        return get_visibility(self).has_role("slice", slice.pk, ['admin', 'Admin'])
 
     @staticmethod
     def select_by_user(user):
         if user.is_admin:
             qs = User.objects.all()
         else:
-            # can see all users at any site where this user has pi role
+            # can see all users at any site where this user has pi role,
+            # and the users with privileges at these sites
             from core.models.site import SitePrivilege
-            site_privs = SitePrivilege.objects.filter(user=user)
-            sites = [sp.site for sp in site_privs if sp.role.role in ['Admin', 'admin', 'pi']]
-            # get site privs of users at these sites
-            site_privs = SitePrivilege.objects.filter(site__in=sites)
-            user_ids = [sp.user.id for sp in site_privs] + [user.id]
-            qs = User.objects.filter(Q(site__in=sites) | Q(id__in=user_ids))
+            site_ids = get_visibility(user).site_ids(['Admin', 'admin', 'pi'])
+            site_user_ids = SitePrivilege.objects.filter(site_id__in=site_ids).values('user_id')
+            qs = User.objects.filter(Q(site_id__in=site_ids) | Q(id__in=site_user_ids) | Q(id=user.id))
         return qs
 
     def save_by_user(self, user, *args, **kwds):
@@ -1,10 +1,16 @@
 #!/usr/bin/env python
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.test.client import RequestFactory
+from core import middleware
+from core.visibility import privileges_changed
 from core.models import *
 from rest_framework.test import *
 from genapi import *
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+from django.utils import timezone
 
 FIXTURES_FILE = 'core/fixtures/initial_data.json'
 MODELS = ['Deployment','Image','Node','Reservation','Slice','Sliver','User']
@@ -126,3 +132,224 @@ class APITestCase(TestCase):
 			first = self.data_dict[m.lower()][0]
 			self.create(m, m.lower()+'s',first)
 
+class APIListTestCase(TestCase):
+	""" Listing objects should take as many queries for a few rows as for
+	    many, whatever relations the serializer follows for each row, and
+	    pages, field selection and streaming should give the same rows. """
+
+	def setUp(self):
+		self.home = Site(name='Home', login_base='home', abbreviated_name='home')
+		self.home.save()
+		self.calling_user = User(email='querycount@example.com', firstname='Query', lastname='Count', site=self.home, is_admin=True)
+		self.calling_user.save()
+		self.role = SiteRole(role='pi')
+		self.role.save()
+		self.deployments = []
+		for name in ['east', 'west']:
+			deployment = Deployment(name=name)
+			deployment.save()
+			self.deployments.append(deployment)
+		self.site_count = 0
+
+		self.client = APIClient()
+		self.client.force_authenticate(user=self.calling_user)
+
+	def add_sites(self, count):
+		for i in range(count):
+			self.site_count += 1
+			login_base = 'site%d' % self.site_count
+			site = Site(name=login_base, login_base=login_base, abbreviated_name=login_base)
+			site.save()
+			for deployment in self.deployments:
+				SiteDeployment(site=site, deployment=deployment).save()
+			SitePrivilege(user=self.calling_user, site=site, role=self.role).save()
+
+	def list_queries(self, url):
+		with CaptureQueriesContext(connection) as queries:
+			response = self.client.get(url)
+		self.assertEqual(response.status_code, 200)
+		return (len(response.data), len(queries))
+
+	def check_constant_queries(self, url):
+		self.add_sites(2)
+		(few_rows, few_queries) = self.list_queries(url)
+		self.add_sites(10)
+		(many_rows, many_queries) = self.list_queries(url)
+		self.assertEqual(many_rows, few_rows + 10)
+		self.assertEqual(many_queries, few_queries)
+
+	def test_many_to_many(self):
+		# Site.deployments
+		self.check_constant_queries('/xos/sites/')
+
+	def test_foreign_keys(self):
+		# SitePrivilege.user, .site and .role, which its name is made of too
+		self.check_constant_queries('/xos/siteprivileges/')
+
+	def test_pages(self):
+		self.add_sites(7)
+		seen = []
+		url = '/xos/sites/?limit=3'
+		while url:
+			response = self.client.get(url)
+			self.assertEqual(response.status_code, 200)
+			self.assertTrue(len(response.data) <= 3)
+			seen.extend([site['id'] for site in response.data])
+			link = response.get('Link', None)
+			url = link[1:link.index('>')] if link else None
+		self.assertEqual(seen, sorted(Site.objects.values_list('id', flat=True)))
+
+	def test_fields(self):
+		self.add_sites(2)
+		response = self.client.get('/xos/sites/?fields=id,name')
+		self.assertEqual(response.status_code, 200)
+		for site in response.data:
+			self.assertEqual(sorted(site.keys()), ['id', 'name'])
+		response = self.client.get('/xos/sites/?fields=id,nosuchfield')
+		self.assertEqual(response.status_code, 400)
+
+	def test_stream(self):
+		self.add_sites(3)
+		response = self.client.get('/xos/sites/?stream=1&fields=id')
+		self.assertEqual(response.status_code, 200)
+		rows = json.loads(''.join(response.streaming_content))
+		self.assertEqual([row['id'] for row in rows], sorted(Site.objects.values_list('id', flat=True)))
+
+class VisibilityTestCase(TestCase):
+	""" select_by_user() reads the privileges of a user once per request,
+	    and again once they change. """
+
+	def setUp(self):
+		self.site = Site(name='Visibility', login_base='vis', abbreviated_name='vis')
+		self.site.save()
+		self.admin = User(email='admin@vis.example.com', firstname='Vis', lastname='Admin', site=self.site, is_admin=True)
+		self.admin.save()
+		self.user = User(email='member@vis.example.com', firstname='Vis', lastname='Member', site=self.site)
+		self.user.save()
+		self.role = SliceRole(role='default')
+		self.role.save()
+		self.slices = []
+		for name in ['vis_one', 'vis_two']:
+			slice = Slice(name=name, site=self.site, creator=self.admin)
+			slice.caller = self.admin
+			slice.save()
+			self.slices.append(slice)
+		middleware._active.request = RequestFactory().get('/')
+
+	def tearDown(self):
+		del middleware._active.request
+
+	def test_once_per_request(self):
+		SlicePrivilege(user=self.user, slice=self.slices[0], role=self.role).save()
+		self.assertEqual(list(Slice.select_by_user(self.user)), [self.slices[0]])
+		# only the slices themselves, the privileges are known by now
+		with self.assertNumQueries(1):
+			list(Slice.select_by_user(self.user))
+		with self.assertNumQueries(1):
+			list(Sliver.select_by_user(self.user))
+
+	def test_privileges_changed(self):
+		self.assertEqual(list(Slice.select_by_user(self.user)), [])
+		privilege = SlicePrivilege(user=self.user, slice=self.slices[1], role=self.role)
+		privilege.save()
+		self.assertEqual(list(Slice.select_by_user(self.user)), [self.slices[1]])
+		privilege.delete()
+		self.assertEqual(list(Slice.select_by_user(self.user)), [])
+
+	def test_queryset_delete(self):
+		SlicePrivilege(user=self.user, slice=self.slices[0], role=self.role).save()
+		self.assertEqual(list(Slice.select_by_user(self.user)), [self.slices[0]])
+		# no SlicePrivilege.delete() involved, only its post_delete signal
+		SlicePrivilege.objects.filter(user=self.user).delete()
+		self.assertEqual(list(Slice.select_by_user(self.user)), [])
+
+class PermissionTestCase(TestCase):
+	""" can_update_slice() reads the privileges of a user once per request,
+	    however many they are and however many slices it is asked about. """
+
+	PRIVILEGES = 1000
+
+	def setUp(self):
+		self.site = Site(name='Permissions', login_base='perm', abbreviated_name='perm')
+		self.site.save()
+		self.admin = User(email='admin@perm.example.com', firstname='Perm', lastname='Admin', site=self.site, is_admin=True)
+		self.admin.save()
+		self.user = User(email='member@perm.example.com', firstname='Perm', lastname='Member', site=self.site)
+		self.user.save()
+		self.role = SliceRole(role='admin')
+		self.role.save()
+
+		Slice.objects.bulk_create([Slice(name='perm_%d' % i, site=self.site, creator=self.admin) for i in range(self.PRIVILEGES + 1)])
+		self.slices = list(Slice.objects.filter(site=self.site).order_by('id'))
+		self.other_slice = self.slices.pop()
+		SlicePrivilege.objects.bulk_create([SlicePrivilege(user=self.user, slice=slice, role=self.role) for slice in self.slices])
+		# bulk_create() sends no post_save signal
+		privileges_changed()
+
+		middleware._active.request = RequestFactory().get('/')
+
+	def tearDown(self):
+		del middleware._active.request
+
+	def test_constant_queries(self):
+		# the user's site roles, then slice roles, once each
+		with self.assertNumQueries(2):
+			for slice in self.slices:
+				self.assertTrue(self.user.can_update_slice(slice))
+			self.assertFalse(self.user.can_update_slice(self.other_slice))
+		with self.assertNumQueries(0):
+			self.assertFalse(self.user.can_update_site(self.site))
+			self.assertTrue(self.user.can_update_slice(self.slices[0]))
+
+class DependencyTestCase(TestCase):
+	""" A sync step holds back the objects whose dependencies failed,
+	    with dependencies named as the event loop reads them from the
+	    model dependency graph. """
+
+	def test_blocked_objects(self):
+		from observer.syncstep import SyncStep
+		from observer.step_graph import read_model_deps
+
+		step = SyncStep()
+		# as XOSObserver.sync() fills them in
+		step.dependencies = [b for (a, b) in read_model_deps('model-deps')['Slice']]
+
+		site = Site(id=10, name='failed', login_base='failed')
+		user = User(id=21, email='failed@example.com')
+		slices = [Slice(id=1, name='s1', site_id=10, creator_id=20),
+		          Slice(id=2, name='s2', site_id=11, creator_id=21),
+		          Slice(id=3, name='s3', site_id=11, creator_id=20)]
+
+		blocked = step.blocked_objects(slices, [site, user])
+		self.assertEqual(blocked, {1: site, 2: user})
+
+class RetryQueueTestCase(TestCase):
+	""" The retry queue lists the objects retried soonest, those retried
+	    on the next pass first, however many more there are than limit. """
+
+	def setUp(self):
+		self.admin = User(email='admin@retry.example.com', firstname='Retry', lastname='Admin', is_admin=True)
+		self.admin.save()
+		later = timezone.now() + timedelta(hours=1)
+		Site.objects.bulk_create([Site(name='retry_%d' % i, login_base='retry%d' % i, abbreviated_name='retry%d' % i,
+		                               pending_sync=True, attempts=1, next_run=later + timedelta(minutes=i))
+		                          for i in range(5)])
+		# created last, so the highest id
+		Site.objects.bulk_create([Site(name='retry_now', login_base='retrynow', abbreviated_name='retrynow',
+		                               pending_sync=True, attempts=1, next_run=None)])
+
+	def get(self, **params):
+		from core.views.observer import RetryQueue
+		request = RequestFactory().get('/observer/retries', params)
+		request.user = self.admin
+		return RetryQueue(request)
+
+	def test_next_pass_first(self):
+		response = self.get(model='Site', limit=2)
+		self.assertEqual(response.status_code, 200)
+		names = [Site.objects.get(id=e['id']).name for e in json.loads(response.content)]
+		self.assertEqual(names, ['retry_now', 'retry_0'])
+
+	def test_bad_limit(self):
+		self.assertEqual(self.get(limit='ten').status_code, 400)
+		self.assertEqual(self.get(limit=-1).status_code, 400)
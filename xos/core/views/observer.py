@@ -1,23 +1,100 @@
-from django.http import HttpResponse
+from __future__ import absolute_import
+import re
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseBadRequest
+from django.apps import apps
 from monitor import driver
 from core.models import *
+from core.models.observerstate import PASS_STEP
+from observer.metrics import fetch_status, metrics_port
+from xos.config import Config
 import json
 import os
 import time
 
-def Observer(request):
-    if not os.path.exists('/tmp/observer_last_run'):
-        return HttpResponse(json.dumps({"health": ":-X", "time": time.time(), "comp": 0}))
+def pass_health(state, t):
+    comp = state.last_run + state.last_duration*2 + 300
+    return (':-)' if comp>t else ':-X', comp)
 
+def Observer(request):
+    # ?observer=<observer_name> picks one of several observer processes
+    name = request.GET.get('observer', '')
     t = time.time()
-    status_str = open('/tmp/observer_last_run','r').read()
-    d = json.loads(status_str)
-    comp = d['last_run'] + d['last_duration']*2 + 300
-    if comp>t:
-        d['health'] = ':-)'
-    else:
-        d['health'] = ':-X'
+
+    passes = dict([(s.observer, s) for s in ObserverState.objects.filter(step=PASS_STEP)])
+    if name not in passes:
+        return HttpResponse(json.dumps({"health": ":-X", "time": t, "comp": 0}))
+
+    state = passes[name]
+    d = {'last_run': state.last_run, 'last_duration': state.last_duration}
+    (d['health'], comp) = pass_health(state, t)
     d['time'] = t
     d['comp'] = comp
 
+    d['observers'] = {}
+    for (observer, s) in passes.items():
+        d['observers'][observer] = {'last_run': s.last_run, 'last_duration': s.last_duration,
+                                    'health': pass_health(s, t)[0]}
+
+    d['run_times'] = {}
+    for s in ObserverState.objects.filter(observer=name).exclude(step=PASS_STEP):
+        d['run_times'][s.step] = {'last_run': s.last_run, 'last_deletion_run': s.last_deletion_run}
+
+    # per-step and per-pass figures, from the observer process itself
+    m = re.match(r'^.*shard(\d+)-$', name)
+    status = fetch_status(metrics_port(int(m.group(1)) if m else 0))
+    if status is not None:
+        d['passes'] = status['passes']
+        d['steps'] = status['steps']
+        d['ansible'] = status['ansible']
+        d['critical_path'] = status.get('critical_path')
+
+    # per-model backlog of the model policy engine, which runs in the
+    # coordinator of a sharded observer
+    shards = int(getattr(Config(), "observer_shards", 1))
+    if (shards > 1):
+        status = fetch_status(metrics_port(shards))
+    if (status is not None) and ('model_policy' in status):
+        d['model_policy'] = status['model_policy']
+
     return HttpResponse(json.dumps(d))
+
+def RetryQueue(request):
+    """ Objects the observer failed to sync and will retry, soonest first.
+        ?model=<name> restricts the list to one model, ?limit=<n> caps it
+        (100 by default). """
+    if (not request.user.is_authenticated()) or (not request.user.is_admin):
+        return HttpResponseForbidden()
+
+    model_name = request.GET.get('model')
+    limit = request.GET.get('limit', '100')
+    try:
+        limit = int(limit)
+    except ValueError:
+        limit = -1
+    if (limit < 0):
+        # the same error the REST API gives for a bad limit
+        return HttpResponseBadRequest(json.dumps({"error": "XOSProgrammingError",
+                                                  "specific_error": "limit must be a non-negative integer",
+                                                  "fields": {"limit": request.GET.get('limit')}}),
+                                      content_type='application/json')
+
+    entries = []
+    for model in apps.get_models():
+        if (model_name) and (model.__name__ != model_name):
+            continue
+        if ('next_run' not in model._meta.get_all_field_names()):
+            continue
+        # no next_run means on the next pass, the soonest there is; NULLs
+        # would sort last in Postgres, and be the ones cut off by limit
+        retries = model._base_manager.filter(pending_sync=True, attempts__gt=0)
+        retries = retries.extra(select={'next_run_null': 'next_run IS NULL'}, order_by=['-next_run_null', 'next_run'])
+        for (pk, attempts, next_run, backend_status) in retries.values_list('id', 'attempts', 'next_run', 'backend_status')[:limit]:
+            entries.append({'model': model.__name__,
+                            'id': pk,
+                            'attempts': attempts,
+                            # None means on the next pass
+                            'next_run': next_run.isoformat() if next_run else None,
+                            'backend_status': backend_status})
+
+    entries.sort(key=lambda e: e['next_run'] or '')
+    return HttpResponse(json.dumps(entries[:limit]), content_type='application/json')
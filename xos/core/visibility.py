@@ -0,0 +1,134 @@
+import threading
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from core.middleware import get_current_request
+
+"""
+    What a user's privileges let them see and change, for select_by_user()
+    and the can_update_*() checks.
+
+    A Visibility holds the roles a user has at each site, slice and
+    deployment, read from the privilege tables with one query each the first
+    time they are needed, instead of once per call and one more per
+    privilege row for its role. Indexed by id, they answer has_role() in
+    constant time. It is kept on the request, so a REST call or admin page
+    reads them once however many objects it lists or checks, and optionally
+    in the Django cache for VISIBILITY_CACHE_TTL seconds, shared by the
+    requests of the same user.
+
+    Saving or deleting a SitePrivilege, SlicePrivilege or DeploymentPrivilege,
+    including through queryset and cascading deletes, calls
+    privileges_changed(), which drops every Visibility of this process and of
+    the cache. Those go through their post_save and post_delete signals,
+    which bulk_create() and queryset update() don't send; call
+    privileges_changed() after using these. With a cache that is not shared
+    between processes, the other processes may go on using theirs for up to
+    VISIBILITY_CACHE_TTL.
+"""
+
+GENERATION_KEY = "xos-visibility-generation"
+
+generation_lock = threading.Lock()
+generation = 0
+
+def cache_ttl():
+    return getattr(settings, "VISIBILITY_CACHE_TTL", 0)
+
+def privileges_changed():
+    global generation
+    with generation_lock:
+        generation += 1
+    if cache_ttl():
+        try:
+            cache.incr(GENERATION_KEY)
+        except ValueError:
+            cache.set(GENERATION_KEY, 1, None)
+
+def privilege_saved_or_deleted(sender, **kwargs):
+    privileges_changed()
+
+def watch_privileges(model):
+    """ Call privileges_changed() whenever a row of model is saved or deleted """
+    uid = "xos-visibility-%s" % model.__name__
+    post_save.connect(privilege_saved_or_deleted, sender=model, dispatch_uid=uid)
+    post_delete.connect(privilege_saved_or_deleted, sender=model, dispatch_uid=uid)
+
+def roles_by_id(values):
+    """ {id: set of role names}, from (id, role name) pairs """
+    roles = {}
+    for (id, role) in values:
+        roles.setdefault(id, set()).add(role)
+    return roles
+
+class Visibility(object):
+    def __init__(self, user_id, cache_key=None):
+        self.user_id = user_id
+        self.cache_key = cache_key
+        self.generation = generation
+        self.roles = {}     # "site", "slice" or "deployment" -> roles_by_id()
+
+    def load_roles(self, kind):
+        from core.models import SitePrivilege, SlicePrivilege, DeploymentPrivilege
+        privileges = {"site": SitePrivilege, "slice": SlicePrivilege, "deployment": DeploymentPrivilege}[kind]
+        # the role names come along in the same query
+        return roles_by_id(privileges.objects.filter(user_id=self.user_id).values_list(kind + "_id", "role__role"))
+
+    def roles_of(self, kind):
+        if kind not in self.roles:
+            self.roles[kind] = self.load_roles(kind)
+            if self.cache_key:
+                cache.set(self.cache_key, self.roles, cache_ttl())
+        return self.roles[kind]
+
+    def ids_with_role(self, kind, roles=None):
+        """ The ids of the sites, slices or deployments (kind) where the user
+            has any of roles, or any role at all """
+        if roles is None:
+            return self.roles_of(kind).keys()
+        roles = set(roles)
+        return [id for (id, held) in self.roles_of(kind).items() if held & roles]
+
+    def has_role(self, kind, id, roles):
+        """ Whether the user has any of roles at the site, slice or
+            deployment (kind) id """
+        held = self.roles_of(kind).get(id, None)
+        if not held:
+            return False
+        for role in roles:
+            if role in held:
+                return True
+        return False
+
+    def site_ids(self, roles=None):
+        return self.ids_with_role("site", roles)
+
+    def slice_ids(self, roles=None):
+        return self.ids_with_role("slice", roles)
+
+    def deployment_ids(self, roles=None):
+        return self.ids_with_role("deployment", roles)
+
+def load_visibility(user):
+    ttl = cache_ttl()
+    if not ttl:
+        return Visibility(user.id)
+    key = "xos-visibility-%d-%d" % (user.id, cache.get(GENERATION_KEY, 0))
+    visibility = Visibility(user.id, key)
+    visibility.roles = cache.get(key, None) or {}
+    return visibility
+
+def get_visibility(user):
+    """ The Visibility of user for the current request. Outside of a request,
+        a new one every time. """
+    request = get_current_request()
+    if request is None:
+        return load_visibility(user)
+
+    visibilities = getattr(request, "xos_visibility", None)
+    if visibilities is None:
+        visibilities = request.xos_visibility = {}
+    visibility = visibilities.get(user.id, None)
+    if (visibility is None) or (visibility.generation != generation):
+        visibility = visibilities[user.id] = load_visibility(user)
+    return visibility
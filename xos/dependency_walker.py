@@ -11,6 +11,8 @@ import threading
 import json
 import pdb
 from core.models import *
+from django.db.models.fields import FieldDoesNotExist
+from django.db.models.query import prefetch_related_objects
 
 from util.logger import Logger, logging
 logger = Logger(level=logging.INFO)
@@ -40,52 +42,110 @@ def plural(name):
 		return name+'s'
 
 
-def walk_deps(fn, object):
-	model = object.__class__.__name__
-	try:	
-		deps = dependencies[model]
-	except:
-		deps = []
-	__walk_deps(fn, object, deps)
+accessor_cache = {}
 
-def walk_inv_deps(fn, object):
-	model = object.__class__.__name__
-	try:	
-		deps = inv_dependencies[model]
-	except:
-		deps = []
-	__walk_deps(fn, object, deps)
-
-def __walk_deps(fn, object, deps):
-	model = object.__class__.__name__
+def relation(model, link):
+	""" How link on model is stored: ('forward', fk) if it is a foreign
+	    key of model, ('reverse', fk) if it is the reverse side of a foreign
+	    key on another model, None for anything else (e.g. many-to-many) """
+	try:
+		(field, field_model, direct, m2m) = model._meta.get_field_by_name(link)
+	except FieldDoesNotExist:
+		return None
+	if m2m:
+		return None
+	if direct:
+		if getattr(field, 'rel', None):
+			return ('forward', field)
+		return None
+	return ('reverse', field.field)
+
+def dep_accessors(model, deps):
+	""" [(link, relation), ...] through which model reaches each of deps.
+	    Resolved once per model; links that cannot be found are logged once
+	    and left out """
+	key = (model.__name__, tuple(deps))
+	try:
+		return accessor_cache[key]
+	except KeyError:
+		pass
+
+	accessors = []
 	for dep in deps:
-		#print "Checking dep %s"%dep
-		peer=None
 		link = dep.lower()
-		try:
-			peer = getattr(object, link)
-		except AttributeError:
+		if not hasattr(model, link):
 			link = plural(link)
-			try:
-				peer = getattr(object, link)
-			except AttributeError:
-				if not missing_links.has_key(model+'.'+link):
-					print "Model %s missing link for dependency %s"%(model, link)
-                                        logger.log_exc("Model %s missing link for dependency %s"%(model, link))
-					missing_links[model+'.'+link]=True
-
-		if (peer):
-			try:
-				peer_objects = peer.all()
-			except AttributeError:
-				peer_objects = [peer]
-			except:
-				peer_objects = []
-
-			for o in peer_objects:
-				fn(o, object)
-				# Uncomment the following line to enable recursion
-				# walk_inv_deps(fn, o)
+			if not hasattr(model, link):
+				print "Model %s missing link for dependency %s"%(model.__name__, link)
+				logger.info("Model %s missing link for dependency %s"%(model.__name__, link))
+				missing_links[model.__name__+'.'+link]=True
+				continue
+		accessors.append((link, relation(model, link)))
+	accessor_cache[key] = accessors
+	return accessors
+
+def walk_deps(fn, object):
+	walk_deps_batch(fn, [object])
+
+def walk_inv_deps(fn, object):
+	walk_inv_deps_batch(fn, [object])
+
+def walk_deps_batch(fn, objects):
+	""" walk_deps for a list of objects of the same model, with one query
+	    per dependency for the whole list """
+	if objects:
+		__walk_deps(fn, objects, dependencies.get(objects[0].__class__.__name__, []))
+
+def walk_inv_deps_batch(fn, objects):
+	""" walk_inv_deps for a list of objects of the same model, with one
+	    query per dependency for the whole list """
+	if objects:
+		__walk_deps(fn, objects, inv_dependencies.get(objects[0].__class__.__name__, []))
+
+def __peers(objects, link, rel):
+	""" (peer, object) pairs for every peer reached through link """
+	if (rel is None):
+		# many-to-many and the like: one query for the whole list, which
+		# .all() below then answers from
+		try:
+			prefetch_related_objects(objects, [link])
+		except (AttributeError, ValueError):
+			# not something Django can prefetch, e.g. a property
+			pass
+		for object in objects:
+			peer = getattr(object, link, None)
+			if (peer):
+				try:
+					peer_objects = peer.all()
+				except AttributeError:
+					peer_objects = [peer]
+				for o in peer_objects:
+					yield (o, object)
+		return
+
+	(kind, field) = rel
+	if (kind == 'forward'):
+		ids = set([getattr(o, field.attname) for o in objects]) - set([None])
+		if not ids:
+			return
+		# same manager the descriptor uses, deleted objects included
+		peers = field.rel.to._base_manager.in_bulk(list(ids))
+		for object in objects:
+			peer = peers.get(getattr(object, field.attname))
+			if (peer):
+				yield (peer, object)
+	else:
+		by_id = dict([(o.pk, o) for o in objects])
+		# same manager the related manager uses, deleted objects excluded
+		for peer in field.model._default_manager.filter(**{field.name + '__in': by_id.keys()}):
+			yield (peer, by_id[getattr(peer, field.attname)])
+
+def __walk_deps(fn, objects, deps):
+	for (link, rel) in dep_accessors(objects[0].__class__, deps):
+		for (o, object) in __peers(objects, link, rel):
+			fn(o, object)
+			# Uncomment the following line to enable recursion
+			# walk_inv_deps(fn, o)
 
 def p(x):
 	print x,x.__class__.__name__
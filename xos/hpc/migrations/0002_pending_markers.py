@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+from core.migration_operations import pending_operations
+
+# Models in this app that inherit the pending_sync / pending_policy flags.
+# HpcHealthCheck is left out: no migration creates it yet.
+PENDING_MODELS = [
+    'AccessMap',
+    'CDNPrefix',
+    'ContentProvider',
+    'OriginServer',
+    'ServiceProvider',
+    'SiteMap',
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hpc', '0001_initial'),
+        ('core', '0012_pending_markers'),
+    ]
+
+    operations = pending_operations('hpc', PENDING_MODELS)
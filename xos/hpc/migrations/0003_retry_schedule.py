@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+from core.migration_operations import retry_operations
+
+# Models in this app that the observer syncs, and retries when they fail.
+# HpcHealthCheck is left out: no migration creates it yet.
+RETRY_MODELS = [
+    'AccessMap',
+    'CDNPrefix',
+    'ContentProvider',
+    'OriginServer',
+    'ServiceProvider',
+    'SiteMap',
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hpc', '0002_pending_markers'),
+        ('core', '0013_retry_schedule'),
+    ]
+
+    operations = retry_operations('hpc', RETRY_MODELS)
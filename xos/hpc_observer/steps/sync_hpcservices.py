@@ -36,7 +36,7 @@ class SyncHpcService(SyncStep, HpcLibrary):
         if (deleted):
             return []
         else:
-            return self.filter_hpc_service(HpcService.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None)))
+            return self.filter_hpc_service(HpcService.objects.filter(pending_sync=True))
 
     def sync_record(self, hpc_service):
         logger.info("sync'ing hpc_service %s" % str(hpc_service))
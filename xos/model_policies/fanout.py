@@ -0,0 +1,27 @@
+# Rows are inserted with bulk_create, in chunks of this size
+BULK_CREATE_CHUNK = 500
+
+def fan_out(link_model, fixed_field, fixed_obj, other_field, other_ids):
+    """ Make sure there is a link_model row joining fixed_obj to every
+        primary key in other_ids, e.g. a ControllerUser for every user of a
+        new controller, and return how many rows had to be created.
+
+        Missing pairs are found by primary key set difference and inserted
+        with bulk_create. That skips save(), but nothing save() would do is
+        lost: created/updated are auto fields, pending_sync and
+        pending_policy default to True, so the new rows are picked up by the
+        observer and the model policy engine like individually saved ones.
+    """
+    from core.models.plcorebase import notify_observer
+
+    existing = set(link_model.objects.filter(**{fixed_field: fixed_obj}).values_list(other_field + "_id", flat=True))
+    missing = [pk for pk in other_ids if pk not in existing]
+
+    for i in range(0, len(missing), BULK_CREATE_CHUNK):
+        link_model.objects.bulk_create([link_model(**{fixed_field: fixed_obj, other_field + "_id": pk})
+                                        for pk in missing[i:i+BULK_CREATE_CHUNK]])
+
+    if missing:
+        notify_observer(model=link_model)
+
+    return len(missing)
@@ -1,18 +1,11 @@
 
 def handle(slice):
     from core.models import Controller, ControllerSlice, SiteDeployment, Network, NetworkSlice,NetworkTemplate, Slice
-    from collections import defaultdict
+    from model_policies.fanout import fan_out
 
     # slice = Slice.get(slice_id)
 
-    controller_slices = ControllerSlice.objects.filter(slice=slice)
-    existing_controllers = [cs.controller for cs in controller_slices] 
-        
-    all_controllers = Controller.objects.all() 
-    for controller in all_controllers:
-        if controller not in existing_controllers:
-            sd = ControllerSlice(slice=slice, controller=controller)
-            sd.save()
+    fan_out(ControllerSlice, "slice", slice, "controller", Controller.objects.values_list("id", flat=True))
 
     # make sure slice has at least 1 public and 1 private networkd
     public_nets = []
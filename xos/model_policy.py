@@ -9,30 +9,74 @@ import time
 from core.models import *
 from django.db.transaction import atomic
 from django.db.models import F, Q
+from django.db import connection
+from django.utils import timezone
+from collections import defaultdict, OrderedDict
+from xos.config import Config
+from core.models.plcorebase import notify_observer
+from observer.metrics import metrics
+import threading
 
 modelPolicyEnabled = True
 
+DEFAULT_POLICY_BATCH_SIZE = 100
+DEFAULT_POLICY_WORKERS = 4
+
+# The tables whose rows each model's policy creates, or decides what to
+# create from. Policies of two models sharing one of them never run at the
+# same time: a new Controller and a new Slice could otherwise both create
+# the ControllerSlice joining them. Objects of the same model only create
+# rows of their own, and can be policed in parallel.
+POLICY_TABLES = {
+	'Controller': ['ControllerSite', 'ControllerSlice', 'ControllerUser', 'ControllerNetwork', 'ControllerImages'],
+	'Site': ['ControllerSite'],
+	'SitePrivilege': ['ControllerSite', 'ControllerSitePrivilege'],
+	'Slice': ['ControllerSlice', 'Network', 'NetworkSlice'],
+	'SlicePrivilege': ['ControllerSlice', 'ControllerSlicePrivilege'],
+	'User': ['ControllerUser'],
+	'Network': ['ControllerSlice', 'ControllerNetwork'],
+	'Image': ['ControllerImages'],
+}
+
+def policy_conflicts(model_names):
+	""" model name -> names of the other models whose policies can't run
+	    at the same time as its own """
+	conflicts = {}
+	for m in model_names:
+		tables = set(POLICY_TABLES.get(m, []))
+		conflicts[m] = set([other for other in model_names if (other != m) and (tables & set(POLICY_TABLES.get(other, [])))])
+	return conflicts
+
 def EnableModelPolicy(x):
     global modelPolicyEnabled
     modelPolicyEnabled = x
 
-def update_dep(d, o):
-	try:
+def dirty_inv_deps(objects):
+	""" Bump 'updated' on every inverse dependency of objects that is older
+	    than the object it depends on, with one UPDATE per dependent model.
+	    This is what saving each dependency with update_fields=['updated']
+	    did, one object at a time. """
+	stale = defaultdict(dict)	# model -> pk -> newest 'updated' it must catch up with
+	def collect(d, o):
 		if (d.updated < o.updated):
-			d.save(update_fields=['updated'])
-	except AttributeError,e:
-		raise e
+			ids = stale[d.__class__]
+			ids[d.pk] = max(ids.get(d.pk, o.updated), o.updated)
+	walk_inv_deps_batch(collect, objects)
+
+	for (model, ids) in stale.items():
+		fields = {'updated': timezone.now()}
+		if 'pending_sync' in model._meta.get_all_field_names():
+			fields.update(pending_sync=True, pending_policy=True)
+		# leave alone anything that was updated while we were walking
+		model._base_manager.filter(id__in=ids.keys(), updated__lt=max(ids.values())).update(**fields)
+		notify_observer(model=model)
 	
 def delete_if_inactive(d, o):
 	#print "Deleting %s (%s)"%(d,d.__class__.__name__)
 	# d.delete()	
 	return
 
-@atomic
-def execute_model_policy(instance, deleted):
-	# Automatic dirtying
-	walk_inv_deps(update_dep, instance)
-
+def apply_model_policy(instance, deleted):
 	sender_name = instance.__class__.__name__
 	policy_name = 'model_policy_%s'%sender_name
 	noargs = False
@@ -49,24 +93,154 @@ def execute_model_policy(instance, deleted):
 			logger.log_exc("Model Policy Error:") 
 			print "Policy Exceution Error"
 
-	instance.policed=datetime.now()
-        instance.save(update_fields=['policed'])
+def execute_model_policies(model, pks):
+	""" Run the model policy of every object of class model in pks, each in
+	    its own transaction, then mark them policed with a single UPDATE.
+	    Returns the number of objects policed.
+	"""
+	started = timezone.now()
+
+	objects = list(model.objects.filter(pk__in=pks))
+
+	# Automatic dirtying, for the whole batch at once
+	with atomic():
+		dirty_inv_deps(objects)
+
+	policed = []
+	for o in objects:
+		try:
+			atomic(apply_model_policy)(o, False)
+			policed.append(o.pk)
+		except Exception:
+			logger.log_exc("Model policy failed for %s %s" % (model.__name__, o.pk))
+
+	# Objects that were updated again since we fetched them stay pending
+	if policed:
+		model._base_manager.filter(pk__in=policed, updated__lte=started).update(policed=timezone.now(), pending_policy=False)
+	return len(policed)
+
+class PolicyQueue:
+	""" Objects waiting for their model policy, keyed by (model name, pk).
+
+	    Putting an object that is already queued, or currently being
+	    handled, is a no-op, so an object that is saved many times in a row
+	    is only policed once. Batches are made of objects of one model,
+	    taken from the model whose oldest entry has waited longest among
+	    those that don't conflict with a batch being handled.
+	"""
+
+	def __init__(self, conflicts={}):
+		self.cond = threading.Condition()
+		self.conflicts = conflicts	# see policy_conflicts()
+		self.queued = {}		# model name -> OrderedDict of pk -> time queued
+		self.in_progress = set()	# (model name, pk)
+		self.running = defaultdict(int)	# model name -> batches being handled
+		self.latency = {}		# model name -> seconds from queued to policed, last batch
+		self.handled = defaultdict(int)
+
+	def put(self, model_name, pk):
+		with self.cond:
+			if ((model_name, pk) in self.in_progress):
+				return
+			queued = self.queued.setdefault(model_name, OrderedDict())
+			if (pk not in queued):
+				queued[pk] = time.time()
+				self.cond.notify()
+
+	def ready_models(self):
+		return [m for (m, q) in self.queued.items()
+			if q and not any([self.running[other] for other in self.conflicts.get(m, [])])]
+
+	def get_batch(self, size):
+		with self.cond:
+			while not self.ready_models():
+				self.cond.wait()
+
+			model_name = min(self.ready_models(), key=lambda m: self.queued[m].itervalues().next())
+			self.running[model_name] += 1
+			queued = self.queued[model_name]
+			batch = []
+			while queued and (len(batch) < size):
+				(pk, queued_at) = queued.popitem(last=False)
+				self.in_progress.add((model_name, pk))
+				batch.append((pk, queued_at))
+			return (model_name, batch)
+
+	def done(self, model_name, batch):
+		now = time.time()
+		with self.cond:
+			for (pk, queued_at) in batch:
+				self.in_progress.discard((model_name, pk))
+			self.running[model_name] -= 1
+			self.latency[model_name] = max([now - queued_at for (pk, queued_at) in batch])
+			self.handled[model_name] += len(batch)
+			# models held back by this one may go now
+			self.cond.notify_all()
+
+	def stats(self):
+		""" Per model: objects queued, age of the oldest one, latency of the
+		    last batch and number of objects handled so far """
+		now = time.time()
+		with self.cond:
+			stats = {}
+			for model_name in set(self.queued.keys() + self.latency.keys()):
+				queued = self.queued.get(model_name, {})
+				stats[model_name] = {'depth': len(queued),
+						     'oldest': (now - queued.itervalues().next()) if queued else 0,
+						     'latency': self.latency.get(model_name, 0),
+						     'handled': self.handled[model_name]}
+			return stats
+
+class PolicyEngine:
+	""" Finds objects whose model policy is pending and runs the policies
+	    in batches on a small pool of worker threads.
+	"""
+
+	def __init__(self):
+		self.queue = PolicyQueue(policy_conflicts([m.__name__ for m in self.models()]))
+		self.batch_size = getattr(Config(), "observer_policy_batch_size", DEFAULT_POLICY_BATCH_SIZE)
+		self.num_workers = getattr(Config(), "observer_policy_workers", DEFAULT_POLICY_WORKERS)
+
+	def models(self):
+		from core.models import Slice,Controller,Network,User,SlicePrivilege,Site,SitePrivilege,Image,ControllerSlice,ControllerUser,ControllerSite
+		return [Slice, Controller, Network, User, SlicePrivilege, Site, SitePrivilege, Image, ControllerSlice, ControllerSite, ControllerUser]
+
+	def scan(self):
+		for m in self.models():
+			for pk in m.objects.filter(pending_policy=True).values_list('id', flat=True):
+				self.queue.put(m.__name__, pk)
+
+	def work(self):
+		models = dict([(m.__name__, m) for m in self.models()])
+		while True:
+			(model_name, batch) = self.queue.get_batch(self.batch_size)
+			try:
+				execute_model_policies(models[model_name], [pk for (pk, queued_at) in batch])
+			except Exception:
+				logger.log_exc("Model policy batch failed for %s" % model_name)
+				# the transaction may have been left in an aborted state
+				connection.close()
+			self.queue.done(model_name, batch)
+
+	def run(self):
+		# served with the metrics of this process
+		metrics.add_source('model_policy', self.queue.stats)
+
+		for i in range(max(1, int(self.num_workers))):
+			t = threading.Thread(target=self.work, name="policy-worker-%d" % i)
+			t.daemon = True
+			t.start()
+
+		while (True):
+			start = time.time()
+			try:
+				self.scan()
+			except Exception:
+				logger.log_exc("Could not scan for pending model policies")
+				connection.close()
+
+			if (time.time()-start<1):
+				time.sleep(1)
 
 def run_policy():
-        from core.models import Slice,Controller,Network,User,SlicePrivilege,Site,SitePrivilege,Image,ControllerSlice,ControllerUser,ControllerSite
-	while (True):
-		start = time.time()
-		models = [Slice, Controller, Network, User, SlicePrivilege, Site, SitePrivilege, Image, ControllerSlice, ControllerSite, ControllerUser]
-		objects = []
-		
-		for m in models:
-        		res = m.objects.filter(Q(policed__lt=F('updated')) | Q(policed=None))
-			objects.extend(res)	
-
-		for o in objects:
-			print "Working on %r"%o
-			execute_model_policy(o, False)
-		
-		
-		if (time.time()-start<1):
-			time.sleep(1)	
+	PolicyEngine().run()
@@ -178,6 +178,8 @@ class OpenStackClient:
         url_parsed = urlparse.urlparse(self.keystone.url)
         hostname = url_parsed.netloc.split(':')[0]
         token = self.keystone.client.tokens.authenticate(username=self.keystone.username, password=self.keystone.password, tenant_name=self.keystone.tenant)
+        # kept so that cached clients can be refreshed before it expires
+        self.token = token
         glance_endpoint = self.keystone.service_catalog.url_for(service_type='image', endpoint_type='publicURL')
         
         self.glanceclient = GlanceClient('1', endpoint=glance_endpoint, token=token.id, **kwds)
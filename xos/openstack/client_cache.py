@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from calendar import timegm
+
+# Keep at most this many authenticated clients around
+DEFAULT_MAX_CLIENTS = 64
+
+# Re-authenticate this many seconds before the token expires
+DEFAULT_REFRESH_AHEAD = 300
+
+# Assumed token lifetime when keystone doesn't tell us
+DEFAULT_TOKEN_TTL = 3600
+
+def token_expires(client):
+    """ Expiry of the keystone token held by client, in seconds since the
+        epoch, or None if it can't be determined """
+    expires = getattr(getattr(client, 'token', None), 'expires', None)
+    if not expires:
+        return None
+    if isinstance(expires, datetime):
+        return timegm(expires.utctimetuple())
+    for fmt in ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S.%fZ"):
+        try:
+            return timegm(time.strptime(expires, fmt))
+        except ValueError:
+            pass
+    return None
+
+class CachedClient:
+    def __init__(self, client, expires):
+        self.client = client
+        self.expires = expires
+        self.lock = threading.Lock()
+        self.extras = {}
+
+    def extra(self, name, fn):
+        """ fn(client), computed once per authenticated client. Used for
+            lookups that only depend on the client, like the admin user """
+        with self.lock:
+            if name not in self.extras:
+                self.extras[name] = fn(self.client)
+            return self.extras[name]
+
+class ClientCache:
+    """ Authenticated OpenStack clients, keyed by (controller, tenant, user).
+
+        A client is reused until its token is within refresh_ahead seconds
+        of expiring, at which point the next get() authenticates a new one.
+        Only one thread authenticates for a given key at a time; others
+        asking for the same key wait for it instead of authenticating too.
+        The least recently used clients are dropped beyond max_clients.
+    """
+
+    def __init__(self, factory, max_clients=DEFAULT_MAX_CLIENTS, refresh_ahead=DEFAULT_REFRESH_AHEAD,
+                 token_ttl=DEFAULT_TOKEN_TTL, clock=time.time):
+        self.factory = factory
+        self.max_clients = max_clients
+        self.refresh_ahead = refresh_ahead
+        self.token_ttl = token_ttl
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.auth_count = 0
+
+    def get(self, key, *args, **kwds):
+        """ Return the client for key, calling factory(*args, **kwds) to
+            authenticate one if there is none or its token is about to expire """
+        return self.get_entry(key, *args, **kwds).client
+
+    def get_entry(self, key, *args, **kwds):
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if (entry is None):
+                entry = CachedClient(None, 0)
+            # most recently used goes last
+            self.entries[key] = entry
+            self.evict()
+
+        with entry.lock:
+            if (entry.client is None) or (self.clock() >= entry.expires - self.refresh_ahead):
+                client = self.factory(*args, **kwds)
+                entry.expires = token_expires(client) or (self.clock() + self.token_ttl)
+                entry.extras = {}
+                entry.client = client
+                with self.lock:
+                    self.auth_count += 1
+        return entry
+
+    def evict(self):
+        while len(self.entries) > self.max_clients:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        with self.lock:
+            if (key is None):
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
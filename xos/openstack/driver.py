@@ -3,6 +3,8 @@ import hashlib
 from xos.config import Config
 from core.models import Controller
 
+from openstack.client_cache import ClientCache, DEFAULT_MAX_CLIENTS, DEFAULT_REFRESH_AHEAD
+
 try:
     from openstack.client import OpenStackClient
     has_openstack = True
@@ -11,6 +13,16 @@ except:
 
 manager_enabled = Config().api_nova_enabled
 
+# Authenticated clients, shared by every driver in the process
+client_cache = ClientCache(factory=lambda **kwds: OpenStackClient(**kwds),
+                           max_clients=getattr(Config(), "nova_client_cache_size", DEFAULT_MAX_CLIENTS),
+                           refresh_ahead=getattr(Config(), "nova_token_refresh_ahead", DEFAULT_REFRESH_AHEAD))
+
+def credentials_key(*credentials):
+    """ A digest of credentials for client cache keys, so that a changed
+        password gets a new client, without keeping the password in the key """
+    return hashlib.sha1('\0'.join([unicode(c or '').encode('utf-8') for c in credentials])).hexdigest()
+
 class OpenStackDriver:
 
     def __init__(self, config = None, client=None):
@@ -32,22 +44,25 @@ class OpenStackDriver:
             auth = {'username': caller.email,
                     'password': hashlib.md5(caller.password).hexdigest()[:6],
                     'tenant': tenant}
-            client = OpenStackClient(controller=controller, cacert=self.config.nova_ca_ssl_cert, **auth)
+            client = client_cache.get((controller.id, controller.auth_url, tenant, caller.email, credentials_key(auth['password'])),
+                                      controller=controller, cacert=self.config.nova_ca_ssl_cert, **auth)
+            driver = OpenStackDriver(client=client)
         else:
-            admin_driver = self.admin_driver(tenant=tenant, controller=controller)
-            client = OpenStackClient(tenant=tenant, controller=admin_driver.controller)
+            # the admin client for the tenant is all we need
+            driver = self.admin_driver(tenant=tenant, controller=controller)
 
-        driver = OpenStackDriver(client=client)
-        #driver.admin_user = admin_driver.admin_user
-        #driver.controller = admin_driver.controller
         return driver
 
     def admin_driver(self, tenant=None, controller=None):
         if isinstance(controller, int):
-            controller = Controller.objects.get(id=controller.id)
-        client = OpenStackClient(tenant=tenant, controller=controller, cacert=self.config.nova_ca_ssl_cert)
-        driver = OpenStackDriver(client=client)
-        driver.admin_user = client.keystone.users.find(name=controller.admin_user)
+            controller = Controller.objects.get(id=controller)
+        # a changed auth_url or admin password makes new clients
+        key = (controller.id, controller.auth_url, tenant, controller.admin_user,
+               credentials_key(controller.admin_password, controller.admin_tenant))
+        entry = client_cache.get_entry(key,
+                                       tenant=tenant, controller=controller, cacert=self.config.nova_ca_ssl_cert)
+        driver = OpenStackDriver(client=entry.client)
+        driver.admin_user = entry.extra('admin_user', lambda client: client.keystone.users.find(name=controller.admin_user))
         driver.controller = controller
         return driver    
 
@@ -0,0 +1,49 @@
+"""
+    Offline stand-ins for keystone and nova, enough to exercise code that
+    authenticates OpenStackClients (e.g. the client cache) without a
+    controller.
+"""
+
+import itertools
+import time
+from datetime import datetime
+
+class FakeToken:
+    def __init__(self, id, expires):
+        self.id = id
+        self.expires = expires
+
+class FakeKeystone:
+    """ Issues tokens valid for token_ttl seconds and counts authentications """
+
+    def __init__(self, token_ttl=3600, clock=time.time):
+        self.token_ttl = token_ttl
+        self.clock = clock
+        self.auth_count = 0
+        self.ids = itertools.count(1)
+
+    def authenticate(self, username=None, password=None, tenant_name=None):
+        self.auth_count += 1
+        expires = datetime.utcfromtimestamp(self.clock() + self.token_ttl)
+        return FakeToken("token-%d" % self.ids.next(), expires.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+class FakeNova:
+    def __init__(self):
+        self.servers = {}
+        self.ids = itertools.count(1)
+
+    def create_server(self, name, **kwds):
+        id = self.ids.next()
+        self.servers[id] = dict(kwds, id=id, name=name)
+        return self.servers[id]
+
+class FakeOpenStackClient:
+    """ Takes the same arguments as OpenStackClient, and authenticates
+        against a FakeKeystone like OpenStackClient does against keystone """
+
+    def __init__(self, keystone, nova=None, tenant=None, controller=None, username=None, **kwds):
+        self.tenant = tenant
+        self.controller = controller
+        self.username = username
+        self.token = keystone.authenticate(username=username, tenant_name=tenant)
+        self.nova = nova or FakeNova()
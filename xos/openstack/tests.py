@@ -0,0 +1,78 @@
+import threading
+import unittest
+
+from openstack.client_cache import ClientCache
+from openstack.fake import FakeKeystone, FakeNova, FakeOpenStackClient
+
+class Clock:
+    def __init__(self):
+        self.now = 1420070400.0
+
+    def __call__(self):
+        return self.now
+
+class ClientCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.keystone = FakeKeystone(token_ttl=3600, clock=self.clock)
+        self.nova = FakeNova()
+        self.cache = ClientCache(factory=lambda **kwds: FakeOpenStackClient(self.keystone, self.nova, **kwds),
+                                 max_clients=3, refresh_ahead=300, clock=self.clock)
+
+    def get(self, controller=1, tenant="mysite_slice", user="admin"):
+        return self.cache.get((controller, tenant, user), controller=controller, tenant=tenant, username=user)
+
+    def test_reuse(self):
+        for i in range(500):
+            self.get().nova.create_server("sliver-%d" % i)
+        self.assertEqual(len(self.nova.servers), 500)
+        self.assertEqual(self.keystone.auth_count, 1)
+
+    def test_keys(self):
+        self.get(controller=1)
+        self.get(controller=2)
+        self.get(controller=1, tenant="other_slice")
+        self.get(controller=1)
+        self.get(controller=1, tenant="other_slice")
+        self.assertEqual(self.keystone.auth_count, 3)
+        self.get(controller=1, tenant="other_slice", user="someone@onlab.us")
+        self.assertEqual(self.keystone.auth_count, 4)
+
+    def test_refresh_ahead(self):
+        client = self.get()
+        self.clock.now += 3600 - 301
+        self.assertTrue(self.get() is client)
+        self.clock.now += 2
+        self.assertFalse(self.get() is client)
+        self.assertEqual(self.keystone.auth_count, 2)
+
+    def test_lru(self):
+        for controller in (1, 2, 3):
+            self.get(controller=controller)
+        self.get(controller=1)
+        self.get(controller=4)        # evicts 2, the least recently used
+        self.assertEqual(self.keystone.auth_count, 4)
+        self.get(controller=1)
+        self.assertEqual(self.keystone.auth_count, 4)
+        self.get(controller=2)
+        self.assertEqual(self.keystone.auth_count, 5)
+
+    def test_extra(self):
+        entry = self.cache.get_entry((1, "t", "admin"), controller=1, tenant="t", username="admin")
+        lookups = []
+        for i in range(10):
+            entry.extra("admin_user", lambda client: lookups.append(client) or "admin")
+        self.assertEqual(len(lookups), 1)
+
+    def test_threads(self):
+        clients = []
+        threads = [threading.Thread(target=lambda: clients.append(self.get())) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.keystone.auth_count, 1)
+        self.assertEqual(len(set([id(c) for c in clients])), 1)
+
+if __name__ == '__main__':
+    unittest.main()
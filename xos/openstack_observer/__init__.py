@@ -21,16 +21,13 @@ def notify_observer(model=None, delete=False, pk=None, model_dict={}):
         return
 
     try:
-        from .event_manager import EventSender
-        if (model and delete):
-            if hasattr(model,"__name__"):
-                modelName = model.__name__
-            else:
-                modelName = model.__class__.__name__
-            EventSender().fire(delete_flag = delete, model = modelName, pk = pk, model_dict=model_dict)
+        from .change_feed import notify_change
+        if model is None:
+            return
+        if hasattr(model,"__name__"):
+            modelName = model.__name__
         else:
-            EventSender().fire()
+            modelName = model.__class__.__name__
+        notify_change(modelName)
     except Exception,e:
         print "Exception in Observer. This should not disrupt the front end. %s"%str(e)
-
-
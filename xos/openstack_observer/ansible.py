@@ -7,10 +7,13 @@ import pdb
 import string
 import random
 import re
-
-# XXX hardcoded path
-#    is there any reason why we aren't importing xos.config ?
-XOS_DIR="/opt/xos"
+import subprocess
+import fcntl
+import hashlib
+import threading
+from collections import defaultdict, OrderedDict
+from xos.config import Config, XOS_DIR
+from util.logger import observer_logger as logger
 
 try:
     step_dir = Config().observer_steps_dir
@@ -19,30 +22,176 @@ except:
     step_dir = XOS_DIR + '/observer/steps'
     sys_dir = '/opt/opencloud'
 
+run_ansible = getattr(Config(), "observer_run_ansible", XOS_DIR + '/observer/run_ansible')
+
 os_template_loader = jinja2.FileSystemLoader( searchpath=step_dir)
-os_template_env = jinja2.Environment(loader=os_template_loader)
+# templates only change with a new release, don't stat them on every use
+os_template_env = jinja2.Environment(loader=os_template_loader, auto_reload=False, cache_size=-1)
+
+# Per template, how many renderings were run and how many were skipped
+# because they were identical to the last one successfully applied
+run_stats = defaultdict(lambda: {'runs': 0, 'skipped': 0})
+run_stats_lock = threading.Lock()
+
+def count_run(name, skipped):
+    with run_stats_lock:
+        run_stats[name]['skipped' if skipped else 'runs'] += 1
+
+def skip_stats():
+    """ Per template: runs, skips and the fraction of renderings skipped """
+    with run_stats_lock:
+        stats = {}
+        for (name, counts) in run_stats.items():
+            total = counts['runs'] + counts['skipped']
+            stats[name] = dict(counts, skip_rate=float(counts['skipped'])/total if total else 0.0)
+        return stats
+
+def force_resync():
+    # escape hatch: [observer] force_resync=True runs every playbook again
+    return bool(getattr(Config(), "observer_force_resync", False))
+
+def render_digest(buffer):
+    if isinstance(buffer, unicode):
+        buffer = buffer.encode('utf-8')
+    return hashlib.sha1(buffer).hexdigest()
+
+def load_applied(fqp, digest):
+    """ Results of the last successful run of playbook fqp, if it was
+        rendered exactly as it is now """
+    try:
+        applied = json.load(open(fqp+'.applied'))
+    except (IOError, ValueError):
+        return None
+    if (applied.get('hash') != digest):
+        return None
+    return applied.get('results')
+
+def save_applied(fqp, digest, results):
+    try:
+        json.dump({'hash': digest, 'results': results}, open(fqp+'.applied', 'w'))
+    except (IOError, TypeError, ValueError):
+        logger.log_exc("Could not record applied playbook %s" % fqp)
 
-def parse_output(msg):
-    lines = msg.splitlines()
-    results = []
-    print msg
+def forget_applied(fqp):
+    try:
+        os.remove(fqp+'.applied')
+    except OSError:
+        pass
+
+def forget_applied_tag(path, opts):
+    """ Make the next run of the playbook for opts' ansible_tag run for
+        real, e.g. because its object was (re)created since it was applied """
+    if opts.get('ansible_tag'):
+        forget_applied('/'.join([sys_dir,path,opts['ansible_tag']]))
+
+def make_dirs(path):
+    dir = '/'.join([sys_dir,path])
+    if not os.path.isdir(dir):
+        os.system('mkdir -p %s'%dir)
 
+# Task results come back from the xos_results callback plugin as JSON
+# lines on a pipe, see callback_plugins/xos_results.py
+RESULT_FD_VAR = 'XOS_ANSIBLE_RESULT_FD'
+callback_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'callback_plugins')
+
+# held from creating a result pipe until its playbook is started
+result_pipe_lock = threading.Lock()
+
+def set_cloexec(fd, on):
+    flags = fcntl.fcntl(fd, fcntl.F_GETFD)
+    if on:
+        flags |= fcntl.FD_CLOEXEC
+    else:
+        flags &= ~fcntl.FD_CLOEXEC
+    fcntl.fcntl(fd, fcntl.F_SETFD, flags)
+
+OK_STATUSES = ('ok', 'changed')
+FAILED_STATUSES = ('failed', 'unreachable')
+
+TRANSCRIPT_TASK_RE = re.compile(r'^TASK: \[(.*)\]')
+TRANSCRIPT_RESULT_RE = re.compile(r'^(ok|changed|failed|fatal): \[[^\]]*\] => (\{.*\})$')
+
+def transcript_events(lines):
+    """ Task results from the text of an ansible-playbook -v run, for
+        canned transcripts (observer_steps off) that weren't produced
+        with the callback plugin """
+    task = None
     for l in lines:
-        magic_str = 'ok: [127.0.0.1] => '
-        magic_str2 = 'changed: [127.0.0.1] => '
-        if (l.startswith(magic_str)):
-            w = len(magic_str)
-            str = l[w:]
-            d = json.loads(str)
-            results.append(d)
-        elif (l.startswith(magic_str2)):
-            w = len(magic_str2)
-            str = l[w:]
-            d = json.loads(str)
-            results.append(d)
-
-
-    return results
+        m = TRANSCRIPT_TASK_RE.match(l)
+        if m:
+            task = m.group(1)
+            continue
+        m = TRANSCRIPT_RESULT_RE.match(l.rstrip())
+        if m:
+            status = m.group(1)
+            if (status == 'fatal'):
+                status = 'unreachable'
+            yield {'task': task, 'status': status, 'ignored': False, 'duration': 0,
+                   'result': json.loads(m.group(2))}
+
+def run_playbook(fqp):
+    """ Run the playbook fqp, yielding each task result as soon as ansible
+        reports it. The transcript goes to fqp.log instead of memory. """
+    if (not Config().observer_steps):
+        for event in transcript_events(open(fqp+'.out')):
+            yield event
+        return
+
+    env = dict(os.environ)
+    env['ANSIBLE_CALLBACK_PLUGINS'] = callback_dir
+    log = open(fqp+'.log', 'w')
+    r = None
+    try:
+        # Both ends are close-on-exec from the start, so that the children
+        # of playbooks run at the same time by other threads don't keep
+        # this one's write end open. Only ours gets it, re-enabled between
+        # fork and exec.
+        with result_pipe_lock:
+            (r, w) = os.pipe()
+            set_cloexec(r, True)
+            set_cloexec(w, True)
+            env[RESULT_FD_VAR] = str(w)
+            try:
+                proc = subprocess.Popen([run_ansible, fqp], stdout=log, stderr=subprocess.STDOUT, env=env,
+                                        close_fds=False, preexec_fn=lambda: set_cloexec(w, False))
+            finally:
+                os.close(w)
+        results = os.fdopen(r)
+    except:
+        if (r is not None):
+            os.close(r)
+        log.close()
+        raise
+
+    try:
+        for line in iter(results.readline, ''):
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            logger.info("ansible %s: %s %s (%.2fs)" % (os.path.basename(fqp), event.get('task'), event.get('status'), event.get('duration', 0)))
+            yield event
+    finally:
+        results.close()
+        proc.wait()
+        log.close()
+
+def playbook_error(fqp):
+    """ What ansible said went wrong, for errors no task result carries """
+    transcript = fqp+'.log' if Config().observer_steps else fqp+'.out'
+    all_fatal = []
+    try:
+        for l in open(transcript):
+            m = re.match(r'^(msg|ERROR): (.*)', l)
+            if m:
+                all_fatal.append(m.group(2).rstrip())
+    except IOError:
+        pass
+    return ' // '.join(all_fatal)
+
+def event_errors(events):
+    return [e['result'].get('msg', '%r' % e['result']) for e in events
+            if (e['status'] in FAILED_STATUSES)]
 
 def id_generator(size=6, chars=string.ascii_uppercase + string.digits):
     return ''.join(random.choice(chars) for _ in range(size))
@@ -50,7 +199,11 @@ def id_generator(size=6, chars=string.ascii_uppercase + string.digits):
 def shellquote(s):
     return "'" + s.replace("'", "'\\''") + "'"
 
-def run_template(name, opts,path='', expected_num=None):
+def run_template(name, opts,path='', expected_num=None, force=False):
+    """ Render template name with opts and run it, returning the results
+        of its tasks. If the rendering is identical to the last one that was
+        successfully applied for the same ansible_tag, the run is skipped
+        and the results of that run are returned, unless force is set. """
     template = os_template_env.get_template(name)
     buffer = template.render(opts)
 
@@ -59,41 +212,143 @@ def run_template(name, opts,path='', expected_num=None):
     except:
         objname= id_generator()
 
-    os.system('mkdir -p %s'%'/'.join([sys_dir,path]))
+    make_dirs(path)
     fqp = '/'.join([sys_dir,path,objname])
 
+    digest = render_digest(buffer)
+    if not (force or force_resync()):
+        applied = load_applied(fqp, digest)
+        if (applied is not None) and (len(applied) == expected_num):
+            logger.info("%s is unchanged since it was last applied, skipping" % fqp)
+            count_run(name, True)
+            return applied
 
     f = open(fqp,'w')
     f.write(buffer)
-    f.flush()
+    f.close()
 
-    
-    if (Config().observer_steps):
-        run = os.popen(XOS_DIR + '/observer/run_ansible %s'%shellquote(fqp))
-        msg = run.read()
-        status = run.close()
+    count_run(name, False)
+    forget_applied(fqp)
+    events = list(run_playbook(fqp))
+    ok_results = [e['result'] for e in events if e['status'] in OK_STATUSES]
+    if (len(ok_results) != expected_num):
+        errors = event_errors([e for e in events if not e['ignored']])
+        raise Exception(' // '.join(errors) or playbook_error(fqp))
 
-        
-    else:
-        msg = open(fqp+'.out').read()
-        
-    try:
-        ok_results = parse_output(msg)
-        if (len(ok_results) != expected_num):
-            raise ValueError('Unexpected num')
-    except ValueError,e:
-        all_fatal = re.findall(r'^msg: (.*)',msg,re.MULTILINE)
-        all_fatal2 = re.findall(r'^ERROR: (.*)',msg,re.MULTILINE)
+    save_applied(fqp, digest, ok_results)
+    return ok_results
+
+# Task names in batched playbooks, "xos <object index>.<task index> <ansible_tag>"
+BATCH_TASK_NAME = 'xos %d.%d %s'
+# and the variables their results are registered in
+BATCH_TASK_RESULT = 'xos_%d_%d'
+BATCH_TASK_RE = re.compile(r'^xos (\d+)\.(\d+) ')
 
+def run_template_batch(name, batch, path='', force=False):
+    """ run_template for several objects in a single ansible-playbook run.
 
-        all_fatal.extend(all_fatal2)
+        batch is a list of (opts, expected_num), one per object. The tasks
+        rendered for each object are put in one play with the others whose
+        play header (hosts, connection, ...) renders the same, named after
+        the object so their results can be told apart, and set to ignore
+        errors so that one failing object doesn't stop the others. The
+        tasks of an object after one that failed are skipped, as
+        run_template would stop there. Each play is run as its own
+        playbook, removed with its log afterwards.
+
+        Returns, for each object, the list run_template would have returned,
+        or the Exception it would have raised. Objects whose rendering is
+        unchanged since it was last applied are skipped, as in run_template.
+    """
+    import yaml
+
+    template = os_template_env.get_template(name)
+    make_dirs(path)
+    force = force or force_resync()
+
+    outcomes = [None] * len(batch)
+    plays_by_header = OrderedDict()     # dumped header -> (header, tasks)
+    renders = {}
+    for (i, (opts, expected_num)) in enumerate(batch):
+        buffer = template.render(opts)
+        objname = opts.get('ansible_tag')
+        if objname:
+            obj_fqp = '/'.join([sys_dir,path,objname])
+            digest = render_digest(buffer)
+            applied = None if force else load_applied(obj_fqp, digest)
+            if (applied is not None) and (len(applied) == expected_num):
+                count_run(name, True)
+                outcomes[i] = applied
+                continue
+            forget_applied(obj_fqp)
+            renders[i] = (obj_fqp, digest)
+        count_run(name, False)
+
+        plays = yaml.safe_load(buffer)
+        if (len(plays) != 1):
+            raise Exception('%s has %d plays, can only batch single-play templates' % (name, len(plays)))
+        header = dict([(k, v) for (k, v) in plays[0].items() if k != 'tasks'])
+        (header, tasks) = plays_by_header.setdefault(yaml.safe_dump(header), (header, []))
+        objname = opts.get('ansible_tag', '')
+        registered = []
+        for (j, task) in enumerate(plays[0].get('tasks') or []):
+            task = dict(task)
+            task['name'] = BATCH_TASK_NAME % (i, j, objname)
+            task['ignore_errors'] = True
+            if registered:
+                # not after a failure of an earlier task of the same object
+                guard = 'not (%s)' % ' or '.join(['%s|failed' % r for r in registered])
+                task['when'] = ('(%s) and %s' % (task['when'], guard)) if task.get('when') else guard
+            # a template's own variable stays what its tasks expect
+            task.setdefault('register', BATCH_TASK_RESULT % (i, j))
+            registered.append(task['register'])
+            tasks.append(task)
+
+    events_by_object = [[] for i in range(len(batch))]
+    play_errors = [None] * len(batch)   # what ansible said about the play of each object
+    for (header, tasks) in plays_by_header.values():
+        if not tasks:
+            continue
+        play = dict(header)
+        play['tasks'] = tasks
+
+        fqp = '/'.join([sys_dir,path,'batch-%s'%id_generator()])
         try:
-            error = ' // '.join(all_fatal)
-        except:
-            pass
-        raise Exception(error)
+            f = open(fqp,'w')
+            f.write(yaml.safe_dump([play], default_flow_style=False))
+            f.close()
 
-    return ok_results
+            for event in run_playbook(fqp):
+                m = BATCH_TASK_RE.match(event.get('task') or '')
+                if m and (int(m.group(1)) < len(batch)):
+                    events_by_object[int(m.group(1))].append(event)
+
+            error = playbook_error(fqp)
+            for task in tasks:
+                play_errors[int(BATCH_TASK_RE.match(task['name']).group(1))] = error
+        finally:
+            # one-off, unlike the playbooks of run_template
+            for leftover in (fqp, fqp+'.log'):
+                try:
+                    os.remove(leftover)
+                except OSError:
+                    pass
+
+    for (i, ((opts, expected_num), events)) in enumerate(zip(batch, events_by_object)):
+        if (outcomes[i] is not None):
+            continue
+        errors = event_errors(events)
+        ok_results = [e['result'] for e in events if e['status'] in OK_STATUSES]
+        if errors:
+            outcomes[i] = Exception(' // '.join(errors))
+        elif (len(ok_results) != expected_num):
+            # the play never got to this object's tasks
+            outcomes[i] = Exception(play_errors[i] or 'Unexpected num')
+        else:
+            outcomes[i] = ok_results
+            if i in renders:
+                save_applied(renders[i][0], renders[i][1], ok_results)
+    return outcomes
 
 def main():
     run_template('ansible/sync_user_deployments.yaml',{ "endpoint" : "http://172.31.38.128:5000/v2.0/",
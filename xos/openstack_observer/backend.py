@@ -1,7 +1,14 @@
+import os
+import sys
+import signal
+import subprocess
 import threading
 import time
 from observer.event_loop import XOSObserver
 from observer.event_manager import EventListener
+from observer.change_feed import ChangeListener
+from observer.shard import release_holder, shard_holder
+from observer.metrics import start_metrics_server, metrics_address, metrics_port
 from util.logger import Logger, logging
 from model_policy import run_policy
 from xos.config import Config
@@ -10,22 +17,107 @@ logger = Logger(level=logging.INFO)
 
 class Backend:
 
+    def __init__(self, shard=None):
+        # (index, count) if this process is one shard of a sharded observer
+        self.shard = shard
+
     def run(self):
+        shards = int(getattr(Config(), "observer_shards", 1))
+        if (self.shard is None) and (shards > 1):
+            return self.run_coordinator(shards)
+
         # start the openstack observer
-        observer = XOSObserver()
+        observer = XOSObserver(shard=self.shard)
+
+        # start the change listener, which wakes the observer as soon as a
+        # model it cares about is saved
+        if getattr(Config(), "observer_change_feed", True):
+            change_listener = ChangeListener(callback=observer.note_changes)
+            observer.change_listener = change_listener
+            change_listener_thread = threading.Thread(target=change_listener.run)
+            change_listener_thread.daemon = True
+            change_listener_thread.start()
+
         observer_thread = threading.Thread(target=observer.run)
         observer_thread.start()
 
+        if (observer.shard is not None):
+            # hand the controllers back right away, rather than have the
+            # shard's replacement wait for the leases to expire
+            def stop(signum, frame):
+                try:
+                    observer.shard.release()
+                finally:
+                    os._exit(0)
+            signal.signal(signal.SIGTERM, stop)
+            signal.signal(signal.SIGINT, stop)
+
         # start model policies thread
         observer_name = getattr(Config(), "observer_name", "")
-        if (not observer_name):
+        if (self.shard is not None):
+            print "Model policies run in the shard coordinator."
+        elif (not observer_name):
             model_policy_thread = threading.Thread(target=run_policy)
             model_policy_thread.start()
         else:
             print "Skipping model policies thread for service observer."
 
+        if (observer.shard is not None):
+            # a join with a timeout, so that the main thread gets to run
+            # the signal handlers
+            while observer_thread.is_alive():
+                observer_thread.join(1)
+            observer.shard.release()
 
         # start event listene
         #event_manager = EventListener(wake_up=observer.wake_up)
         #event_manager_thread = threading.Thread(target=event_manager.run)
         #event_manager_thread.start()
+
+    def start_shard(self, index, count):
+        # A fresh interpreter per shard, running this same script: forking
+        # would copy the coordinator's threads' locks and its DB connection
+        args = [a for a in sys.argv if a not in ['-d', '--daemon']]
+        return subprocess.Popen([sys.executable] + args + ['--shard', '%d/%d' % (index, count)])
+
+    def run_coordinator(self, count):
+        """ Run count observer processes, each syncing its share of the
+            controllers (see observer.shard), restart them when they die,
+            and run the model policies, which aren't sharded. """
+        workers = [self.start_shard(i, count) for i in range(count)]
+
+        def release(i, w):
+            # the leases of a shard that didn't get to release them itself
+            try:
+                release_holder(shard_holder(i, count, w.pid))
+            except Exception:
+                logger.log_exc("Could not release the leases of observer shard %d/%d" % (i, count))
+
+        def stop(signum, frame):
+            for w in workers:
+                if (w.poll() is None):
+                    w.terminate()
+            for (i, w) in enumerate(workers):
+                w.wait()
+                release(i, w)
+            os._exit(0)
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        observer_name = getattr(Config(), "observer_name", "")
+        if (not observer_name):
+            model_policy_thread = threading.Thread(target=run_policy)
+            model_policy_thread.daemon = True
+            model_policy_thread.start()
+
+            # the model policy backlog, on the port after the shards'
+            if metrics_port(count):
+                start_metrics_server(metrics_address(), metrics_port(count))
+
+        while True:
+            time.sleep(5)
+            for (i, w) in enumerate(workers):
+                if (w.poll() is not None):
+                    logger.error("Observer shard %d/%d exited with status %r, restarting it" % (i, count, w.returncode))
+                    release(i, w)
+                    workers[i] = self.start_shard(i, count)
@@ -0,0 +1,60 @@
+"""
+    Ansible callback plugin that reports each task result to the observer
+    as one line of JSON, written to the file descriptor named by the
+    XOS_ANSIBLE_RESULT_FD environment variable. Does nothing when that
+    variable is not set, so plain ansible-playbook runs are unaffected.
+
+    Each line looks like:
+
+      {"task": "<task name>", "status": "ok|changed|failed|skipped|unreachable",
+       "ignored": false, "duration": 1.23, "result": {...}}
+"""
+
+import json
+import os
+import time
+
+RESULT_FD_VAR = 'XOS_ANSIBLE_RESULT_FD'
+
+class CallbackModule(object):
+
+    def __init__(self):
+        self.out = None
+        fd = os.environ.get(RESULT_FD_VAR)
+        if fd:
+            self.out = os.fdopen(int(fd), 'w', 0)
+        self.task = None
+        self.task_start = time.time()
+
+    def emit(self, status, res, ignored=False):
+        if (self.out is None):
+            return
+        if not isinstance(res, dict):
+            res = {'msg': str(res)}
+        line = json.dumps({'task': self.task,
+                           'status': status,
+                           'ignored': ignored,
+                           'duration': time.time() - self.task_start,
+                           'result': res})
+        # a single write per line, so that lines from forked workers
+        # don't get mixed up
+        self.out.write(line + '\n')
+
+    def playbook_on_task_start(self, name, is_conditional):
+        self.task = name
+        self.task_start = time.time()
+
+    def runner_on_ok(self, host, res):
+        if res.get('changed'):
+            self.emit('changed', res)
+        else:
+            self.emit('ok', res)
+
+    def runner_on_failed(self, host, res, ignore_errors=False):
+        self.emit('failed', res, ignored=ignore_errors)
+
+    def runner_on_unreachable(self, host, res):
+        self.emit('unreachable', res)
+
+    def runner_on_skipped(self, host, item=None):
+        self.emit('skipped', {'item': item})
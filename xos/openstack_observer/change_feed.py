@@ -0,0 +1,72 @@
+import select
+import time
+from util.logger import Logger, logging
+
+logger = Logger(level=logging.INFO)
+
+# Postgres channel on which model saves are announced. The payload of each
+# notification is the name of the model class that changed.
+CHANNEL = 'xos_observer'
+
+def notify_change(model_name):
+    """ Announce that an object of class model_name was changed.
+
+        NOTIFY is transactional, so listeners only hear about the change
+        once it has been committed, and repeated notifications for the same
+        model within one transaction are folded into one.
+    """
+    from django.db import connection
+    if (connection.vendor != 'postgresql'):
+        return
+    cursor = connection.cursor()
+    cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, model_name])
+
+class ChangeListener:
+    """ Listens on the change channel on a dedicated connection and calls
+        callback(model_names) with the set of model names that changed.
+    """
+
+    def __init__(self, callback, timeout=30):
+        self.callback = callback
+        self.timeout = timeout
+        self.connected = False
+
+    def connect(self):
+        import psycopg2
+        import psycopg2.extensions
+        from django.conf import settings
+
+        db = settings.DATABASES['default']
+        conn = psycopg2.connect(database=db.get('NAME'),
+                                user=db.get('USER'),
+                                password=db.get('PASSWORD'),
+                                host=db.get('HOST') or None,
+                                port=db.get('PORT') or None)
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        conn.cursor().execute("LISTEN %s;" % CHANNEL)
+        return conn
+
+    def listen(self, conn):
+        while True:
+            if select.select([conn], [], [], self.timeout) == ([], [], []):
+                continue
+            conn.poll()
+            changed = set()
+            while conn.notifies:
+                changed.add(conn.notifies.pop(0).payload)
+            if changed:
+                self.callback(changed)
+
+    def run(self):
+        while True:
+            try:
+                conn = self.connect()
+                self.connected = True
+                logger.info('Listening for model changes on channel %s' % CHANNEL)
+                # Anything may have changed while we were not listening
+                self.callback(None)
+                self.listen(conn)
+            except Exception:
+                logger.log_exc("Change listener lost its connection, retrying")
+            self.connected = False
+            time.sleep(5)
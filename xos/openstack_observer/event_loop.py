@@ -23,7 +23,12 @@ from util.logger import Logger, logging, logger
 from xos.config import Config, XOS_DIR
 from observer.steps import *
 from syncstep import SyncStep
-from toposort import toposort
+from step_graph import StepGraph
+from step_pool import StepPool
+from inventory import Inventory
+from state_store import ObserverStateStore, DEFAULT_FLUSH_INTERVAL
+from shard import Shard, DEFAULT_LEASE_TTL
+from metrics import metrics, start_metrics_server, metrics_address, metrics_port
 from observer.error_mapper import *
 from openstack_observer.openstacksyncstep import OpenStackSyncStep
 
@@ -54,38 +59,54 @@ STEP_STATUS_WORKING=1
 STEP_STATUS_OK=2
 STEP_STATUS_KO=3
 
-def invert_graph(g):
-	ig = {}
-	for k,v in g.items():
-		for v0 in v:
-			try:
-				ig[v0].append(k)
-			except:
-				ig[v0]=[k]
-	return ig
+DEFAULT_STEP_POOL_SIZE=8
+DEFAULT_FULL_PASS_INTERVAL=60
 
 class XOSObserver:
 	#sync_steps = [SyncNetworks,SyncNetworkSlivers,SyncSites,SyncSitePrivilege,SyncSlices,SyncSliceMemberships,SyncSlivers,SyncSliverIps,SyncExternalRoutes,SyncUsers,SyncRoles,SyncNodes,SyncImages,GarbageCollector]
 	sync_steps = []
 
 	
-	def __init__(self):
+	def __init__(self, shard=None):
+		# (index, count) of this process in a sharded observer, see observer.shard
+		self.observer_name = getattr(Config(), "observer_name", "")
+		self.shard = None
+		if shard is not None:
+			(index, count) = shard
+			self.shard = Shard(index, count, float(getattr(Config(), "observer_lease_ttl", DEFAULT_LEASE_TTL)))
+			# each shard keeps its own run times and metrics
+			self.observer_name = "%sshard%d-" % (self.observer_name, index)
+
 		# The Condition object that gets signalled by Feefie events
 		self.step_lookup = {}
 		self.load_sync_step_modules()
 		self.load_sync_steps()
 		self.event_cond = threading.Condition()
 
+		# Model names reported changed by the change feed since the last
+		# pass. all_changed forces a full pass (e.g. right after startup or
+		# after the feed reconnects).
+		self.change_listener = None
+		self.changed_models = set()
+		self.changed_models_this_pass = set()
+		self.all_changed = True
+		self.full_pass = True
+		self.last_full_pass = 0
+		self.full_pass_interval = getattr(Config(), "observer_full_pass_interval", DEFAULT_FULL_PASS_INTERVAL)
+
 		self.driver_kind = getattr(Config(), "observer_driver", "openstack")
-		self.observer_name = getattr(Config(), "observer_name", "")
 		if self.driver_kind=="openstack":
 			self.driver = OpenStackDriver()
 		else:
 			self.driver = NoOpDriver()
+		self.inventory = Inventory(self.driver)
 
 	def wait_for_event(self, timeout):
 		self.event_cond.acquire()
-		self.event_cond.wait(timeout)
+		# Changes that arrived while the last pass was running must not be
+		# lost waiting for a wakeup that was already sent.
+		if (not self.changed_models) and (not self.all_changed):
+			self.event_cond.wait(timeout)
 		self.event_cond.release()
 
 	def wake_up(self):
@@ -94,6 +115,58 @@ class XOSObserver:
 		self.event_cond.notify()
 		self.event_cond.release()
 
+	def note_changes(self, model_names):
+		""" Called by the change listener with the set of model names that
+		    changed, or None if anything may have changed.
+		"""
+		self.event_cond.acquire()
+		if model_names is None:
+			self.all_changed = True
+		else:
+			self.changed_models.update(model_names)
+		self.event_cond.notify()
+		self.event_cond.release()
+
+	def change_feed_active(self):
+		return (self.change_listener is not None) and self.change_listener.connected
+
+	def take_changes(self):
+		""" Snapshot and reset the set of changed models for the coming pass.
+		    Without a live change feed every pass is a full pass, and even with
+		    one a full pass is forced every full_pass_interval seconds so that
+		    failed and backed-off objects get retried.
+		"""
+		self.event_cond.acquire()
+		changed = self.changed_models
+		full = self.all_changed
+		self.changed_models = set()
+		self.all_changed = False
+		self.event_cond.release()
+
+		if (not self.change_feed_active()) or (time.time() - self.last_full_pass >= self.full_pass_interval):
+			full = True
+		if full:
+			self.last_full_pass = time.time()
+
+		self.changed_models_this_pass = changed
+		self.full_pass = full
+
+	def step_has_changes(self, step):
+		if self.full_pass:
+			return True
+
+		# Steps that poll external state, or that don't declare the model they
+		# observe, can't be gated on the change feed.
+		observes = getattr(step, "observes", None)
+		if (not observes) or getattr(step, "poll_external", False):
+			return True
+
+		models = [observes] + list(getattr(step, "provides", [])) + list(getattr(step, "watches", []))
+		for m in models:
+			if m.__name__ in self.changed_models_this_pass:
+				return True
+		return False
+
 	def load_sync_step_modules(self, step_dir=None):
 		if step_dir is None:
 			if hasattr(Config(), "observer_steps_dir"):
@@ -118,88 +191,23 @@ class XOSObserver:
 		# print 'loaded sync steps: %s' % ",".join([x.__name__ for x in self.sync_steps])
 
 	def load_sync_steps(self):
-		dep_path = Config().observer_dependency_graph
-		logger.info('Loading model dependency graph from %s' % dep_path)
-		try:
-			# This contains dependencies between records, not sync steps
-			self.model_dependency_graph = json.loads(open(dep_path).read())
-			for left,lst in self.model_dependency_graph.items():
-                                new_lst = [] 
-				for k in lst:
-					try:
-                                                tup = (k,k.lower())
-                                                new_lst.append(tup)
-						deps = self.model_dependency_graph[k]
-					except:
-						self.model_dependency_graph[k] = []
-
-                                self.model_dependency_graph[left] = new_lst
-		except Exception,e:
-			raise e
-
-		try:
-			backend_path = Config().observer_pl_dependency_graph
-			logger.info('Loading backend dependency graph from %s' % backend_path)
-			# This contains dependencies between backend records
-			self.backend_dependency_graph = json.loads(open(backend_path).read())
-			for k,v in self.backend_dependency_graph.items():
-				try:
-					self.model_dependency_graph[k].extend(v)
-				except KeyError:
-					self.model_dependency_graphp[k] = v
-
-		except Exception,e:
-			logger.info('Backend dependency graph not loaded')
-			# We can work without a backend graph
-			self.backend_dependency_graph = {}
-
-		provides_dict = {}
 		for s in self.sync_steps:
-			self.step_lookup[s.__name__] = s 
-			for m in s.provides:
-				try:
-					provides_dict[m.__name__].append(s.__name__)
-				except KeyError:
-					provides_dict[m.__name__]=[s.__name__]
-
-		step_graph = {}
-		for k,v in self.model_dependency_graph.items():
-			try:
-				for source in provides_dict[k]:
-					if (not v):
-						step_graph[source] = []
-		
-					for m,_ in v:
-						try:
-							for dest in provides_dict[m]:
-								# no deps, pass
-								try:
-									if (dest not in step_graph[source]):
-										step_graph[source].append(dest)
-								except:
-									step_graph[source]=[dest]
-						except KeyError:
-							pass
-					
-			except KeyError:
-				pass
-				# no dependencies, pass
-		
+			self.step_lookup[s.__name__] = s
 
-		self.dependency_graph = step_graph
-		self.deletion_dependency_graph = invert_graph(step_graph)
-
-		pp = pprint.PrettyPrinter(indent=4)
-		pp.pprint(step_graph)
-		self.ordered_steps = toposort(self.dependency_graph, map(lambda s:s.__name__,self.sync_steps))
-		#self.ordered_steps = ['SyncRoles', 'SyncControllerSites', 'SyncControllerSitePrivileges','SyncImages', 'SyncControllerImages','SyncControllerUsers','SyncControllerUserSitePrivileges','SyncControllerSlices', 'SyncControllerSlicePrivileges', 'SyncControllerUserSlicePrivileges', 'SyncControllerNetworks','SyncSlivers']
-		#self.ordered_steps = ['SyncControllerSites','SyncControllerUsers','SyncControllerSlices','SyncControllerNetworks']
-		#self.ordered_steps = ['SyncSlivers','SyncNetworkSlivers']
+		dep_path = Config().observer_dependency_graph
+		backend_path = getattr(Config(), "observer_pl_dependency_graph", None)
+		cache_file = getattr(Config(), "observer_step_graph_cache", "/tmp/%sobserver_step_graph" % self.observer_name)
+		logger.info('Loading model dependency graph from %s' % dep_path)
+		self.step_graph = StepGraph.load(self.sync_steps, dep_path, backend_path, cache_file)
 
-		print "Order of steps=",self.ordered_steps
+		# This contains dependencies between records, not sync steps
+		self.model_dependency_graph = self.step_graph.model_dependency_graph
+		self.dependency_graph = self.step_graph.dependency_graph
+		self.deletion_dependency_graph = self.step_graph.deletion_dependency_graph
+		self.ordered_steps = self.step_graph.ordered_steps
+		logger.info("Order of steps: %s" % ", ".join(self.ordered_steps))
 
 		self.load_run_times()
-		
 
 	def check_duration(self, step, duration):
 		try:
@@ -210,16 +218,10 @@ class XOSObserver:
 			pass
 
 	def update_run_time(self, step, deletion):
-		if (not deletion):
-			self.last_run_times[step.__name__]=time.time()
-		else:
-			self.last_deletion_run_times[step.__name__]=time.time()
-
+		self.state.note_run(step.__name__, deletion)
 
 	def check_schedule(self, step, deletion):
-		last_run_times = self.last_run_times if not deletion else self.last_deletion_run_times
-
-		time_since_last_run = time.time() - last_run_times.get(step.__name__, 0)
+		time_since_last_run = time.time() - self.state.last_run(step.__name__, deletion)
 		try:
 			if (time_since_last_run < step.requested_interval):
 				raise StepNotReady
@@ -228,28 +230,14 @@ class XOSObserver:
 			raise StepNotReady
 	
 	def load_run_times(self):
-		try:
-			jrun_times = open('/tmp/%sobserver_run_times'%self.observer_name).read()
-			self.last_run_times = json.loads(jrun_times)
-		except:
-			self.last_run_times={}
-			for e in self.ordered_steps:
-				self.last_run_times[e]=0
-		try:
-			jrun_times = open('/tmp/%sobserver_deletion_run_times'%self.observer_name).read()
-			self.last_deletion_run_times = json.loads(jrun_times)
-		except:
-			self.last_deletion_run_times={}
-			for e in self.ordered_steps:
-				self.last_deletion_run_times[e]=0
-
+		# Run times live in the database, shared by every observer process
+		# and kept across restarts, see observer.state_store
+		flush_interval = float(getattr(Config(), "observer_state_flush_interval", DEFAULT_FLUSH_INTERVAL))
+		self.state = ObserverStateStore(self.observer_name, flush_interval)
+		self.state.load()
 
 	def save_run_times(self):
-		run_times = json.dumps(self.last_run_times)
-		open('/tmp/%sobserver_run_times'%self.observer_name,'w').write(run_times)
-
-		deletion_run_times = json.dumps(self.last_deletion_run_times)
-		open('/tmp/%sobserver_deletion_run_times'%self.observer_name,'w').write(deletion_run_times)
+		self.state.flush()
 
 	def check_class_dependency(self, step, failed_steps):
 		step.dependenices = []
@@ -262,65 +250,51 @@ class XOSObserver:
 				raise StepNotReady
 
 	def sync(self, S, deletion):
-            try:
 		step = self.step_lookup[S]
 		start_time=time.time()
+		# the step pool starts a step as soon as its dependencies are done
+		dep_wait = start_time - self.phase_start
+		run_stats = None
 
-                logger.info("Starting to work on step %s, deletion=%s" % (step.__name__, str(deletion)))
-		
-		dependency_graph = self.dependency_graph if not deletion else self.deletion_dependency_graph
-                step_conditions = self.step_conditions# if not deletion else self.deletion_step_conditions
-                step_status = self.step_status# if not deletion else self.deletion_step_status
-
-		# Wait for step dependencies to be met
-		try:
-			deps = dependency_graph[S]
-			has_deps = True
-		except KeyError:
-			has_deps = False
-
-		go = True
-
-                failed_dep = None
-		if (has_deps):
-			for d in deps:
-                                if d==step.__name__:
-                                    logger.info("   step %s self-wait skipped" % step.__name__)
-				    go = True
-                                    continue
-
-				cond = step_conditions[d]
-				cond.acquire()
-				if (step_status[d] is STEP_STATUS_WORKING):
-                                        logger.info("  step %s wait on dep %s" % (step.__name__, d))
-					cond.wait()
-				elif step_status[d] == STEP_STATUS_OK:
-					go = True
-				else:
-					go = False
-                        		failed_dep = d
-				cond.release()
-				if (not go):
-					break
-		else:
-			go = True
+		logger.info("Starting to work on step %s, deletion=%s" % (step.__name__, str(deletion)))
 
-		if (not go):
-                        print bcolors.FAIL + "Step %r skipped on %r" % (step,failed_dep) + bcolors.ENDC
-                        # SMBAKER: sync_step was not defined here, so I changed
-                        #    this from 'sync_step' to 'step'. Verify.
+		dependency_graph = self.dependency_graph if not deletion else self.deletion_dependency_graph
+		step_status = self.step_status
+
+		# The step pool only dispatches a step once all of its dependencies
+		# have finished, so here we just check how they fared.
+		failed_dep = None
+		for d in dependency_graph.get(S, []):
+			if d==step.__name__:
+				logger.info("   step %s self-wait skipped" % step.__name__)
+				continue
+			if step_status.get(d, STEP_STATUS_OK) == STEP_STATUS_KO:
+				failed_dep = d
+				break
+
+		if (failed_dep is not None):
+			print bcolors.FAIL + "Step %r skipped on %r" % (step,failed_dep) + bcolors.ENDC
 			self.failed_steps.append(step)
 			my_status = STEP_STATUS_KO
+			outcome = 'skipped'
+		elif (not self.step_has_changes(step)):
+			logger.info("Step %r skipped, none of its models changed" % step)
+			my_status = STEP_STATUS_OK
+			outcome = 'skipped'
+		elif (self.shard is not None) and (not self.shard.global_held) and (step.get_controller_path() is None):
+			# objects that aren't tied to a controller are synced by shard 0
+			my_status = STEP_STATUS_OK
+			outcome = 'skipped'
 		else:
-			sync_step = step(driver=self.driver,error_map=self.error_mapper)
+			sync_step = step(driver=self.driver,error_map=self.error_mapper,inventory=self.inventory,shard=self.shard)
 			sync_step. __name__= step.__name__
 			sync_step.dependencies = []
 			try:
 				mlist = sync_step.provides
 
 				for m in mlist:
-				        lst =  self.model_dependency_graph[m.__name__]
-			                nlst = map(lambda(a,b):b,lst)
+					lst =  self.model_dependency_graph[m.__name__]
+					nlst = map(lambda(a,b):b,lst)
 					sync_step.dependencies.extend(nlst)
 			except KeyError:
 				pass
@@ -337,51 +311,46 @@ class XOSObserver:
 				logger.info('Step not ready: %s'%sync_step.__name__)
 				self.failed_steps.append(sync_step)
 				my_status = STEP_STATUS_KO
+				outcome = 'skipped'
 			except Exception,e:
 				logger.error('%r' % e)
 				logger.log_exc("sync step failed: %r. Deletion: %r"%(sync_step,deletion))
 				self.failed_steps.append(sync_step)
 				my_status = STEP_STATUS_KO
+				outcome = 'error'
 
 			if (should_run):
 				try:
-					duration=time.time() - start_time
-
 					logger.info('Executing step %s' % sync_step.__name__)
 
 					print bcolors.OKBLUE + "Executing step %s" % sync_step.__name__ + bcolors.ENDC
 					failed_objects = sync_step(failed=list(self.failed_step_objects), deletion=deletion)
 
-					self.check_duration(sync_step, duration)
+					self.check_duration(sync_step, time.time() - start_time)
 
 					if failed_objects:
 						self.failed_step_objects.update(failed_objects)
 
-                                        logger.info("Step %r succeeded" % step)
-                                        print bcolors.OKGREEN + "Step %r succeeded" % step + bcolors.ENDC
+					logger.info("Step %r succeeded" % step)
+					print bcolors.OKGREEN + "Step %r succeeded" % step + bcolors.ENDC
 					my_status = STEP_STATUS_OK
+					outcome = 'ok'
 					self.update_run_time(sync_step,deletion)
 				except Exception,e:
-                        		print bcolors.FAIL + "Model step %r failed" % (step) + bcolors.ENDC
+					print bcolors.FAIL + "Model step %r failed" % (step) + bcolors.ENDC
 					logger.error('Model step %r failed. This seems like a misconfiguration or bug: %r. This error will not be relayed to the user!' % (step, e))
 					logger.log_exc(e)
 					self.failed_steps.append(S)
 					my_status = STEP_STATUS_KO
-			else:
-                                logger.info("Step %r succeeded due to non-run" % step)
-				my_status = STEP_STATUS_OK
+					outcome = 'error'
+				# steps that override call() don't report per-object figures
+				run_stats = getattr(sync_step, 'run_stats', None)
+			elif (my_status == STEP_STATUS_OK):
+				logger.info("Step %r succeeded due to non-run" % step)
+				outcome = 'skipped'
 
-		try:
-			my_cond = step_conditions[S]
-			my_cond.acquire()
-			step_status[S]=my_status
-			my_cond.notify_all()
-			my_cond.release()
-		except KeyError,e:
-			logger.info('Step %r is a leaf' % step)
-			pass
-            finally:
-                connection.close()
+		step_status[S]=my_status
+		metrics.record_step(step.__name__, deletion, outcome, time.time() - start_time, dep_wait, run_stats)
 
 	def run(self):
 		if not self.driver.enabled:
@@ -390,6 +359,18 @@ class XOSObserver:
 		if (self.driver_kind=="openstack") and (not self.driver.has_openstack):
 			return
 
+		pool_size = getattr(Config(), "observer_step_pool_size", DEFAULT_STEP_POOL_SIZE)
+		self.step_pool = StepPool(pool_size)
+		logger.info('Running steps on a pool of %d workers' % self.step_pool.size)
+
+		# also serves the status the XOS web UI shows, see core.views.observer
+		port = metrics_port(self.shard.index if (self.shard is not None) else 0)
+		if port:
+			start_metrics_server(metrics_address(), port)
+
+		if self.shard is not None:
+			self.shard.start_renewing()
+
 		while True:
 			try:
 				loop_start = time.time()
@@ -398,56 +379,45 @@ class XOSObserver:
 
 				logger.info('Waiting for event')
 				tBeforeWait = time.time()
-				self.wait_for_event(timeout=5)
+				if self.change_feed_active():
+					self.wait_for_event(timeout=self.full_pass_interval)
+				else:
+					self.wait_for_event(timeout=5)
 				logger.info('Observer woke up')
 
+				self.take_changes()
+				if (not self.full_pass):
+					logger.info('Changed models: %s' % ",".join(sorted(self.changed_models_this_pass)))
+
+				# What we learn about the controllers is shared by all
+				# the steps of this pass, and only this pass
+				self.inventory = Inventory(self.driver)
+
 				# Two passes. One for sync, the other for deletion.
 				for deletion in [False,True]:
 					# Set of individual objects within steps that failed
 					self.failed_step_objects = set()
 
-					# Set up conditions and step status
-					# This is needed for steps to run in parallel
-					# while obeying dependencies.
-
-					providers = set()
 					dependency_graph = self.dependency_graph if not deletion else self.deletion_dependency_graph
+					schedule = self.ordered_steps if not deletion else list(reversed(self.ordered_steps))
 
-					for v in dependency_graph.values():
-						if (v):
-							providers.update(v)
-
-					self.step_conditions = {}
 					self.step_status = {}
-
-					for p in list(providers):
-						self.step_conditions[p] = threading.Condition()
-
-						self.step_status[p] = STEP_STATUS_WORKING
+					for S in schedule:
+						self.step_status[S] = STEP_STATUS_WORKING
 
 					self.failed_steps = []
 
-					threads = []
 					logger.info('Deletion=%r...'%deletion)
-					schedule = self.ordered_steps if not deletion else reversed(self.ordered_steps)
-
-					for S in schedule:
-						thread = threading.Thread(target=self.sync, args=(S, deletion))
+					self.phase_start = time.time()
+					self.step_pool.run_dag(schedule, dependency_graph, lambda S: self.sync(S, deletion))
 
-						logger.info('Deletion=%r...'%deletion)
-						threads.append(thread)
+				self.inventory.invalidate()
 
-					# Start threads 
-					for t in threads:
-						t.start()
-
-					# Wait for all threads to finish before continuing with the run loop
-					for t in threads:
-						t.join()
-
-				self.save_run_times()
 				loop_end = time.time()
-				open('/tmp/%sobserver_last_run'%self.observer_name,'w').write(json.dumps({'last_run': loop_end, 'last_duration':loop_end - loop_start}))
+				self.state.note_pass(loop_end, loop_end - loop_start)
+				self.save_run_times()
+				metrics.record_pass(loop_end - loop_start, self.full_pass)
+				metrics.record_critical_path(*self.step_graph.critical_path(metrics.last_walls()))
 			except Exception, e:
 				logger.error('Core error. This seems like a misconfiguration or bug: %r. This error will not be relayed to the user!' % e)
 				logger.log_exc("Exception in observer run loop")
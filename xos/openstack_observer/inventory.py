@@ -0,0 +1,121 @@
+import threading
+from util.logger import Logger, logging
+
+logger = Logger(level=logging.INFO)
+
+class ControllerInventory:
+    """ Networks, ports, images and flavors of one controller, each listed
+        at most once and indexed by id and by name.
+    """
+
+    def __init__(self, driver, controller):
+        self.driver = driver
+        self.controller = controller
+        self.lock = threading.Lock()
+        self.lists = {}
+
+    def fetch(self, kind):
+        if (kind == 'networks'):
+            return self.driver.admin_driver(controller=self.controller, tenant='admin').shell.quantum.list_networks()['networks']
+        elif (kind == 'ports'):
+            return self.driver.admin_driver(controller=self.controller, tenant='admin').shell.quantum.list_ports()['ports']
+        elif (kind == 'images'):
+            return list(self.driver.admin_driver(controller=self.controller).shell.glanceclient.images.list())
+        elif (kind == 'flavors'):
+            return list(self.driver.admin_driver(controller=self.controller).shell.nova.flavors.list())
+        raise ValueError(kind)
+
+    def get(self, kind):
+        with self.lock:
+            if kind not in self.lists:
+                logger.info("Listing %s of controller %s" % (kind, self.controller))
+                self.lists[kind] = self.fetch(kind)
+            return self.lists[kind]
+
+    def forget(self, kinds):
+        """ Drop the listings of kinds, and their indexes """
+        with self.lock:
+            for key in self.lists.keys():
+                if (key in kinds) or (isinstance(key, tuple) and key[0] in kinds):
+                    del self.lists[key]
+
+    def index(self, kind, key):
+        """ dict of key -> item for the given kind of item. Neutron items
+            are dicts, glance and nova ones are objects """
+        index_key = (kind, key)
+        items = self.get(kind)
+        with self.lock:
+            if index_key not in self.lists:
+                by_key = {}
+                for item in items:
+                    if isinstance(item, dict):
+                        by_key[item.get(key)] = item
+                    else:
+                        by_key[getattr(item, key, None)] = item
+                self.lists[index_key] = by_key
+            return self.lists[index_key]
+
+    def networks(self):
+        return self.get('networks')
+
+    def ports(self):
+        return self.get('ports')
+
+    def images(self):
+        return self.get('images')
+
+    def flavors(self):
+        return self.get('flavors')
+
+    def network_by_id(self, id):
+        return self.index('networks', 'id').get(id)
+
+    def network_by_name(self, name):
+        return self.index('networks', 'name').get(name)
+
+    def port_by_id(self, id):
+        return self.index('ports', 'id').get(id)
+
+    def image_by_name(self, name):
+        return self.index('images', 'name').get(name)
+
+    def flavor_by_name(self, name):
+        return self.index('flavors', 'name').get(name)
+
+class Inventory:
+    """ What the observer knows about each controller during one pass.
+
+        The observer creates one per pass and hands it to every step, so
+        that steps share a single listing of each controller's networks,
+        ports, images and flavors. A step that changes some of those on a
+        controller calls invalidate(controller, kinds), and the next lookup
+        of those kinds lists them again; the others stay as they were.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.lock = threading.Lock()
+        self.controllers = {}
+
+    def get(self, controller):
+        with self.lock:
+            inventory = self.controllers.get(controller.id)
+            if (inventory is None):
+                inventory = ControllerInventory(self.driver, controller)
+                self.controllers[controller.id] = inventory
+            return inventory
+
+    def invalidate(self, controller=None, kinds=None):
+        """ Forget the kinds ('networks', 'ports', 'images', 'flavors') of
+            items listed for controller, by default all of them for every
+            controller """
+        with self.lock:
+            if (controller is None):
+                self.controllers.clear()
+                return
+            if (kinds is None):
+                self.controllers.pop(controller.id, None)
+                return
+            inventory = self.controllers.get(controller.id)
+        if (inventory is not None):
+            inventory.forget(kinds)
@@ -0,0 +1,302 @@
+import json
+import threading
+import time
+import urllib2
+import BaseHTTPServer
+from xos.config import Config
+from util.logger import Logger, logging
+
+logger = Logger(level=logging.INFO)
+
+# Upper bounds, in seconds, of the per-object sync latency buckets
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+DEFAULT_METRICS_ADDRESS = '127.0.0.1'
+DEFAULT_METRICS_PORT = 9180
+
+# seconds the XOS web UI waits for an observer's status
+STATUS_TIMEOUT = 2
+
+def metrics_address():
+    return getattr(Config(), "observer_metrics_address", DEFAULT_METRICS_ADDRESS)
+
+def metrics_port(offset=0):
+    """ The port of the metrics endpoint of an observer process, 0 if they
+        are turned off. Shard index of a sharded observer serves on the
+        configured port plus index, and its coordinator on the port after
+        the last shard's. """
+    # [observer] metrics_port=0 turns the metrics endpoint off
+    port = int(getattr(Config(), "observer_metrics_port", DEFAULT_METRICS_PORT))
+    return (port + offset) if port else 0
+
+def fetch_status(port):
+    """ The status (see ObserverMetrics.snapshot()) the observer process
+        serving on port reports, or None if it can't be reached """
+    if not port:
+        return None
+    try:
+        return json.loads(urllib2.urlopen('http://%s:%d/status' % (metrics_address(), port), timeout=STATUS_TIMEOUT).read())
+    except (IOError, ValueError):
+        return None
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for (i, bound) in enumerate(self.buckets):
+            if (value <= bound):
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other):
+        for i in range(len(self.counts)):
+            self.counts[i] += other.counts[i]
+        self.count += other.count
+        self.sum += other.sum
+
+    def cumulative(self):
+        """ (le, count) pairs, Prometheus style, ending with +Inf """
+        total = 0
+        pairs = []
+        for (bound, count) in zip(self.buckets, self.counts):
+            total += count
+            pairs.append((bound, total))
+        pairs.append(('+Inf', self.count))
+        return pairs
+
+    def to_dict(self):
+        return {'buckets': [[str(le), n] for (le, n) in self.cumulative()],
+                'count': self.count,
+                'sum': self.sum}
+
+class StepRun:
+    """ What one run of a sync step did with its pending objects. Every
+        object it fetched ends up synced, failed or backed off. """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.synced = 0
+        self.failed = 0
+        self.backed_off = 0
+        self.latency = Histogram()
+
+    def record_synced(self, latency):
+        with self.lock:
+            self.synced += 1
+            self.latency.observe(latency)
+
+    def record_failed(self, latency):
+        with self.lock:
+            self.failed += 1
+            self.latency.observe(latency)
+
+    def record_backed_off(self):
+        with self.lock:
+            self.backed_off += 1
+
+    @property
+    def pending(self):
+        return self.synced + self.failed + self.backed_off
+
+class ObserverMetrics:
+    """ Totals over the life of the observer, per step and per pass, plus
+        the figures of the last run of each. """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.steps = {}
+        self.passes = {'count': 0, 'full': 0, 'duration_total': 0.0,
+                       'last_duration': 0.0, 'last_run': 0}
+        self.critical_path = {'seconds': 0.0, 'steps': []}
+        self.sources = {}
+
+    def add_source(self, name, source):
+        """ Report source(), e.g. the model policy backlog, as name in the
+            status of this process """
+        with self.lock:
+            self.sources[name] = source
+
+    def step_totals(self, name, phase):
+        key = (name, phase)
+        if key not in self.steps:
+            self.steps[key] = {'runs': 0, 'errors': 0, 'skipped': 0,
+                               'wall_total': 0.0, 'dep_wait_total': 0.0,
+                               'synced': 0, 'failed': 0, 'backed_off': 0,
+                               'last': {}, 'latency': Histogram()}
+        return self.steps[key]
+
+    def record_step(self, name, deletion, status, wall, dep_wait, run=None):
+        """ status is 'ok', 'error' (the step itself raised or could not run)
+            or 'skipped' (nothing to do, or a step it depends on failed) """
+        phase = 'delete' if deletion else 'sync'
+        with self.lock:
+            totals = self.step_totals(name, phase)
+            if (status == 'skipped'):
+                totals['skipped'] += 1
+            else:
+                totals['runs'] += 1
+                if (status == 'error'):
+                    totals['errors'] += 1
+            totals['wall_total'] += wall
+            totals['dep_wait_total'] += dep_wait
+            last = {'status': status, 'at': time.time(), 'wall': wall, 'dep_wait': dep_wait}
+            if run is not None:
+                totals['synced'] += run.synced
+                totals['failed'] += run.failed
+                totals['backed_off'] += run.backed_off
+                totals['latency'].merge(run.latency)
+                last.update(pending=run.pending, synced=run.synced,
+                            failed=run.failed, backed_off=run.backed_off)
+            totals['last'] = last
+
+    def record_pass(self, duration, full):
+        with self.lock:
+            self.passes['count'] += 1
+            if full:
+                self.passes['full'] += 1
+            self.passes['duration_total'] += duration
+            self.passes['last_duration'] = duration
+            self.passes['last_run'] = time.time()
+
+    def last_walls(self, deletion=False):
+        """ {step name: wall time of its last run} """
+        phase = 'delete' if deletion else 'sync'
+        with self.lock:
+            return dict([(name, totals['last'].get('wall', 0)) for ((name, p), totals) in self.steps.items() if p == phase])
+
+    def record_critical_path(self, seconds, steps):
+        """ The chain of dependent steps that took longest in the last pass """
+        with self.lock:
+            self.critical_path = {'seconds': seconds, 'steps': steps}
+
+    def snapshot(self):
+        from observer.ansible import skip_stats
+        with self.lock:
+            steps = {}
+            for ((name, phase), totals) in self.steps.items():
+                s = dict(totals, latency=totals['latency'].to_dict())
+                steps.setdefault(name, {})[phase] = s
+            snapshot = {'started': self.started,
+                        'passes': dict(self.passes),
+                        'steps': steps,
+                        'critical_path': dict(self.critical_path),
+                        'ansible': skip_stats()}
+            sources = self.sources.items()
+        for (name, source) in sources:
+            snapshot[name] = source()
+        return snapshot
+
+    def prometheus(self):
+        """ The metrics in the Prometheus text exposition format """
+        snapshot = self.snapshot()
+        lines = []
+        def metric(name, kind, help, samples):
+            lines.append('# HELP xos_observer_%s %s' % (name, help))
+            lines.append('# TYPE xos_observer_%s %s' % (name, kind))
+            for (suffix, labels, value) in samples:
+                label_str = ','.join(['%s="%s"' % (k, labels[k]) for k in sorted(labels)])
+                if label_str:
+                    label_str = '{%s}' % label_str
+                lines.append('xos_observer_%s%s%s %s' % (name, suffix, label_str, value))
+
+        passes = snapshot['passes']
+        metric('passes_total', 'counter', 'Observer passes completed.',
+               [('', {}, passes['count'])])
+        metric('full_passes_total', 'counter', 'Observer passes that ran every step.',
+               [('', {}, passes['full'])])
+        metric('pass_seconds_total', 'counter', 'Time spent in observer passes.',
+               [('', {}, passes['duration_total'])])
+        metric('last_pass_seconds', 'gauge', 'Duration of the last observer pass.',
+               [('', {}, passes['last_duration'])])
+        metric('last_pass_timestamp_seconds', 'gauge', 'When the last observer pass ended.',
+               [('', {}, passes['last_run'])])
+
+        metric('critical_path_seconds', 'gauge', 'Time taken by the slowest chain of dependent steps in the last pass.',
+               [('', {}, snapshot['critical_path']['seconds'])])
+
+        steps = []
+        for (name, phases) in sorted(snapshot['steps'].items()):
+            for (phase, s) in sorted(phases.items()):
+                steps.append(({'step': name, 'phase': phase}, s))
+
+        metric('step_runs_total', 'counter', 'Sync step runs.',
+               [('', l, s['runs']) for (l, s) in steps])
+        metric('step_errors_total', 'counter', 'Sync step runs that failed as a whole.',
+               [('', l, s['errors']) for (l, s) in steps])
+        metric('step_skipped_total', 'counter', 'Sync steps skipped, for lack of changes or because a dependency failed.',
+               [('', l, s['skipped']) for (l, s) in steps])
+        metric('step_seconds_total', 'counter', 'Wall time spent in sync steps.',
+               [('', l, s['wall_total']) for (l, s) in steps])
+        metric('step_dependency_wait_seconds_total', 'counter', 'Time sync steps waited for the steps they depend on.',
+               [('', l, s['dep_wait_total']) for (l, s) in steps])
+        metric('step_last_seconds', 'gauge', 'Wall time of the last run of a sync step.',
+               [('', l, s['last'].get('wall', 0)) for (l, s) in steps])
+        metric('step_last_pending', 'gauge', 'Objects pending at the last run of a sync step.',
+               [('', l, s['last'].get('pending', 0)) for (l, s) in steps])
+        objects = []
+        for (l, s) in steps:
+            for outcome in ['synced', 'failed', 'backed_off']:
+                objects.append(('', dict(l, outcome=outcome), s[outcome]))
+        metric('step_objects_total', 'counter', 'Objects handled by sync steps, by outcome.', objects)
+
+        latency = []
+        for (l, s) in steps:
+            for (le, n) in s['latency']['buckets']:
+                latency.append(('_bucket', dict(l, le=le), n))
+            latency.append(('_sum', l, s['latency']['sum']))
+            latency.append(('_count', l, s['latency']['count']))
+        metric('object_sync_seconds', 'histogram', 'Time to sync one object.', latency)
+
+        templates = []
+        for (name, s) in sorted(snapshot['ansible'].items()):
+            templates.append(('', {'template': name, 'outcome': 'run'}, s['runs']))
+            templates.append(('', {'template': name, 'outcome': 'skipped'}, s['skipped']))
+        metric('ansible_playbooks_total', 'counter', 'Ansible playbooks rendered, run or skipped as unchanged.', templates)
+
+        return '\n'.join(lines) + '\n'
+
+metrics = ObserverMetrics()
+
+class MetricsHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if (path in ['/', '/metrics']):
+            body = metrics.prometheus()
+            content_type = 'text/plain; version=0.0.4'
+        elif (path == '/status'):
+            # what the XOS web UI shows, see core.views.observer
+            body = json.dumps(metrics.snapshot())
+            content_type = 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # scraped every few seconds, keep it out of the observer log
+        pass
+
+def start_metrics_server(address=DEFAULT_METRICS_ADDRESS, port=DEFAULT_METRICS_PORT):
+    """ Serve the metrics over HTTP from a daemon thread. Returns the server,
+        or None if it could not be started; the observer runs on without it. """
+    try:
+        server = BaseHTTPServer.HTTPServer((address, int(port)), MetricsHandler)
+    except Exception:
+        logger.log_exc("Could not start the observer metrics server on %s:%s" % (address, port))
+        return None
+    t = threading.Thread(target=server.serve_forever, name="metrics-server")
+    t.daemon = True
+    t.start()
+    logger.info("Serving observer metrics on http://%s:%d/metrics" % server.server_address)
+    return server
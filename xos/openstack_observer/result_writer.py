@@ -0,0 +1,85 @@
+import threading
+from collections import defaultdict
+from django.utils import timezone
+from util.logger import Logger, logging
+
+logger = Logger(level=logging.INFO)
+
+DEFAULT_BATCH_SIZE = 500
+
+# keep IN (...) lists to a size every backend is happy with
+MAX_IDS_PER_UPDATE = 1000
+
+class SyncResultWriter:
+    """ Collects the outcome of a sync step for each of its objects and
+        writes it back in bulk.
+
+        Objects of the same model that end up with identical field values
+        (every successful object, and typically every object that failed
+        for the same reason) are written with a single UPDATE ... WHERE id
+        IN (...), instead of one save() per object.
+
+        Objects updated since started, the time the step fetched them, are
+        left alone: whoever changed them made them pending again, and they
+        must be synced again. Only the step's own saves of an object, which
+        it already knows about, don't count.
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, started=None):
+        self.batch_size = batch_size
+        self.started = started or timezone.now()
+        self.pending = defaultdict(list)
+        self.count = 0
+        # steps with concurrency > 1 report results from several threads
+        self.lock = threading.RLock()
+
+    def enacted(self, obj, **fields):
+        """ Record that obj was enacted. enacted itself is stamped with the
+            flush time, which is always later than any save sync_record did.
+        """
+        self.add(obj, True, fields)
+
+    def update(self, obj, **fields):
+        self.add(obj, False, fields)
+
+    def add(self, obj, enacted, fields):
+        # Keep the in-memory object consistent with what will be written
+        for (k, v) in fields.items():
+            setattr(obj, k, v)
+        if enacted:
+            obj.enacted = timezone.now()
+
+        if not obj.pk:
+            return
+
+        # the latest 'updated' the row may have for the results to apply
+        not_after = self.started
+        if (getattr(obj, 'updated', None) is not None) and (obj.updated > not_after):
+            # saved by the step itself
+            not_after = obj.updated
+
+        key = (obj.__class__, enacted, tuple(sorted(fields.items())), not_after)
+        with self.lock:
+            self.pending[key].append(obj.pk)
+            self.count += 1
+            if (self.count >= self.batch_size):
+                self.flush()
+
+    def flush(self):
+        with self.lock:
+            pending = self.pending
+            self.pending = defaultdict(list)
+            self.count = 0
+
+        now = timezone.now()
+        for ((model, enacted, items, not_after), pks) in pending.items():
+            fields = dict(items)
+            if enacted:
+                fields['enacted'] = now
+            for i in range(0, len(pks), MAX_IDS_PER_UPDATE):
+                try:
+                    # _base_manager, so that no custom manager filter can
+                    # hide objects we were handed by fetch_pending
+                    model._base_manager.filter(pk__in=pks[i:i+MAX_IDS_PER_UPDATE], updated__lte=not_after).update(**fields)
+                except Exception:
+                    logger.log_exc("Could not write back sync results for %d %s objects" % (len(pks[i:i+MAX_IDS_PER_UPDATE]), model.__name__))
@@ -0,0 +1,156 @@
+import os
+import socket
+import time
+import threading
+from django.db import IntegrityError, connection
+from django.db.models import Q
+from django.db.transaction import atomic
+from core.models import Controller, ObserverLease
+from util.logger import Logger, logging
+
+logger = Logger(level=logging.INFO)
+
+DEFAULT_LEASE_TTL = 600
+
+# the lease on objects that aren't tied to any controller (users, sites,
+# images, ...), held by shard 0
+GLOBAL_RESOURCE = 'global'
+
+def controller_resource(controller_id):
+    return 'controller:%d' % controller_id
+
+def acquire_leases(resources, holder, ttl):
+    """ Take or renew the leases on resources for holder, for ttl seconds.
+        A lease held by someone else is only taken over once it has
+        expired. Returns the set of resources holder now holds. """
+    if not resources:
+        return set()
+    now = time.time()
+
+    existing = set(ObserverLease.objects.filter(resource__in=resources).values_list('resource', flat=True))
+    for r in resources:
+        if r not in existing:
+            try:
+                with atomic():
+                    ObserverLease.objects.create(resource=r, holder=holder, expires=now + ttl)
+            except IntegrityError:
+                # another process got there first
+                pass
+
+    # Postgres re-checks the WHERE clause of a row another transaction
+    # just updated, so only one process can take over an expired lease
+    ObserverLease.objects.filter(resource__in=resources).filter(Q(holder=holder) | Q(expires__lt=now)).update(holder=holder, expires=now + ttl)
+    return set(ObserverLease.objects.filter(resource__in=resources, holder=holder).values_list('resource', flat=True))
+
+def release_leases(resources, holder):
+    if resources:
+        ObserverLease.objects.filter(resource__in=resources, holder=holder).update(expires=0)
+
+def release_holder(holder):
+    """ Give up every lease of holder, e.g. of a shard process that died """
+    ObserverLease.objects.filter(holder=holder).update(expires=0)
+
+def shard_holder(index, count, pid=None):
+    """ Who holds the leases of shard index/count running as process pid """
+    return '%s:%d:%d/%d' % (socket.gethostname(), pid or os.getpid(), index, count)
+
+class Shard(object):
+    """ The share of the work of one process of a sharded observer.
+
+        Controllers are spread over the count shards by id, and shard 0
+        also syncs everything that isn't tied to a controller. A shard only
+        syncs for what it holds a lease on, so two processes never sync
+        the same objects, even while shards are being restarted or their
+        count changed.
+
+        start_renewing() renews the leases every ttl/3 seconds in the
+        background. Once they are past their expiry, controller_ids and
+        global_held are empty until a renewal succeeds.
+    """
+
+    def __init__(self, index, count, ttl=DEFAULT_LEASE_TTL):
+        self.index = index
+        self.count = count
+        self.ttl = ttl
+        self.holder = shard_holder(index, count)
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.drop()
+
+    def drop(self):
+        self.held = set()
+        self.expires = 0
+        self._controller_ids = set()
+        self._global_held = False
+
+    def valid(self):
+        return (time.time() < self.expires)
+
+    @property
+    def controller_ids(self):
+        return self._controller_ids if self.valid() else set()
+
+    @property
+    def global_held(self):
+        return self._global_held and self.valid()
+
+    def __repr__(self):
+        return 'shard %d/%d' % (self.index, self.count)
+
+    def wanted(self):
+        resources = [controller_resource(c) for c in Controller.objects.values_list('id', flat=True) if (c % self.count == self.index)]
+        if (self.index == 0):
+            resources.append(GLOBAL_RESOURCE)
+        return resources
+
+    def refresh(self):
+        """ Renew the leases of this shard, take the ones that are due to it
+            and free, and give up the ones that are no longer its share.
+            Must be called more often than every ttl seconds. """
+        with self.lock:
+            # the leases run from before they were taken
+            start = time.time()
+            try:
+                wanted = self.wanted()
+                held = acquire_leases(wanted, self.holder, self.ttl)
+                release_leases(list(self.held - set(wanted)), self.holder)
+            except:
+                # we can't tell what we hold any more
+                self.drop()
+                raise
+
+            missing = set(wanted) - held
+            if missing:
+                logger.info("%r: waiting for leases on %s" % (self, ", ".join(sorted(missing))))
+
+            self.held = held
+            self.expires = start + self.ttl
+            self._global_held = (GLOBAL_RESOURCE in held)
+            self._controller_ids = set([int(r.split(':')[1]) for r in held if r.startswith('controller:')])
+
+    def renew(self):
+        while not self.stopped.wait(self.ttl / 3.0):
+            try:
+                self.refresh()
+            except Exception:
+                logger.log_exc("%r: could not renew leases" % self)
+                connection.close()
+
+    def start_renewing(self):
+        """ Take the leases now, and keep renewing them in the background
+            until release() """
+        try:
+            self.refresh()
+        except Exception:
+            logger.log_exc("%r: could not take leases" % self)
+            connection.close()
+        t = threading.Thread(target=self.renew, name="shard-leases")
+        t.daemon = True
+        t.start()
+
+    def release(self):
+        self.stopped.set()
+        with self.lock:
+            held = list(self.held)
+            self.drop()
+        release_leases(held, self.holder)
@@ -0,0 +1,123 @@
+import json
+import threading
+import time
+from django.db import connection
+from django.db.transaction import atomic
+from core.models import ObserverState
+from core.models.observerstate import PASS_STEP
+from util.logger import Logger, logging
+
+logger = Logger(level=logging.INFO)
+
+DEFAULT_FLUSH_INTERVAL = 10
+
+class ObserverStateStore:
+    """ When each step of an observer last ran, and when its last pass
+        ended, kept in memory and written to ObserverState in batches:
+        flush() writes whatever changed since the last write, at most once
+        every flush_interval seconds.
+    """
+
+    def __init__(self, observer_name, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.observer = observer_name
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.states = {}        # step -> {field: value}
+        self.stored = set()     # steps that have a row already
+        self.dirty = set()
+        self.last_flush = 0
+
+    def state(self, step):
+        if step not in self.states:
+            self.states[step] = {'last_run': 0, 'last_deletion_run': 0, 'last_duration': 0}
+        return self.states[step]
+
+    def load(self):
+        try:
+            rows = list(ObserverState.objects.filter(observer=self.observer))
+        except Exception:
+            logger.log_exc("Could not load the state of observer %r" % self.observer)
+            connection.close()
+            rows = []
+
+        with self.lock:
+            for row in rows:
+                self.states[row.step] = {'last_run': row.last_run,
+                                         'last_deletion_run': row.last_deletion_run,
+                                         'last_duration': row.last_duration}
+                self.stored.add(row.step)
+
+        if not rows:
+            self.import_files()
+
+    def import_files(self):
+        # carry over what observers that kept their state in /tmp left there
+        for (fn, field) in [('/tmp/%sobserver_run_times', 'last_run'),
+                            ('/tmp/%sobserver_deletion_run_times', 'last_deletion_run')]:
+            try:
+                run_times = json.loads(open(fn % self.observer).read())
+            except (IOError, ValueError):
+                continue
+            with self.lock:
+                for (step, t) in run_times.items():
+                    self.state(step)[field] = t
+                    self.dirty.add(step)
+
+    def last_run(self, step, deletion=False):
+        with self.lock:
+            state = self.states.get(step)
+            if state is None:
+                return 0
+            return state['last_deletion_run' if deletion else 'last_run']
+
+    def note_run(self, step, deletion=False, when=None):
+        with self.lock:
+            self.state(step)['last_deletion_run' if deletion else 'last_run'] = when or time.time()
+            self.dirty.add(step)
+
+    def note_pass(self, end, duration):
+        with self.lock:
+            state = self.state(PASS_STEP)
+            state['last_run'] = end
+            state['last_duration'] = duration
+            self.dirty.add(PASS_STEP)
+
+    def flush(self, force=False):
+        if (not force) and (time.time() - self.last_flush < self.flush_interval):
+            return
+
+        with self.lock:
+            dirty = self.dirty
+            self.dirty = set()
+            values = dict([(step, dict(self.states[step])) for step in dirty])
+            stored = set(self.stored)
+        if not dirty:
+            return
+
+        self.last_flush = time.time()
+        try:
+            with atomic():
+                new = []
+                for step in dirty:
+                    if (step in stored):
+                        ObserverState.objects.filter(observer=self.observer, step=step).update(**values[step])
+                    else:
+                        new.append(ObserverState(observer=self.observer, step=step, **values[step]))
+                if new:
+                    ObserverState.objects.bulk_create(new)
+        except Exception:
+            logger.log_exc("Could not save the state of observer %r" % self.observer)
+            connection.close()
+            # try again next time, with rows another process may have created
+            with self.lock:
+                self.dirty.update(dirty)
+            try:
+                steps = ObserverState.objects.filter(observer=self.observer).values_list('step', flat=True)
+                with self.lock:
+                    self.stored.update(steps)
+            except Exception:
+                connection.close()
+            return
+
+        with self.lock:
+            self.stored.update(dirty)
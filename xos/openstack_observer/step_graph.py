@@ -0,0 +1,155 @@
+import hashlib
+import inspect
+import json
+from toposort import toposort, CycleError
+from util.logger import Logger, logging
+
+logger = Logger(level=logging.INFO)
+
+def invert_graph(g):
+    ig = {}
+    for k,v in g.items():
+        for v0 in v:
+            ig.setdefault(v0, []).append(k)
+    return ig
+
+def read_model_deps(dep_path, backend_path=None):
+    """ The model dependency graph, as {model: [(dep, dep.lower()), ...]},
+        with the backend dependency graph merged in if there is one. Every
+        model that is depended upon has an entry. """
+    model_deps = json.loads(open(dep_path).read())
+    if backend_path:
+        try:
+            # This contains dependencies between backend records
+            for (k, v) in json.loads(open(backend_path).read()).items():
+                model_deps.setdefault(k, []).extend(v)
+        except (IOError, ValueError):
+            logger.info('Backend dependency graph not loaded')
+
+    graph = {}
+    for (left, lst) in model_deps.items():
+        graph[left] = [(k, k.lower()) for k in lst]
+        for k in lst:
+            graph.setdefault(k, [])
+    return graph
+
+def build_step_graph(model_graph, provides):
+    """ {step: [steps it depends on]}, given which steps provide each model.
+        A step depends on the steps that provide the models its own models
+        depend on. """
+    step_graph = {}
+    for (model, deps) in model_graph.items():
+        for source in provides.get(model, []):
+            edges = step_graph.setdefault(source, [])
+            for (m, _) in deps:
+                for dest in provides.get(m, []):
+                    if (dest not in edges):
+                        edges.append(dest)
+    return step_graph
+
+def critical_path(g, weights):
+    """ The chain of dependent steps in g with the largest total weight,
+        which bounds how fast a pass can be however many steps run at
+        once. Returns (total weight, [steps, first to run first]). """
+    order = toposort(g)
+    finish = {}
+    previous = {}
+    for n in order:
+        best = None
+        for m in g.get(n, []):
+            if (m != n) and ((best is None) or (finish[m] > finish[best])):
+                best = m
+        previous[n] = best
+        finish[n] = weights.get(n, 0) + (finish[best] if best is not None else 0)
+
+    if not finish:
+        return (0, [])
+    n = max(finish, key=lambda k: finish[k])
+    total = finish[n]
+    path = []
+    while n is not None:
+        path.append(n)
+        n = previous[n]
+    path.reverse()
+    return (total, path)
+
+class StepGraph:
+    """ The dependency graph of an observer's sync steps, and the order
+        they run in.
+
+        Building it only depends on the step sources and the dependency
+        graph files, so it is cached in cache_file, keyed on a hash of
+        their contents, and only rebuilt when one of them changes.
+    """
+
+    def __init__(self, model_dependency_graph, dependency_graph, ordered_steps):
+        self.model_dependency_graph = model_dependency_graph
+        self.dependency_graph = dependency_graph
+        self.deletion_dependency_graph = invert_graph(dependency_graph)
+        self.ordered_steps = ordered_steps
+
+    @classmethod
+    def build(cls, steps, dep_path, backend_path=None):
+        model_graph = read_model_deps(dep_path, backend_path)
+
+        provides = {}
+        for s in steps:
+            for m in s.provides:
+                provides.setdefault(m.__name__, []).append(s.__name__)
+
+        step_graph = build_step_graph(model_graph, provides)
+        # raises CycleError, naming the steps on the cycle
+        ordered_steps = toposort(step_graph, [s.__name__ for s in steps])
+        return cls(model_graph, step_graph, ordered_steps)
+
+    @staticmethod
+    def cache_key(steps, paths):
+        digest = hashlib.sha1()
+        sources = set()
+        for s in steps:
+            try:
+                sources.add(inspect.getsourcefile(s))
+            except TypeError:
+                pass
+        for fn in sorted(sources) + [p for p in paths if p]:
+            digest.update(fn)
+            try:
+                digest.update(open(fn).read())
+            except IOError:
+                pass
+        # the class names too, steps can come and go within a file
+        digest.update(",".join(sorted([s.__name__ for s in steps])))
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, steps, dep_path, backend_path=None, cache_file=None):
+        key = cls.cache_key(steps, [dep_path, backend_path])
+        if cache_file:
+            try:
+                cached = json.loads(open(cache_file).read())
+                if (cached['key'] == key):
+                    model_graph = dict([(k, [tuple(d) for d in v]) for (k, v) in cached['model_dependency_graph'].items()])
+                    return cls(model_graph, cached['dependency_graph'], cached['ordered_steps'])
+            except (IOError, ValueError, KeyError):
+                pass
+
+        graph = cls.build(steps, dep_path, backend_path)
+        logger.info('Built step graph: %s' % json.dumps(graph.dependency_graph, sort_keys=True))
+        if cache_file:
+            try:
+                open(cache_file, 'w').write(json.dumps({'key': key,
+                                                        'model_dependency_graph': graph.model_dependency_graph,
+                                                        'dependency_graph': graph.dependency_graph,
+                                                        'ordered_steps': graph.ordered_steps}))
+            except IOError:
+                logger.log_exc("Could not cache the step graph in %s" % cache_file)
+        return graph
+
+    def critical_path(self, weights=None):
+        """ critical_path() of the sync dependency graph. weights maps
+            step names to their duration; without them every step counts
+            for 1, which gives the longest chain of dependent steps. """
+        if weights is None:
+            weights = dict([(s, 1) for s in self.ordered_steps])
+        graph = dict([(s, self.dependency_graph.get(s, [])) for s in self.ordered_steps])
+        return critical_path(graph, weights)
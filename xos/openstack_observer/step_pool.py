@@ -0,0 +1,124 @@
+import threading
+import Queue
+from collections import defaultdict
+from django.db import connection
+from util.logger import Logger, logging
+
+logger = Logger(level=logging.INFO)
+
+def reset_connection_if_unusable():
+	# Worker threads are long-lived, so each one keeps its Django connection
+	# open across passes. Only drop it if the server went away underneath us.
+	try:
+		if (connection.connection is not None) and (not connection.is_usable()):
+			connection.close()
+	except Exception:
+		connection.close()
+
+def run_concurrently(items, fn, size):
+	""" Call fn(item) for every item, on at most size threads at once, and
+	    wait for all of them. The threads are short-lived, so each one closes
+	    its own database connection when it is done.
+	"""
+	work = Queue.Queue()
+	for item in items:
+		work.put(item)
+
+	def run():
+		try:
+			while True:
+				try:
+					item = work.get_nowait()
+				except Queue.Empty:
+					return
+				try:
+					fn(item)
+				except Exception:
+					logger.log_exc("%r raised out of run_concurrently" % item)
+		finally:
+			connection.close()
+
+	threads = []
+	for i in range(max(1, min(int(size), len(items)))):
+		t = threading.Thread(target=run, name="record-worker-%d" % i)
+		t.daemon = True
+		t.start()
+		threads.append(t)
+	for t in threads:
+		t.join()
+
+class StepPool:
+	""" A bounded set of long-lived threads that run observer steps.
+
+	    Steps are scheduled as a DAG: a step is only handed to a worker once
+	    every step it depends on has finished. Workers therefore never sit
+	    blocked waiting for each other, and the pool size bounds both the
+	    number of steps running at once and the number of open database
+	    connections.
+	"""
+
+	def __init__(self, size):
+		self.size = max(1, int(size))
+		self.tasks = Queue.Queue()
+		self.workers = []
+		for i in range(self.size):
+			t = threading.Thread(target=self.work, name="step-worker-%d" % i)
+			t.daemon = True
+			t.start()
+			self.workers.append(t)
+
+	def work(self):
+		while True:
+			(fn, node, done) = self.tasks.get()
+			reset_connection_if_unusable()
+			try:
+				fn(node)
+			except Exception:
+				logger.log_exc("Step %s raised out of the step pool" % node)
+				# the transaction may have been left in an aborted state
+				connection.close()
+			done.put(node)
+
+	def run_dag(self, nodes, deps, fn):
+		""" Call fn(node) for every node in nodes, starting a node only once
+		    all of deps[node] that are also in nodes have completed. Ready
+		    nodes are dispatched in the order given by nodes. Blocks until
+		    every node has run.
+		"""
+		nodes = list(nodes)
+		node_set = set(nodes)
+
+		waiting = {}
+		dependents = defaultdict(list)
+		for n in nodes:
+			n_deps = set([d for d in deps.get(n, []) if d in node_set and d != n])
+			waiting[n] = len(n_deps)
+			for d in n_deps:
+				dependents[d].append(n)
+
+		done = Queue.Queue()
+		started = set()
+		in_flight = [0]
+
+		def dispatch(n):
+			started.add(n)
+			in_flight[0] += 1
+			self.tasks.put((fn, n, done))
+
+		for n in nodes:
+			if (not waiting[n]):
+				dispatch(n)
+
+		remaining = len(nodes)
+		while remaining:
+			# nodes come from toposort, which refuses cycles, so something
+			# is always running while steps are left
+			assert in_flight[0], 'steps %s wait on each other' % [x for x in nodes if x not in started]
+
+			n = done.get()
+			in_flight[0] -= 1
+			remaining -= 1
+			for m in dependents[n]:
+				waiting[m] -= 1
+				if (waiting[m] <= 0) and (m not in started):
+					dispatch(m)
@@ -11,6 +11,7 @@ class SyncRoles(OpenStackSyncStep):
     provides=[User]
     requested_interval=0
     observes=User
+    poll_external=True
 
     def fetch_pending(self, deleted):
         if (deleted):
@@ -13,13 +13,17 @@ class SyncControllerImages(OpenStackSyncStep):
     provides=[ControllerImages]
     observes = ControllerImages
     requested_interval=0
+    template_path='controller_images'
+
+    def ansible_tag(self, controller_image):
+        return '%s@%s'%(controller_image.image.name,controller_image.controller.name)
 
     def fetch_pending(self, deleted):
         if (deleted):
             return []
 
         # now we return all images that need to be enacted
-        return ControllerImages.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
+        return ControllerImages.objects.filter(pending_sync=True)
 
     def sync_record(self, controller_image):
         logger.info("Working on image %s on controller %s" % (controller_image.image.name, controller_image.controller))
@@ -28,11 +32,12 @@ class SyncControllerImages(OpenStackSyncStep):
                         'admin_password':controller_image.controller.admin_password,
                         'name':controller_image.image.name,
                         'filepath':controller_image.image.path,
-                        'ansible_tag': '%s@%s'%(controller_image.image.name,controller_image.controller.name), # name of ansible playbook
+                        'ansible_tag': self.ansible_tag(controller_image), # name of ansible playbook
                         }
 
 
-        res = run_template('sync_controller_images.yaml', image_fields, path='controller_images', expected_num=1)
+        res = run_template('sync_controller_images.yaml', image_fields, path=self.template_path, expected_num=1, force=not controller_image.enacted)
+        self.inventory.invalidate(controller_image.controller, ['images'])
 
         image_id = res[0]['id']
         controller_image.glance_image_id = image_id
@@ -18,6 +18,7 @@ class SyncControllerNetworks(OpenStackSyncStep):
     requested_interval = 0
     provides=[Network]
     observes=ControllerNetwork	
+    template_path='controller_networks'
 
     def alloc_subnet(self, uuid):
         # 16 bits only
@@ -35,9 +36,15 @@ class SyncControllerNetworks(OpenStackSyncStep):
         if (deleted):
             return ControllerNetwork.deleted_objects.all()
         else:
-            return ControllerNetwork.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
+            return ControllerNetwork.objects.filter(pending_sync=True)
 
 
+    def ansible_tag(self, controller_network):
+        slices = controller_network.network.slices.all()
+        if (not slices):
+            return None
+        return '%s-%s@%s'%(controller_network.network.name,slices[0].slicename,controller_network.controller.name)
+
     def save_controller_network(self, controller_network):
         network_name = controller_network.network.name
         subnet_name = '%s-%d'%(network_name,controller_network.pk)
@@ -50,11 +57,12 @@ class SyncControllerNetworks(OpenStackSyncStep):
                     'admin_password':slice.creator.remote_password,
                     'name':network_name,
                     'subnet_name':subnet_name,
-                    'ansible_tag':'%s-%s@%s'%(network_name,slice.slicename,controller_network.controller.name),
+                    'ansible_tag':self.ansible_tag(controller_network),
                     'cidr':cidr
                     }
 
-        res = run_template('sync_controller_networks.yaml', network_fields, path = 'controller_networks',expected_num=2)
+        res = run_template('sync_controller_networks.yaml', network_fields, path = self.template_path,expected_num=2, force=not controller_network.enacted)
+        self.inventory.invalidate(controller_network.controller, ['networks', 'ports'])
 
         network_id = res[0]['id']
         subnet_id = res[1]['id']
@@ -88,3 +96,4 @@ class SyncControllerNetworks(OpenStackSyncStep):
             driver.delete_router(controller_network.router_id)
         if controller_network.net_id:
             driver.delete_network(controller_network.net_id)
+        self.inventory.invalidate(controller_network.controller, ['networks', 'ports'])
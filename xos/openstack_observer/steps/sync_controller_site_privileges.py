@@ -14,13 +14,17 @@ class SyncControllerSitePrivileges(OpenStackSyncStep):
     provides=[SitePrivilege]
     requested_interval=0
     observes=ControllerSitePrivilege
+    template_path='controller_site_privileges'
+
+    def ansible_tag(self, controller_site_privilege):
+        return '%s@%s'%(controller_site_privilege.site_privilege.user.email.replace('@','-at-'),controller_site_privilege.controller.name)
 
     def fetch_pending(self, deleted):
 
         if (deleted):
             return ControllerSitePrivilege.deleted_objects.all()
         else:
-            return ControllerSitePrivilege.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None)) 
+            return ControllerSitePrivilege.objects.filter(pending_sync=True) 
 
     def sync_record(self, controller_site_privilege):
         logger.info("sync'ing controler_site_privilege %s at controller %s" % (controller_site_privilege, controller_site_privilege.controller))
@@ -51,14 +55,14 @@ class SyncControllerSitePrivileges(OpenStackSyncStep):
                        'password': controller_site_privilege.site_privilege.user.remote_password,
                        'admin_user': controller_site_privilege.controller.admin_user,
 		       'admin_password': controller_site_privilege.controller.admin_password,
-	               'ansible_tag':'%s@%s'%(controller_site_privilege.site_privilege.user.email.replace('@','-at-'),controller_site_privilege.controller.name),
+	               'ansible_tag':self.ansible_tag(controller_site_privilege),
 		       'admin_tenant': controller_site_privilege.controller.admin_tenant,
 		       'roles':roles,
 		       'tenant':controller_site_privilege.site_privilege.site.login_base}    
 	
 	    rendered = template.render(user_fields)
 	    expected_length = len(roles) + 1
-	    res = run_template('sync_controller_users.yaml', user_fields,path='controller_site_privileges', expected_num=expected_length)
+	    res = run_template('sync_controller_users.yaml', user_fields,path=self.template_path, expected_num=expected_length, force=not controller_site_privilege.enacted)
 
 	    # results is an array in which each element corresponds to an 
 	    # "ok" string received per operation. If we get as many oks as
@@ -11,6 +11,10 @@ class SyncControllerSites(OpenStackSyncStep):
     requested_interval=0
     provides=[Site]
     observes=ControllerSite
+    template_path='controller_sites'
+
+    def ansible_tag(self, controller_site):
+        return '%s@%s'%(controller_site.site.login_base,controller_site.controller.name)
 
     def fetch_pending(self, deleted=False):
         pending = super(OpenStackSyncStep, self).fetch_pending(deleted)
@@ -22,12 +26,12 @@ class SyncControllerSites(OpenStackSyncStep):
 		         'admin_user': controller_site.controller.admin_user,
 		         'admin_password': controller_site.controller.admin_password,
 		         'admin_tenant': controller_site.controller.admin_tenant,
-	                 'ansible_tag': '%s@%s'%(controller_site.site.login_base,controller_site.controller.name), # name of ansible playbook
+	                 'ansible_tag': self.ansible_tag(controller_site), # name of ansible playbook
 		         'tenant': controller_site.site.login_base,
 		         'tenant_description': controller_site.site.name}
 
 	rendered = template.render(tenant_fields)
-	res = run_template('sync_controller_sites.yaml', tenant_fields, path='controller_sites', expected_num=1)
+	res = run_template('sync_controller_sites.yaml', tenant_fields, path=self.template_path, expected_num=1, force=not controller_site.enacted)
 
 	controller_site.tenant_id = res[0]['id']
 	controller_site.backend_status = '1 - OK'
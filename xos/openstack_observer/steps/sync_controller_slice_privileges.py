@@ -14,13 +14,17 @@ class SyncControllerSlicePrivileges(OpenStackSyncStep):
     provides=[SlicePrivilege]
     requested_interval=0
     observes=ControllerSlicePrivilege
+    template_path='controller_slice_privileges'
+
+    def ansible_tag(self, controller_slice_privilege):
+        return '%s@%s@%s'%(controller_slice_privilege.slice_privilege.user.email.replace('@','-at-'),controller_slice_privilege.slice_privilege.slice.name,controller_slice_privilege.controller.name)
 
     def fetch_pending(self, deleted):
 
         if (deleted):
             return ControllerSlicePrivilege.deleted_objects.all()
         else:
-            return ControllerSlicePrivilege.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None)) 
+            return ControllerSlicePrivilege.objects.filter(pending_sync=True) 
 
     def sync_record(self, controller_slice_privilege):
         logger.info("sync'ing controler_slice_privilege %s at controller %s" % (controller_slice_privilege, controller_slice_privilege.controller))
@@ -51,14 +55,14 @@ class SyncControllerSlicePrivileges(OpenStackSyncStep):
                        'password': controller_slice_privilege.slice_privilege.user.remote_password,
                        'admin_user': controller_slice_privilege.controller.admin_user,
 		       'admin_password': controller_slice_privilege.controller.admin_password,
-                       'ansible_tag':'%s@%s@%s'%(controller_slice_privilege.slice_privilege.user.email.replace('@','-at-'),controller_slice_privilege.slice_privilege.slice.name,controller_slice_privilege.controller.name),
+                       'ansible_tag':self.ansible_tag(controller_slice_privilege),
 		       'admin_tenant': controller_slice_privilege.controller.admin_tenant,
 		       'roles':roles,
 		       'tenant':controller_slice_privilege.slice_privilege.slice.name}    
 	
 	    rendered = template.render(user_fields)
 	    expected_length = len(roles) + 1
-	    res = run_template('sync_controller_users.yaml', user_fields, path='controller_slice_privileges', expected_num=expected_length)
+	    res = run_template('sync_controller_users.yaml', user_fields, path=self.template_path, expected_num=expected_length, force=not controller_slice_privilege.enacted)
 
 	    # results is an array in which each element corresponds to an 
 	    # "ok" string received per operation. If we get as many oks as
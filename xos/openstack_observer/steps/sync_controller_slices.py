@@ -16,12 +16,16 @@ class SyncControllerSlices(OpenStackSyncStep):
     provides=[Slice]
     requested_interval=0
     observes=ControllerSlice
+    template_path='controller_slices'
+
+    def ansible_tag(self, controller_slice):
+        return '%s@%s'%(controller_slice.slice.name,controller_slice.controller.name)
 
     def fetch_pending(self, deleted):
         if (deleted):
             return ControllerSlice.deleted_objects.all()
         else:
-            return ControllerSlice.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
+            return ControllerSlice.objects.filter(pending_sync=True)
 
     def sync_record(self, controller_slice):
         logger.info("sync'ing slice controller %s" % controller_slice)
@@ -47,11 +51,11 @@ class SyncControllerSlices(OpenStackSyncStep):
                          'tenant_description': controller_slice.slice.description,
                          'roles':roles,
                          'name':controller_user.user.email,
-                         'ansible_tag':'%s@%s'%(controller_slice.slice.name,controller_slice.controller.name),
+                         'ansible_tag':self.ansible_tag(controller_slice),
                          'max_instances':max_instances}
 
         expected_num = len(roles)+1
-        res = run_template('sync_controller_slices.yaml', tenant_fields, path='controller_slices', expected_num=expected_num)
+        res = run_template('sync_controller_slices.yaml', tenant_fields, path=self.template_path, expected_num=expected_num, force=not controller_slice.enacted)
         tenant_id = res[0]['id']
         if (not controller_slice.tenant_id):
             try:
@@ -81,5 +85,6 @@ class SyncControllerSlices(OpenStackSyncStep):
             client_driver.delete_router(controller_slice.router_id)
         if controller_slice.network_id:
             client_driver.delete_network(controller_slice.network_id)
+        self.inventory.invalidate(controller_slice.controller, ['networks', 'ports'])
         if controller_slice.tenant_id:
             driver.delete_tenant(controller_slice.tenant_id)
@@ -10,6 +10,7 @@ class SyncImages(OpenStackSyncStep):
     provides=[Image]
     requested_interval=0
     observes=Image
+    poll_external=True
 
     def fetch_pending(self, deleted):
         # Images come from the back end
@@ -46,7 +47,7 @@ class SyncImages(OpenStackSyncStep):
                               path = available_images[image_name])
                 image.save()
 
-        return Image.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None)) 
+        return Image.objects.filter(pending_sync=True) 
 
     def sync_record(self, image):
         image.save()
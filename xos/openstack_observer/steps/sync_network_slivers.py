@@ -11,6 +11,8 @@ class SyncNetworkSlivers(OpenStackSyncStep):
     requested_interval = 0 # 3600
     provides=[NetworkSliver]
     observes=NetworkSliver
+    controller_path='sliver__node__site_deployment__controller'
+    poll_external=True
 
     #     The way it works is to enumerate the all of the ports that quantum
     #     has, and then work backward from each port's network-id to determine
@@ -45,13 +47,18 @@ class SyncNetworkSlivers(OpenStackSyncStep):
 
         ports_by_id = {}
         templates_by_id = {}
-        for controller in Controller.objects.all():
+        templates_by_name = {}
+        for template in NetworkTemplate.objects.all():
+            if template.shared_network_name:
+                templates_by_name[template.shared_network_name] = template
+        # only the controllers of this process, if the observer is sharded
+        for controller in self.shard_controllers(Controller.objects.all()):
             if not controller.admin_tenant:
                 logger.info("controller %s has no admin_tenant" % controller)
                 continue
+            inventory = self.inventory.get(controller)
             try:
-                driver = self.driver.admin_driver(controller = controller,tenant='admin')
-                ports = driver.shell.quantum.list_ports()["ports"]
+                ports = inventory.ports()
             except:
                 logger.log_exc("failed to get ports from controller %s" % controller)
                 continue
@@ -63,14 +70,14 @@ class SyncNetworkSlivers(OpenStackSyncStep):
             # in the data model, so build up a list of which ids map to which network
             # templates.
             try:
-                neutron_networks = driver.shell.quantum.list_networks()["networks"]
+                neutron_networks = inventory.networks()
             except:
                 print "failed to get networks from controller %s" % controller
                 continue
             for network in neutron_networks:
-                for template in NetworkTemplate.objects.all():
-                    if template.shared_network_name == network["name"]:
-                        templates_by_id[network["id"]] = template
+                template = templates_by_name.get(network["name"], None)
+                if template:
+                    templates_by_id[network["id"]] = template
 
         for port in ports_by_id.values():
             #logger.info("port %s" % str(port))
@@ -162,8 +169,10 @@ class SyncNetworkSlivers(OpenStackSyncStep):
             if (neutron_nat_list != nat_list):
                 logger.info("Setting nat:forward_ports for port %s network %s sliver %s to %s" % (str(networkSliver.port_id), str(networkSliver.network.id), str(networkSliver.sliver), str(nat_list)))
                 try:
-                    driver = self.driver.admin_driver(controller=networkSliver.sliver.node.site_deployment.controller,tenant='admin')
+                    controller = networkSliver.sliver.node.site_deployment.controller
+                    driver = self.driver.admin_driver(controller=controller,tenant='admin')
                     driver.shell.quantum.update_port(networkSliver.port_id, {"port": {"nat:forward_ports": nat_list}})
+                    self.inventory.invalidate(controller, ['ports'])
                 except:
                     logger.log_exc("failed to update port with nat_list %s" % str(nat_list))
                     continue
@@ -12,15 +12,16 @@ class SyncRoles(OpenStackSyncStep):
     provides=[Role]
     requested_interval=0
     observes=Role
+    watches=[SiteRole, SliceRole, ControllerRole]
 
     def fetch_pending(self, deleted):
         # Deleting roles is not supported yet
         if (deleted):
             return []
 
-        site_roles = SiteRole.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
-        slice_roles = SliceRole.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
-        controller_roles = ControllerRole.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
+        site_roles = SiteRole.objects.filter(pending_sync=True)
+        slice_roles = SliceRole.objects.filter(pending_sync=True)
+        controller_roles = ControllerRole.objects.filter(pending_sync=True)
 
         roles = []
         for site_role in site_roles:
@@ -19,6 +19,13 @@ class SyncSlivers(OpenStackSyncStep):
     provides=[Sliver]
     requested_interval=0
     observes=Sliver
+    controller_path='node__site_deployment__controller'
+    # instance boots are independent of each other, and slow
+    concurrency=16
+    template_path='slivers'
+
+    def ansible_tag(self, sliver):
+        return '%s-%d'%(sliver.slice.name,sliver.id)
 
     def get_userdata(self, sliver, pubkeys):
         userdata = 'opencloud:\n   slicename: "%s"\n   hostname: "%s"\n   restapi_hostname: "%s"\n   restapi_port: "%s"\n' % (sliver.slice.name, sliver.node.name, RESTAPI_HOSTNAME, str(RESTAPI_PORT))
@@ -62,8 +69,8 @@ class SyncSlivers(OpenStackSyncStep):
                              if network.template.shared_network_name]
 
         #driver = self.driver.client_driver(caller=sliver.creator, tenant=sliver.slice.name, controller=sliver.controllerNetwork)
-        driver = self.driver.admin_driver(tenant='admin', controller=sliver.node.site_deployment.controller)
-        nets = driver.shell.quantum.list_networks()['networks']
+        inventory = self.inventory.get(sliver.node.site_deployment.controller)
+        nets = inventory.networks()
         for net in nets:
             if net['name'] in network_templates:
                 nics.append(net['id'])
@@ -75,9 +82,8 @@ class SyncSlivers(OpenStackSyncStep):
 
         # look up image id
         if (not sliver.image.id):
-            controller_driver = self.driver.admin_driver(controller=sliver.node.site_deployment.controller)
             image_id = None
-            images = controller_driver.shell.glanceclient.images.list()
+            images = inventory.images()
             for image in images:
                 if image.name == sliver.image.name or not image_id:
                     image_id = image.id
@@ -95,7 +101,7 @@ class SyncSlivers(OpenStackSyncStep):
             host_filter = sliver.node.name.strip()
 
         availability_zone_filter = 'nova:%s'%host_filter
-        sliver_name = '%s-%d'%(sliver.slice.name,sliver.id)
+        sliver_name = self.ansible_tag(sliver)
 
         userData = self.get_userdata(sliver, pubkeys)
         if sliver.userData:
@@ -117,7 +123,9 @@ class SyncSlivers(OpenStackSyncStep):
                      'meta':metadata_update,
                      'user_data':r'%s'%escape(userData)}
 
-        res = run_template('sync_slivers.yaml', tenant_fields,path='slivers', expected_num=2)
+        res = run_template('sync_slivers.yaml', tenant_fields,path=self.template_path, expected_num=2, force=not sliver.enacted)
+        # the new instance has new ports
+        self.inventory.invalidate(controller, ['ports'])
         sliver_id = res[1]['info']['OS-EXT-SRV-ATTR:instance_name'] # 0 is for the key
         sliver_uuid = res[1]['id'] # 0 is for the key
 
@@ -134,7 +142,7 @@ class SyncSlivers(OpenStackSyncStep):
         sliver.save()
 
     def delete_record(self, sliver):
-        sliver_name = '%s-%d'%(sliver.slice.name,sliver.id)
+        sliver_name = self.ansible_tag(sliver)
         controller = sliver.node.site_deployment.controller
         tenant_fields = {'endpoint':controller.auth_url,
                      'admin_user': sliver.creator.email,
@@ -147,12 +155,13 @@ class SyncSlivers(OpenStackSyncStep):
                      'delete': True}
 
         try:
-               res = run_template('sync_slivers.yaml', tenant_fields,path='slivers', expected_num=1)
-        except Exception,e:
-               print "Could not sync %s"%sliver_name
-               #import traceback
-               #traceback.print_exc()
-               raise e
+               res = run_template('sync_slivers.yaml', tenant_fields,path=self.template_path, expected_num=1, force=True)
+               self.inventory.invalidate(controller, ['ports'])
+        except Exception,e:
+               print "Could not sync %s"%sliver_name
+               #import traceback
+               #traceback.print_exc()
+               raise e
 
         if (len(res)!=1):
             raise Exception('Could not delete sliver %s'%sliver.slice.name)
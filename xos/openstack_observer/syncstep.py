@@ -1,13 +1,24 @@
 import os
 import base64
-from datetime import datetime
+import random
+from datetime import datetime, timedelta
 from xos.config import Config
 from util.logger import Logger, logging
 from observer.steps import *
 from django.db.models import F, Q
+from django.db.models.query import QuerySet
+from django.utils import timezone
+from django.db.models.fields import FieldDoesNotExist
 from core.models import * 
+from observer.result_writer import SyncResultWriter, MAX_IDS_PER_UPDATE
+from observer.inventory import Inventory
+from observer.step_pool import run_concurrently
+from observer.metrics import StepRun
+from observer.ansible import run_template, run_template_batch, forget_applied_tag
 import json
 import time
+import threading
+from collections import OrderedDict
 import pdb
 
 logger = Logger(level=logging.INFO)
@@ -34,8 +45,28 @@ class SyncStep(object):
     Attributes:
         psmodel        Model name the step synchronizes 
         dependencies    list of names of models that must be synchronized first if the current model depends on them
+        watches         extra models whose changes should wake this step up, besides observes and provides
+        poll_external   True if the step syncs state that changes outside XOS, so it must run every pass
+        concurrency     number of records the step may sync at once, 1 unless the records are independent
+        template_name   ansible template the step syncs through, if it only uses one; the step then
+                        implements map_sync_inputs/map_sync_outputs and can be run in batches
+        template_path   subdirectory of observer_sys_dir its playbooks are written to; with
+                        ansible_tag(), where what was applied for an object is forgotten when it is deleted
+        backoff_base    seconds an object waits after failing twice in a row; the wait doubles with
+                        every further failure, up to backoff_cap, give or take backoff_jitter of it
+        controller_path lookup from the observed model to its Controller, for sharded observers;
+                        'controller' by default if the model has one, otherwise the objects are global
     """ 
     slow=False
+    watches=[]
+    poll_external=False
+    concurrency=1
+    template_name=None
+    template_path=''
+    backoff_base=1440
+    backoff_cap=6*3600
+    backoff_jitter=0.1
+    controller_path=None
     def get_prop(self, prop):
         try:
             sync_config_dir = Config().sync_config_dir
@@ -49,10 +80,15 @@ class SyncStep(object):
            Keyword arguments:
                    name -- Name of the step
                 provides -- XOS models sync'd by this step
+                inventory -- controller Inventory of the current pass
+                shard -- observer.shard.Shard this process syncs for, if sharded
         """
         dependencies = []
         self.driver = args.get('driver')
         self.error_map = args.get('error_map')
+        # shared by all steps of an observer pass, see observer.inventory
+        self.inventory = args.get('inventory') or Inventory(self.driver)
+        self.shard = args.get('shard')
 
         try:
             self.soft_deadline = int(self.get_prop('soft_deadline_seconds'))
@@ -67,114 +103,373 @@ class SyncStep(object):
         # for figuring out what objects are outstanding.
         main_obj = self.observes
         if (not deletion):
-            objs = main_obj.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
+            objs = main_obj.objects.filter(pending_sync=True)
         else:
             objs = main_obj.deleted_objects.all()
 
         return objs
         #return Sliver.objects.filter(ip=None)
     
-    def check_dependencies(self, obj, failed):
-        for dep in self.dependencies:
-            peer_name = dep[0].lower() + dep[1:]    # django names are camelCased with the first letter lower
- 
-            try:
-                peer_object = deepgetattr(obj, peer_name)
-                try: 
-                    peer_objects = peer_object.all() 
-                except AttributeError:
-                    peer_objects = [peer_object] 
-            except:
-                peer_objects = []
-
-            if (failed in peer_objects):
-                if (obj.backend_status!=failed.backend_status):
-                    obj.backend_status = failed.backend_status
-                    obj.save(update_fields=['backend_status'])
-                raise FailedDependency("Failed dependency for %s:%s peer %s:%s failed  %s:%s" % (obj.__class__.__name__, str(getattr(obj,"pk","no_pk")), peer_object.__class__.__name__, str(getattr(peer_object,"pk","no_pk")), failed.__class__.__name__, str(getattr(failed,"pk","no_pk"))))
+    def dependency_fields(self, model, dep):
+        """ The names of the fields of model that link it to the model dep
+            depends on. Dependencies are model names, lower cased as in the
+            dependency graph, and link through a field of that name or
+            through any relation to that model (Slice.creator for 'user').
+            Without either, dep is looked up as an attribute. """
+        try:
+            model._meta.get_field_by_name(dep)
+            return [dep]
+        except FieldDoesNotExist:
+            pass
+
+        names = []
+        for name in model._meta.get_all_field_names():
+            (field, field_model, direct, m2m) = model._meta.get_field_by_name(name)
+            if direct:
+                related = field.rel.to if getattr(field, 'rel', None) else None
+            else:
+                # a RelatedObject, for the relations of other models to this one
+                related = field.model
+            if (related is not None) and (not isinstance(related, basestring)) and (related.__name__.lower() == dep):
+                names.append(name)
+        return names or [dep]
+
+    def dependency_peers(self, objects, peer_name, failed_pks):
+        """ (object, failed peer) for every object that reaches one of
+            failed_pks through peer_name. Foreign keys are read off the
+            objects, reverse and many-to-many links take one query for all
+            of them. """
+        model = objects[0].__class__
+        try:
+            (field, field_model, direct, m2m) = model._meta.get_field_by_name(peer_name)
+        except FieldDoesNotExist:
+            field = None
+
+        if (field is not None) and direct and (not m2m) and getattr(field, 'rel', None):
+            for o in objects:
+                peer_pk = getattr(o, field.attname)
+                if peer_pk in failed_pks:
+                    yield (o, failed_pks[peer_pk])
+        elif (field is not None):
+            by_pk = dict([(o.pk, o) for o in objects])
+            pks = by_pk.keys()
+            for i in range(0, len(pks), MAX_IDS_PER_UPDATE):
+                links = model._base_manager.filter(pk__in=pks[i:i+MAX_IDS_PER_UPDATE], **{peer_name + '__in': failed_pks.keys()})
+                for (pk, peer_pk) in links.values_list('pk', peer_name):
+                    yield (by_pk[pk], failed_pks[peer_pk])
+        else:
+            # not a model field (e.g. a property), follow it object by object
+            for o in objects:
+                try:
+                    peer_object = deepgetattr(o, peer_name)
+                    try:
+                        peer_objects = peer_object.all()
+                    except AttributeError:
+                        peer_objects = [peer_object]
+                except:
+                    peer_objects = []
+                for peer in peer_objects:
+                    if getattr(peer, 'pk', None) in failed_pks:
+                        yield (o, failed_pks[peer.pk])
+                        break
+
+    def blocked_objects(self, objects, failed):
+        """ {object pk: failed peer} for the objects that depend on an
+            object that failed earlier in this pass. Only links to a model
+            with failures are followed. """
+        dependencies = getattr(self, 'dependencies', [])
+        if (not failed) or (not dependencies) or (not objects):
+            return {}
+
+        # lower cased model name -> pk -> failed object
+        failed_index = {}
+        for f in failed:
+            # concrete_model, as objects fetched with only() are of a deferred subclass
+            failed_index.setdefault(f._meta.concrete_model.__name__.lower(), {})[f.pk] = f
+
+        model = objects[0].__class__
+        blocked = {}
+        for dep in dependencies:
+            dep = dep.lower()
+            failed_pks = failed_index.get(dep)
+            if not failed_pks:
+                continue
+            for peer_name in self.dependency_fields(model, dep):
+                for (o, peer) in self.dependency_peers(objects, peer_name, failed_pks):
+                    blocked.setdefault(o.pk, peer)
+        return blocked
+
+    def skip_blocked(self, pending, failed, results):
+        """ Leave out of pending the objects whose dependencies failed, and
+            mark them failed too, with the status of the peer they wait for. """
+        pending = list(pending)
+        blocked = self.blocked_objects(pending, failed)
+        if not blocked:
+            return pending
+
+        logger.info("%s: %d objects wait for failed dependencies" % (self.__class__.__name__, len(blocked)))
+        unblocked = []
+        for o in pending:
+            peer = blocked.get(o.pk)
+            if (peer is None):
+                unblocked.append(o)
+                continue
+            if (o.backend_status != peer.backend_status):
+                results.update(o, backend_status=peer.backend_status)
+            self.run_stats.record_failed(0)
+            failed.append(o)
+        return unblocked
 
     def call(self, failed=[], deletion=False):
-        pending = self.fetch_pending(deletion)
+        try:
+            backoff_disabled = Config().observer_backoff_disabled
+        except:
+            backoff_disabled = 0
+
+        # what happened to each pending object, read by the event loop
+        self.run_stats = StepRun()
+        self.backoff_policy = self.get_backoff_policy()
+        # before fetch_pending, so that later changes aren't taken as synced
+        results = SyncResultWriter(started=timezone.now())
+        try:
+            return self.sync_objects(results, failed, deletion, backoff_disabled)
+        finally:
+            results.flush()
+
+    def get_concurrency(self):
+        # [observer] concurrency_<stepname> in the config overrides the step's own setting
+        return int(getattr(Config(), "observer_concurrency_%s" % self.__class__.__name__.lower(), self.concurrency))
+
+    @classmethod
+    def get_controller_path(cls):
+        if cls.controller_path:
+            return cls.controller_path
+        observes = getattr(cls, 'observes', None)
+        if observes and ('controller' in observes._meta.get_all_field_names()):
+            return 'controller'
+        return None
+
+    def restrict_to_shard(self, pending):
+        """ The objects of pending this process syncs: those of the
+            controllers it holds leases on, or the global ones if it holds
+            that lease. """
+        if (self.shard is None):
+            return pending
+
+        path = self.get_controller_path()
+        if (path is None):
+            return pending if self.shard.global_held else []
+
+        controller_ids = list(self.shard.controller_ids)
+        if isinstance(pending, QuerySet):
+            return pending.filter(**{path + '__in': controller_ids})
+        return [o for o in pending if getattr(deepgetattr(o, path.replace('__', '.')), 'id', None) in controller_ids]
+
+    def shard_controllers(self, controllers):
+        """ The controllers of controllers this process syncs for """
+        if (self.shard is None):
+            return controllers
+        return [c for c in controllers if c.id in self.shard.controller_ids]
+
+    def get_backoff_policy(self):
+        # [observer] backoff_base_<stepname>, backoff_cap_<stepname> and
+        # backoff_jitter_<stepname> in the config override the step's own policy
+        name = self.__class__.__name__.lower()
+        config = Config()
+        return (float(getattr(config, "observer_backoff_base_%s" % name, self.backoff_base)),
+                float(getattr(config, "observer_backoff_cap_%s" % name, self.backoff_cap)),
+                float(getattr(config, "observer_backoff_jitter_%s" % name, self.backoff_jitter)))
+
+    def retry_delay(self, attempts):
+        """ Seconds to wait before syncing an object that failed attempts
+            times in a row. The first failure is retried on the next pass. """
+        if (attempts < 2):
+            return 0
+        (base, cap, jitter) = self.backoff_policy
+        delay = min(cap, base * 2 ** (attempts - 2))
+        return delay * random.uniform(1 - jitter, 1 + jitter)
+
+    def skip_backing_off(self, pending, failed):
+        """ Leave out of pending the objects whose next_run is still to
+            come. For a query this is done in SQL, and of the objects left
+            out only the status is fetched: they count as failed, so that
+            what depends on them waits too. """
+        now = timezone.now()
+        if isinstance(pending, QuerySet) and ('next_run' in pending.model._meta.get_all_field_names()):
+            waiting = list(pending.filter(next_run__gt=now).only('id', 'backend_status'))
+            pending = pending.filter(Q(next_run=None) | Q(next_run__lte=now))
+        else:
+            waiting = []
+            due = []
+            for o in pending:
+                if getattr(o, 'next_run', None) and (o.next_run > now):
+                    waiting.append(o)
+                else:
+                    due.append(o)
+            pending = due
+
+        if waiting:
+            logger.info("%s: %d objects are backing off" % (self.__class__.__name__, len(waiting)))
+        for o in waiting:
+            self.run_stats.record_backed_off()
+            failed.append(o)
+        return pending
+
+    def sync_objects(self, results, failed, deletion, backoff_disabled):
+        pending = self.restrict_to_shard(self.fetch_pending(deletion))
+        if (not backoff_disabled):
+            pending = self.skip_backing_off(pending, failed)
+
+        # Objects held up by what failed in earlier steps are settled up front
+        pending = self.skip_blocked(pending, failed, results)
+
+        batch_size = self.get_ansible_batch_size()
+        if (not deletion) and (batch_size > 1):
+            return self.sync_objects_batched(pending, results, failed, batch_size)
+
+        concurrency = self.get_concurrency()
+        if (concurrency <= 1):
+            for o in pending:
+                if (self.sync_object(o, results, deletion)):
+                    failed.append(o)
+            return failed
+
+        lock = threading.Lock()
+        def sync_one(o):
+            if (self.sync_object(o, results, deletion)):
+                with lock:
+                    failed.append(o)
+        run_concurrently(pending, sync_one, concurrency)
+        return failed
+
+    def record_success(self, o, results):
+        results.enacted(o, pending_sync=False, attempts=0, next_run=None,
+                        backend_status="1 - OK")
+
+    def record_failure(self, o, e, results):
+        logger.log_exc("sync step failed!")
+        try:
+            if (o.backend_status.startswith('2 - ')):
+                str_e = '%s // %r'%(o.backend_status[4:],e)
+                str_e = elim_dups(str_e)
+            else:
+                str_e = '%r'%e
+        except:
+            str_e = '%r'%e
+
+        try:
+            o.backend_status = '2 - %s'%self.error_map.map(str_e)
+        except:
+            o.backend_status = '2 - %s'%str_e
+
+        attempts = (getattr(o, 'attempts', 0) or 0) + 1
+        next_run = None
+        delay = self.retry_delay(attempts)
+        if delay:
+            # whole minutes, so that objects failing together for the same
+            # reason can still share an UPDATE
+            next_run = (timezone.now() + timedelta(seconds=delay)).replace(second=0, microsecond=0)
+
+        results.update(o, backend_status=o.backend_status[:1024],
+                       attempts=attempts, next_run=next_run)
+
+    def sync_object(self, o, results, deletion):
+        """ Sync (or delete) one object, recording the outcome in results.
+            Returns True if it failed """
+        start = time.time()
+        try:
+            if (deletion):
+                self.delete_record(o)
+                self.forget_applied(o)
+                o.delete(purge=True)
+            else:
+                self.sync_record(o)
+                self.record_success(o, results)
+        except Exception,e:
+            self.record_failure(o, e, results)
+            self.run_stats.record_failed(time.time() - start)
+            return True
+
+        self.run_stats.record_synced(time.time() - start)
+        return False
+
+    def ansible_tag(self, o):
+        """ The ansible_tag of o's playbook in template_path, if it has one """
+        return None
+
+    def forget_applied(self, o):
+        # what was applied for a deleted object doesn't exist any more, and a
+        # new object with the same ansible_tag has to run its playbook
+        tag = self.ansible_tag(o)
+        if tag:
+            forget_applied_tag(self.template_path, {'ansible_tag': tag})
+
+    def get_ansible_batch_size(self):
+        if (not self.template_name):
+            return 1
+        return int(getattr(Config(), "observer_ansible_batch_size", 1))
+
+    def batch_key(self, o):
+        """ Objects with the same key can share a playbook run """
+        return getattr(o, 'controller_id', None)
+
+    def sync_objects_batched(self, pending, results, failed, batch_size):
+        """ sync_objects for steps that sync through a single ansible
+            template (template_name): the playbooks of up to batch_size
+            pending objects with the same batch_key are run as one """
+        batches = OrderedDict()
         for o in pending:
-            sync_failed = False
             try:
-                backoff_disabled = Config().observer_backoff_disabled
-            except:
-                backoff_disabled = 0
+                inputs = self.map_sync_inputs(o)
+                if (inputs is not None) and (not o.enacted):
+                    forget_applied_tag(self.template_path, inputs[0])
+            except Exception,e:
+                self.record_failure(o, e, results)
+                self.run_stats.record_failed(0)
+                failed.append(o)
+                continue
 
-            try:
-                scratchpad = json.loads(o.backend_register)
-                if (scratchpad):
-                    next_run = scratchpad['next_run']
-                    if (not backoff_disabled and next_run>time.time()):
-                        sync_failed = True
-                        print "BACKING OFF, exponent = %d"%scratchpad['exponent']
-            except:
-                pass
-
-            if (not sync_failed):
+            if (inputs is None):
+                # nothing to do on the backend for this one
+                self.record_success(o, results)
+                self.run_stats.record_synced(0)
+            else:
+                batches.setdefault(self.batch_key(o), []).append((o, inputs))
+
+        for batch in batches.values():
+            for i in range(0, len(batch), batch_size):
+                chunk = batch[i:i+batch_size]
+                start = time.time()
                 try:
-                    for f in failed:
-                        self.check_dependencies(o,f) # Raises exception if failed
-                    if (deletion):
-                        self.delete_record(o)
-                        o.delete(purge=True)
-                    else:
-                        self.sync_record(o)
-                        o.enacted = datetime.now() # Is this the same timezone? XXX
-                        scratchpad = {'next_run':0, 'exponent':0}
-                        o.backend_register = json.dumps(scratchpad)
-                        o.backend_status = "1 - OK"
-                        o.save(update_fields=['enacted','backend_status','backend_register'])
+                    outcomes = run_template_batch(self.template_name, [inputs for (o, inputs) in chunk], path=self.template_path)
                 except Exception,e:
-                    logger.log_exc("sync step failed!")
-                    try:
-                        if (o.backend_status.startswith('2 - ')):
-                            str_e = '%s // %r'%(o.backend_status[4:],e)
-			    str_e = elim_dups(str_e)
-                        else:
-                            str_e = '%r'%e
-                    except:
-                        str_e = '%r'%e
-
-                    try:
-                        o.backend_status = '2 - %s'%self.error_map.map(str_e)
-                    except:
-                        o.backend_status = '2 - %s'%str_e
+                    outcomes = [e] * len(chunk)
 
+                # every object of the chunk waited for the whole playbook
+                latency = time.time() - start
+                for ((o, inputs), outcome) in zip(chunk, outcomes):
                     try:
-                        scratchpad = json.loads(o.backend_register)
-                        scratchpad['exponent']
-                    except:
-                        scratchpad = {'next_run':0, 'exponent':0}
-
-                    # Second failure
-                    if (scratchpad['exponent']):
-                        delay = scratchpad['exponent'] * 600 # 10 minutes
-                        if (delay<1440):
-                            delay = 1440
-                        scratchpad['next_run'] = time.time() + delay
-
-                    scratchpad['exponent']+=1
-
-                    o.backend_register = json.dumps(scratchpad)
-
-                    # TOFIX:
-                    # DatabaseError: value too long for type character varying(140)
-                    if (o.pk):
-                        try:
-                            o.backend_status = o.backend_status[:1024]
-                            o.save(update_fields=['backend_status','backend_register'])
-                        except:
-                            print "Could not update backend status field!"
-                            pass
-                    sync_failed = True
-
-
-            if (sync_failed):
-                failed.append(o)
-
+                        if isinstance(outcome, Exception):
+                            raise outcome
+                        self.map_sync_outputs(o, outcome)
+                        self.record_success(o, results)
+                        self.run_stats.record_synced(latency)
+                    except Exception,e:
+                        self.record_failure(o, e, results)
+                        self.run_stats.record_failed(latency)
+                        failed.append(o)
         return failed
 
+    def sync_record(self, o):
+        # Steps that set template_name only describe how to fill in the
+        # template and what to do with its results
+        inputs = self.map_sync_inputs(o)
+        if (inputs is None):
+            return
+        (fields, expected_num) = inputs
+        # a new object can't have been applied, whatever an old one left behind
+        res = run_template(self.template_name, fields, path=self.template_path, expected_num=expected_num, force=not o.enacted)
+        self.map_sync_outputs(o, res)
+
     def __call__(self, **args):
         return self.call(**args)
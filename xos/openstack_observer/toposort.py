@@ -10,56 +10,53 @@ import pdb
 from datetime import datetime
 from collections import defaultdict
 
+class CycleError(Exception):
+	def __init__(self, cycle):
+		self.cycle = cycle
+		Exception.__init__(self, "Dependency cycle: %s" % " -> ".join(cycle))
+
 # Topological sort
 # Notes:
-# - Uses a stack instead of recursion
-# - Forfeits optimization involving tracking currently visited nodes
+# - g maps each node to the nodes it depends on, dependencies come first
+# - Uses a stack of iterators instead of recursion, O(V+E)
+# - A node depending on itself is not a cycle
 def toposort(g, steps=None):
-	# Get set of all nodes, including those without outgoing edges
-	keys = set(g.keys())
-	values = set({})
+	roots = list(steps or [])
+	others = set(g.keys())
 	for v in g.values():
-		values=values | set(v)
-	
-	all_nodes=list(keys|values)
-	if (not steps):
-		steps = all_nodes
+		others.update(v)
+	roots.extend(sorted(others - set(roots)))
 
-	# Final order
+	GREY, BLACK = 1, 2
+	color = {}
 	order = []
+	for root in roots:
+		if root in color:
+			continue
+		color[root] = GREY
+		stack = [(root, iter(g.get(root, [])))]
+		while stack:
+			(n, deps) = stack[-1]
+			for m in deps:
+				if (m == n):
+					continue
+				c = color.get(m)
+				if (c is None):
+					color[m] = GREY
+					stack.append((m, iter(g.get(m, []))))
+					break
+				if (c == GREY):
+					path = [x for (x, _) in stack]
+					raise CycleError(path[path.index(m):] + [m])
+			else:
+				stack.pop()
+				color[n] = BLACK
+				order.append(n)
 
-	# DFS stack, not using recursion
-	stack = []
-
-	# Unmarked set
-	unmarked = all_nodes
-
-	# visiting = [] - skip, don't expect 1000s of nodes, |E|/|V| is small
-
-	while unmarked:
-		stack.insert(0,unmarked[0]) # push first unmarked
-
-		while (stack):
-			n = stack[0]
-			add = True
-			try:
-				for m in g[n]:
-					if (m in unmarked):
-					    add = False
-					    stack.insert(0,m)
-			except KeyError:
-				pass
-			if (add):
-				if (n in steps and n not in order):
-					order.append(n)
-				item = stack.pop(0)
-				try:
-					unmarked.remove(item)
-				except ValueError:
-					pass
-
-	noorder = list(set(steps) - set(order))
-	return order + noorder
+	if steps:
+		wanted = set(steps)
+		order = [n for n in order if n in wanted]
+	return order
 
 def main():
 	graph_file=open('xos.deps').read()
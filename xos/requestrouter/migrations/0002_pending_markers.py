@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+from core.migration_operations import pending_operations
+
+# Models in this app that inherit the pending_sync / pending_policy flags
+PENDING_MODELS = [
+    'ServiceMap',
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('requestrouter', '0001_initial'),
+        ('core', '0012_pending_markers'),
+    ]
+
+    operations = pending_operations('requestrouter', PENDING_MODELS)
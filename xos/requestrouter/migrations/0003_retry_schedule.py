@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+from core.migration_operations import retry_operations
+
+# Models in this app that the observer syncs, and retries when they fail
+RETRY_MODELS = [
+    'ServiceMap',
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('requestrouter', '0002_pending_markers'),
+        ('core', '0013_retry_schedule'),
+    ]
+
+    operations = retry_operations('requestrouter', RETRY_MODELS)
@@ -26,7 +26,7 @@ class SyncRequestRouterService(SyncStep, RequestRouterLibrary):
 
     def fetch_pending(self):
 	try:
-        	ret = RequestRouterService.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
+        	ret = RequestRouterService.objects.filter(pending_sync=True)
         	return ret
 	except Exception, e:
         	traceback.print_exc()
@@ -31,7 +31,7 @@ class SyncServiceMap(SyncStep, RequestRouterLibrary, ConfigurationPush):
 
     def fetch_pending(self):
 	try:
-        	ret = ServiceMap.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None))
+        	ret = ServiceMap.objects.filter(pending_sync=True)
         	return ret
 	except Exception, e:
         	traceback.print_exc()
@@ -0,0 +1,87 @@
+"""
+    Ansible batching benchmark
+
+    Syncs N ControllerUser-like records through sync_controller_users.yaml,
+    once with one playbook per record (run_template) and once with a single
+    batched playbook (run_template_batch), and reports the overhead per
+    record. ansible-playbook is replaced by a stub that starts a Python
+    interpreter, parses the playbook and prints an ok result per task,
+    plus an optional fixed delay standing in for ansible's own startup and
+    the keystone login done by the OpenStack modules. Both runs are forced,
+    so neither is answered from what the other one applied.
+
+    usage: python ansiblebench.py [startup_delay_seconds]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+XOS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(XOS_DIR)
+
+STUB = """#!%(python)s
+import os, sys, time, json, yaml
+time.sleep(%(delay)f)
+results = os.fdopen(int(os.environ['XOS_ANSIBLE_RESULT_FD']), 'w', 0)
+n = 0
+for play in yaml.safe_load(open(sys.argv[-1])):
+    for task in play['tasks']:
+        results.write(json.dumps({'task': task.get('name', task.keys()[0]), 'status': 'ok',
+                                  'ignored': False, 'duration': 0,
+                                  'result': {'id': 'id-%%d' %% n}}) + '\\n')
+        n += 1
+"""
+
+def setup(delay):
+    workdir = tempfile.mkdtemp(prefix="ansiblebench-")
+    stub = os.path.join(workdir, "run_ansible")
+    open(stub, "w").write(STUB % {'python': sys.executable, 'delay': delay})
+    os.chmod(stub, 0755)
+
+    config = os.path.join(workdir, "xos_config")
+    open(config, "w").write("[observer]\n"
+                            "steps=True\n"
+                            "steps_dir=%s\n"
+                            "sys_dir=%s\n"
+                            "run_ansible=%s\n" % (os.path.join(XOS_DIR, "openstack_observer", "steps"), workdir, stub))
+    # xos.config picks its file up from -C
+    sys.argv.extend(["-C", config])
+
+def user_fields(i):
+    return {'endpoint': 'http://controller:5000/v2.0',
+            'name': 'user%d@example.com' % i,
+            'email': 'user%d@example.com' % i,
+            'password': 'secret',
+            'admin_user': 'admin',
+            'admin_password': 'admin',
+            'admin_tenant': 'admin',
+            'ansible_tag': 'user%d-at-example.com@controller' % i,
+            'roles': ['user'],
+            'tenant': 'site%d' % (i % 10)}
+
+def main():
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.0
+    setup(delay)
+
+    from openstack_observer.ansible import run_template, run_template_batch
+
+    for count in (1, 10, 100):
+        batch = [(user_fields(i), 2) for i in range(count)]
+
+        t0 = time.time()
+        for (fields, expected_num) in batch:
+            run_template('sync_controller_users.yaml', fields, path='controller_users', expected_num=expected_num, force=True)
+        single = time.time() - t0
+
+        t0 = time.time()
+        outcomes = run_template_batch('sync_controller_users.yaml', batch, path='controller_users', force=True)
+        batched = time.time() - t0
+        assert not [o for o in outcomes if isinstance(o, Exception)]
+
+        print "%4d records: %8.1f ms/record one playbook each, %8.1f ms/record batched" % \
+            (count, single * 1000 / count, batched * 1000 / count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+    Config construction benchmark
+
+    Replays the Config() calls of one observer pass: one per sync step
+    (SyncStep.__init__) plus, before the result writer, one per pending
+    object in SyncStep.call. Reports how many times the config file gets
+    parsed when every call re-reads it, compared with the cached Config.
+
+    usage: python configbench.py [config_file] [num_steps] [num_pending]
+"""
+
+import sys
+import time
+
+sys.path.append("/opt/xos")
+
+from xos.config import Config, DEFAULT_CONFIG_FN
+
+def one_pass(get_config, num_steps, num_pending):
+    for i in range(num_steps):
+        getattr(get_config(), "observer_sync_config_dir", None)
+    for i in range(num_pending):
+        getattr(get_config(), "observer_backoff_disabled", 0)
+
+def bench(name, get_config, num_steps, num_pending):
+    parses = Config.parse_count
+    t0 = time.time()
+    one_pass(get_config, num_steps, num_pending)
+    elapsed = time.time() - t0
+    print "%-8s %6d parses, %10.2f ms per pass" % (name, Config.parse_count - parses, elapsed * 1000)
+
+def main():
+    config_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CONFIG_FN
+    num_steps = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    num_pending = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+
+    print "One pass: %d steps, %d pending objects" % (num_steps, num_pending)
+    bench("uncached", lambda: Config.parse(config_file), num_steps, num_pending)
+    Config(config_file)
+    bench("cached", lambda: Config(config_file), num_steps, num_pending)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+    Model instantiation benchmark
+
+    Times building num_objects Slivers from database rows, the way
+    Sliver.objects.all() does for the observer and the REST API, and
+    compares it with the same construction plus the model_to_dict()
+    snapshot PlCoreBase.__init__ used to take of every row to track
+    changes. Change tracking now only copies the attributes when a row is
+    loaded and works the snapshot out if something asks what changed.
+
+    The rows are read once with values_list() and, if there are fewer than
+    num_objects slivers, repeated; nothing is written to the database.
+
+    usage: python initbench.py [num_objects]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append("/opt/xos")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "xos.settings")
+import django
+if hasattr(django, "setup"):
+    django.setup()
+
+from django.forms.models import model_to_dict
+from core.models import Sliver
+
+REPEAT = 5
+
+def load_rows(num_objects):
+    # the positional order Model.__init__ expects, as the queryset builds them
+    attnames = [field.attname for field in Sliver._meta.concrete_fields]
+    rows = list(Sliver.objects.values_list(*attnames)[:num_objects])
+    if not rows:
+        # an unsaved sliver's defaults, for an empty database
+        blank = Sliver()
+        rows = [tuple([getattr(blank, attname) for attname in attnames])]
+    return [rows[i % len(rows)] for i in range(num_objects)]
+
+def eager_snapshot(sliver):
+    # what PlCoreBase.__init__ used to do for every row
+    return model_to_dict(sliver, fields=[field.name for field in sliver._meta.fields])
+
+def bench(name, rows, build):
+    t0 = time.time()
+    for i in range(REPEAT):
+        build(rows)
+    elapsed = (time.time() - t0) / REPEAT
+    print "%-16s %7d rows, %8.2f ms per load, %9.0f rows/s" % (name, len(rows), elapsed * 1000, len(rows) / elapsed)
+
+def main():
+    num_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    print "Reading %d sliver rows..." % num_objects
+    rows = load_rows(num_objects)
+    bench("eager snapshot", rows, lambda rows: [eager_snapshot(Sliver(*row)) for row in rows])
+    bench("lazy tracking", rows, lambda rows: [Sliver(*row) for row in rows])
+    bench("lazy + diff", rows, lambda rows: [Sliver(*row).diff for row in rows])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+    Pending-object query benchmark
+
+    Compares the scan cost of the old fetch_pending query
+    (enacted < updated OR enacted IS NULL) against the indexed
+    pending_sync flag, on a table holding 100k objects of which 1% are
+    pending.
+
+    usage: python pendingbench.py [num_objects] [percent_pending]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append("/opt/xos")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "xos.settings")
+import django
+if hasattr(django, "setup"):
+    django.setup()
+
+from django.db import connection
+from django.db.models import F, Q
+from core.models import NetworkParameterType
+
+PREFIX = "pendingbench-"
+REPEAT = 20
+
+def populate(num_objects, percent_pending):
+    far_future = datetime.now() + timedelta(days=365)
+    every = max(1, int(100 / percent_pending))
+    objs = []
+    for i in range(num_objects):
+        pending = (i % every == 0)
+        objs.append(NetworkParameterType(name="%s%d" % (PREFIX, i),
+                                         description="benchmark",
+                                         enacted=None if pending else far_future,
+                                         pending_sync=pending))
+        if len(objs) >= 5000:
+            NetworkParameterType.objects.bulk_create(objs)
+            objs = []
+    if objs:
+        NetworkParameterType.objects.bulk_create(objs)
+
+    cursor = connection.cursor()
+    cursor.execute("ANALYZE %s" % NetworkParameterType._meta.db_table)
+
+def cleanup():
+    NetworkParameterType.objects.filter(name__startswith=PREFIX).delete()
+
+def explain(qs):
+    (sql, params) = qs.query.sql_with_params()
+    cursor = connection.cursor()
+    cursor.execute("EXPLAIN ANALYZE " + sql, params)
+    return "\n".join(["    " + row[0] for row in cursor.fetchall()])
+
+def bench(name, qs):
+    count = len(qs.all())
+    t0 = time.time()
+    for i in range(REPEAT):
+        list(qs.all().values_list("id", flat=True))
+    elapsed = (time.time() - t0) / REPEAT
+    print "%-12s %6d pending rows, %8.2f ms per fetch" % (name, count, elapsed * 1000)
+    print explain(qs)
+
+def main():
+    num_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    percent_pending = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+    cleanup()
+    print "Creating %d objects, %.1f%% pending..." % (num_objects, percent_pending)
+    populate(num_objects, percent_pending)
+    try:
+        bench("enacted<updated", NetworkParameterType.objects.filter(Q(enacted__lt=F('updated')) | Q(enacted=None)))
+        bench("pending_sync", NetworkParameterType.objects.filter(pending_sync=True))
+    finally:
+        cleanup()
+
+if __name__ == "__main__":
+    main()
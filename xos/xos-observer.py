@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 import os
 import argparse
+import signal
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "xos.settings")
 from observer.backend import Backend
 from xos.config import Config, DEFAULT_CONFIG_FN
@@ -47,14 +48,25 @@ def main():
     #   throwing unrecognized argument exceptions
     parser.add_argument('-C', '--config', dest='config_file', action='store', default=DEFAULT_CONFIG_FN,
                         help='Name of config file.')
+    # set by the coordinator of a sharded observer (observer_shards > 1)
+    parser.add_argument('--shard', dest='shard', action='store', default=None,
+                        help='Run as shard INDEX/COUNT of a sharded observer.')
     args = parser.parse_args()
 
     if args.daemon: daemon()
 
+    # let operators pick up config file changes right away with kill -HUP;
+    # the next Config() of the observer loop re-reads the file
+    signal.signal(signal.SIGHUP, lambda signum, frame: Config.request_reload())
+
     if django_setup: # 1.7
         django_setup()
 
-    backend = Backend()
+    shard = None
+    if args.shard:
+        shard = tuple([int(x) for x in args.shard.split('/')])
+
+    backend = Backend(shard=shard)
     backend.run()    
 
 if __name__ == '__main__':
@@ -4,7 +4,24 @@ from rest_framework import generics
 from rest_framework import status
 from rest_framework.exceptions import APIException
 from rest_framework.exceptions import PermissionDenied as RestFrameworkPermissionDenied
+from rest_framework.utils.encoders import JSONEncoder
 from django.core.exceptions import PermissionDenied as DjangoPermissionDenied
+from django.http import StreamingHttpResponse
+from django.db.models.fields.related import ReverseSingleRelatedObjectDescriptor, SingleRelatedObjectDescriptor, \
+                                            ForeignRelatedObjectsDescriptor, ManyRelatedObjectsDescriptor, \
+                                            ReverseManyRelatedObjectsDescriptor
+
+try:
+    # rest_framework 3.1+
+    from rest_framework.utils.urls import replace_query_param
+except ImportError:
+    from rest_framework.templatetags.rest_framework import replace_query_param
+
+# largest page ?limit= can ask for
+MAX_PAGE_SIZE = 1000
+
+# rows serialized at a time in a streamed list
+STREAM_CHUNK_SIZE = 500
 
 class XOSProgrammingError(APIException):
     status_code=400
@@ -32,8 +49,88 @@ class XOSValidationError(APIException):
                             "specific_error": why,
                             "fields": fields})
 
+def model_descriptor(model, name):
+    for klass in model.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
+related_lookups_cache = {}
+
+def related_lookups(serializer_class):
+    """ The (select_related, prefetch_related) lookups that fetch what
+        serializer_class reads from its model's relations: the objects its
+        foreign keys point to, and the lists behind its many-valued fields.
+        Models add the relations their __unicode__ follows further than
+        that, for humanReadableName, in unicode_related. """
+    if serializer_class in related_lookups_cache:
+        return related_lookups_cache[serializer_class]
+
+    model = serializer_class.Meta.model
+    select = []
+    prefetch = []
+    for name in getattr(serializer_class.Meta, "fields", None) or ():
+        descriptor = model_descriptor(model, name)
+        if isinstance(descriptor, (ReverseSingleRelatedObjectDescriptor, SingleRelatedObjectDescriptor)):
+            select.append(name)
+        elif isinstance(descriptor, (ForeignRelatedObjectsDescriptor, ManyRelatedObjectsDescriptor, ReverseManyRelatedObjectsDescriptor)):
+            prefetch.append(name)
+    for lookup in getattr(model, "unicode_related", ()):
+        if lookup not in select:
+            select.append(lookup)
+
+    related_lookups_cache[serializer_class] = (select, prefetch)
+    return (select, prefetch)
+
+def optimize_queryset(queryset, serializer_class, prefetch=True, fields=None):
+    """ queryset, set to fetch the related objects serializer_class uses
+        in a fixed number of queries rather than one or more per row. With
+        fields, only those the fields in it need. """
+    (select, prefetch_lookups) = related_lookups(serializer_class)
+    if fields is not None:
+        select = [l for l in select if (l.split("__")[0] in fields) or ("humanReadableName" in fields)]
+        prefetch_lookups = [l for l in prefetch_lookups if l in fields]
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch and prefetch_lookups:
+        queryset = queryset.prefetch_related(*prefetch_lookups)
+    return queryset
+
+def query_params(request):
+    if hasattr(request, "QUERY_PARAMS"):
+        # rest_framework 2.x
+        return request.QUERY_PARAMS
+    return request.query_params
+
+def positive_int_param(params, name, maximum=None):
+    value = params.get(name, None)
+    if value in [None, ""]:
+        return None
+    try:
+        value = int(value)
+    except ValueError:
+        raise XOSProgrammingError("%s must be an integer" % name, fields={name: value})
+    if (value < 0):
+        raise XOSProgrammingError("%s must not be negative" % name, fields={name: value})
+    if (maximum is not None):
+        value = min(value, maximum)
+    return value
+
+def keyset_page(queryset, after, limit):
+    """ Up to limit rows of queryset, in id order, from the first one with
+        an id above after. Unlike an offset, after keeps its place in the
+        list while rows come and go, and costs nothing however far in. """
+    if after is not None:
+        queryset = queryset.filter(id__gt=after)
+    return list(queryset.order_by("id")[:limit])
+
 class XOSRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
 
+    def optimize_queryset(self, queryset):
+        # a single object: prefetching its many-valued fields saves nothing,
+        # and would serialize them as they were before an update
+        return optimize_queryset(queryset, self.get_serializer_class(), prefetch=False)
+
     # To handle fine-grained field permissions, we have to check can_update
     # the object has been updated but before it has been saved.
 
@@ -92,6 +189,92 @@ class XOSRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
             return super(XOSRetrieveUpdateDestroyAPIView, self).handle_exception(exc)
 
 class XOSListCreateAPIView(generics.ListCreateAPIView):
+    """ Lists take three optional query parameters:
+
+        fields=a,b,...  only serialize these fields; a list without
+                        validators or humanReadableName, say, is much
+                        cheaper to build
+        limit=n         return a page of at most n rows, in id order, with
+        after=id        a Link: <...>; rel="next" header to the next page
+                        as long as there may be more
+        stream=1        send the rows as they are serialized, a chunk at a
+                        time, rather than building the whole list first
+    """
+
+    def requested_fields(self):
+        fields = query_params(self.request).get("fields", None)
+        if not fields:
+            return None
+        fields = [f.strip() for f in fields.split(",") if f.strip()]
+        known = getattr(self.get_serializer_class().Meta, "fields", None)
+        if known:
+            unknown = [f for f in fields if f not in known and f != "id"]
+            if unknown:
+                raise XOSProgrammingError("unknown fields: %s" % ", ".join(unknown), fields={"fields": unknown})
+        return set(fields)
+
+    def optimize_queryset(self, queryset):
+        return optimize_queryset(queryset, self.get_serializer_class(), fields=self.requested_fields())
+
+    def get_list_serializer(self, rows):
+        serializer = self.get_serializer(rows, many=True)
+        fields = self.requested_fields()
+        if fields is not None:
+            # rest_framework 3.x serializes lists with a child serializer
+            declared = getattr(serializer, "child", serializer).fields
+            for name in list(declared.keys()):
+                if name not in fields:
+                    del declared[name]
+        return serializer
+
+    def list(self, request, *args, **kwargs):
+        params = query_params(request)
+        queryset = self.filter_queryset(self.get_queryset())
+        after = positive_int_param(params, "after")
+        limit = positive_int_param(params, "limit", MAX_PAGE_SIZE)
+
+        if params.get("stream", "").lower() in ["1", "true", "yes"]:
+            return self.stream_list(queryset, after, limit)
+
+        if limit is None:
+            if after is not None:
+                queryset = queryset.filter(id__gt=after).order_by("id")
+            self.object_list = queryset
+            return Response(self.get_list_serializer(queryset).data)
+
+        self.object_list = keyset_page(queryset, after, limit)
+        response = Response(self.get_list_serializer(self.object_list).data)
+        if self.object_list and (len(self.object_list) == limit):
+            next_url = replace_query_param(request.build_absolute_uri(), "after", self.object_list[-1].id)
+            response["Link"] = '<%s>; rel="next"' % next_url
+        return response
+
+    def stream_list(self, queryset, after, limit):
+        """ The rows as a JSON list, serialized STREAM_CHUNK_SIZE at a time
+            while the response is sent, so that neither the rows nor their
+            JSON are ever all in memory at once """
+        encoder = JSONEncoder()
+        def chunks():
+            yield "["
+            remaining = limit
+            last = after
+            first = True
+            while (remaining is None) or (remaining > 0):
+                size = STREAM_CHUNK_SIZE if remaining is None else min(STREAM_CHUNK_SIZE, remaining)
+                rows = keyset_page(queryset, last, size)
+                if not rows:
+                    break
+                for item in self.get_list_serializer(rows).data:
+                    yield ("" if first else ",") + encoder.encode(item)
+                    first = False
+                last = rows[-1].id
+                if remaining is not None:
+                    remaining -= len(rows)
+                if (len(rows) < size):
+                    break
+            yield "]"
+        return StreamingHttpResponse(chunks(), content_type="application/json")
+
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.DATA, files=request.FILES)
 
@@ -3,6 +3,7 @@ import sys
 import os
 import time
 import ConfigParser
+import threading
 import tempfile
 import codecs
 from StringIO import StringIO
@@ -25,33 +26,115 @@ def isbool(v):
 def str2bool(v):
 	return v.lower() in ("true", "1")
 
-class Config:
+# How often, in seconds, a cached config checks its file for changes
+RELOAD_CHECK_INTERVAL = 5
+
+# ConfigParser methods that would modify a snapshot in place
+CONFIG_MUTATORS = ("set", "add_section", "remove_option", "remove_section", "read", "readfp")
+
+def get_config_fn():
+	# Look for "-C <something>" to get the
+	# name of the config file. Using a real OptionParser here is
+	# problematic as it will throw 'no such option' errors for options
+	# that it does not understand.
+
+	last = None
+	for arg in sys.argv:
+		if (last=="-C"):
+			return arg
+		last = arg
+
+	return DEFAULT_CONFIG_FN
+
+class Config(object):
+	""" Parsed contents of the XOS config file.
+
+	    Config() is cheap: each file is parsed once per process and every
+	    call returns the same read-only snapshot. When the file's mtime
+	    changes, the next call (at most once every RELOAD_CHECK_INTERVAL
+	    seconds) parses it again and returns a new snapshot; objects already
+	    handed out keep their old values. Config.reload() forces this, and
+	    Config.request_reload() makes the next Config() call do it.
+	"""
+
+	_snapshots = {}
+	_lock = threading.Lock()
+	_reload_requested = False
+
+	# number of times a config file has actually been parsed
+	parse_count = 0
+
+	def __new__(cls, config_file=None):
+		if (config_file==None):
+			config_file = get_config_fn()
+
+		with cls._lock:
+			if cls._reload_requested:
+				cls._reload_requested = False
+				cls._snapshots.clear()
+			config = cls._snapshots.get(config_file)
+			if (config is None) or config.changed():
+				config = cls.parse(config_file)
+				cls._snapshots[config_file] = config
+		return config
 
 	def __init__(self, config_file=None):
-                if (config_file==None):
-                    config_file = self.get_config_fn()
+		# all the work is done once per file, in parse()
+		pass
 
+	@classmethod
+	def parse(cls, config_file):
+		""" Parse config_file into a new snapshot, bypassing the cache """
+		self = object.__new__(cls)
 		self._files = []
 		self.config_path = os.path.dirname(config_file)
 		self.config = ConfigParser.ConfigParser()
 		self.filename = config_file
 		if not os.path.isfile(self.filename):
 			self.create(self.filename)
+		self.mtime = self.get_mtime()
+		self.checked = time.time()
 		self.load(self.filename)
+		self._frozen = True
+		cls.parse_count += 1
+		return self
+
+	@classmethod
+	def reload(cls, config_file=None):
+		""" Drop the cached snapshot(s), so the next Config() re-reads the file """
+		with cls._lock:
+			if (config_file==None):
+				cls._snapshots.clear()
+			else:
+				cls._snapshots.pop(config_file, None)
+
+	@classmethod
+	def request_reload(cls):
+		""" Have the next Config() re-read the file(s). Takes no lock, so
+		    that it can be called from a signal handler, which may interrupt
+		    a thread holding it. """
+		cls._reload_requested = True
+
+	def get_mtime(self):
+		try:
+			return os.stat(self.filename).st_mtime
+		except OSError:
+			return None
 
-        def get_config_fn(self):
-             # Look for "-C <something>" to get the
-             # name of the config file. Using a real OptionParser here is
-             # problematic as it will throw 'no such option' errors for options
-             # that it does not understand.
+	def changed(self):
+		now = time.time()
+		if (now - self.checked < RELOAD_CHECK_INTERVAL):
+			return False
+		object.__setattr__(self, "checked", now)
+		return self.get_mtime() != self.mtime
 
-             last = None
-             for arg in sys.argv:
-                 if (last=="-C"):
-                     return arg
-                 last = arg
+	def get_config_fn(self):
+		return get_config_fn()
 
-             return DEFAULT_CONFIG_FN
+	def __setattr__(self, name, value):
+		if self.__dict__.get("_frozen"):
+			raise AttributeError("Config is read-only, edit %s instead" % self.filename)
+		object.__setattr__(self, name, value)
 
 	def _header(self):
 		header = """
@@ -251,6 +334,10 @@ DO NOT EDIT. This file was automatically generated at
 		self.write(filename)
 
 	def __getattr__(self, attr):
+		if (attr == "config") or attr.startswith("__"):
+			raise AttributeError(attr)
+		if (attr in CONFIG_MUTATORS) and self.__dict__.get("_frozen"):
+			raise AttributeError("Config is read-only, edit %s instead" % self.filename)
 		return getattr(self.config, attr)
 
 if __name__ == '__main__':
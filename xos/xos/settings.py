@@ -268,6 +268,10 @@ ENCRYPTED_FIELD_MODE = 'ENCRYPT'
 
 STATISTICS_DRIVER = getattr(config, "statistics_driver", "ceilometer")
 
+# How long, in seconds, the privileges select_by_user() works from are kept
+# in the cache between requests; 0 reads them once per request
+VISIBILITY_CACHE_TTL = int(getattr(config, "api_visibility_cache_ttl", 0))
+
 # prevents warnings on django 1.7
 TEST_RUNNER = 'django.test.runner.DiscoverRunner'
 
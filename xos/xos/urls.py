@@ -26,6 +26,7 @@ def redirect_to_apache(request):
 urlpatterns = patterns('',
     # Examples:
     url(r'^stats', 'core.views.stats.Stats', name='stats'),
+    url(r'^observer/retries', 'core.views.observer.RetryQueue', name='observer_retries'),
     url(r'^observer', 'core.views.observer.Observer', name='observer'),
     url(r'^serviceGrid', ServiceGridView.as_view(), name='serviceGrid'),
     url(r'^hpcConfig', 'core.views.hpc_config.HpcConfig', name='hpcConfig'),
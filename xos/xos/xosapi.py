@@ -20,6 +20,18 @@ else:
     # rest_framework 2.x
     IdField = serializers.Field
 
+validators_cache = {}
+
+def get_validators(obj):
+    # the validators only depend on the model, not on the row
+    model = obj.__class__
+    if model not in validators_cache:
+        try:
+            validators_cache[model] = obj.getValidators()
+        except:
+            validators_cache[model] = None
+    return validators_cache[model]
+
 """
     Schema of the generator object:
         all: Set of all Model objects
@@ -322,10 +334,7 @@ class ServiceAttributeSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ServiceAttribute
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','value','service',)
@@ -338,10 +347,7 @@ class ServiceAttributeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ServiceAttribute
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','value','service',)
@@ -357,10 +363,7 @@ class ControllerImagesSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerImages
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','image','controller','glance_image_id',)
@@ -373,10 +376,7 @@ class ControllerImagesIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerImages
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','image','controller','glance_image_id',)
@@ -392,10 +392,7 @@ class ControllerSitePrivilegeSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerSitePrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','controller','site_privilege','role_id',)
@@ -408,10 +405,7 @@ class ControllerSitePrivilegeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerSitePrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','controller','site_privilege','role_id',)
@@ -431,10 +425,7 @@ class ImageSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Image
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','disk_format','container_format','path','deployments',)
@@ -451,10 +442,7 @@ class ImageIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Image
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','disk_format','container_format','path','deployments',)
@@ -470,10 +458,7 @@ class NetworkParameterSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkParameter
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','parameter','value','content_type','object_id',)
@@ -486,10 +471,7 @@ class NetworkParameterIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkParameter
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','parameter','value','content_type','object_id',)
@@ -509,10 +491,7 @@ class SiteSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Site
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','site_url','enabled','location','longitude','latitude','login_base','is_public','abbreviated_name','deployments',)
@@ -529,10 +508,7 @@ class SiteIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Site
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','site_url','enabled','location','longitude','latitude','login_base','is_public','abbreviated_name','deployments',)
@@ -548,10 +524,7 @@ class SliceRoleSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SliceRole
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role',)
@@ -564,10 +537,7 @@ class SliceRoleIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SliceRole
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role',)
@@ -583,10 +553,7 @@ class TagSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Tag
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','service','name','value','content_type','object_id',)
@@ -599,10 +566,7 @@ class TagIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Tag
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','service','name','value','content_type','object_id',)
@@ -618,10 +582,7 @@ class InvoiceSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Invoice
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','date','account',)
@@ -634,10 +595,7 @@ class InvoiceIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Invoice
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','date','account',)
@@ -653,10 +611,7 @@ class SlicePrivilegeSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SlicePrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','slice','role',)
@@ -669,10 +624,7 @@ class SlicePrivilegeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SlicePrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','slice','role',)
@@ -688,10 +640,7 @@ class NetworkSliverSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkSliver
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','network','sliver','ip','port_id',)
@@ -704,10 +653,7 @@ class NetworkSliverIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkSliver
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','network','sliver','ip','port_id',)
@@ -727,10 +673,7 @@ class FlavorSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Flavor
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','description','flavor','order','default','deployments',)
@@ -747,10 +690,7 @@ class FlavorIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Flavor
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','description','flavor','order','default','deployments',)
@@ -766,10 +706,7 @@ class ControllerSiteSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerSite
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','site','controller','tenant_id',)
@@ -782,10 +719,7 @@ class ControllerSiteIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerSite
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','site','controller','tenant_id',)
@@ -801,10 +735,7 @@ class ProjectSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Project
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name',)
@@ -817,10 +748,7 @@ class ProjectIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Project
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name',)
@@ -844,10 +772,7 @@ class SliceSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Slice
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','enabled','omf_friendly','description','slice_url','site','max_slivers','service','network','serviceClass','creator','default_flavor','default_image','mount_data_sets','networks','networks',)
@@ -868,10 +793,7 @@ class SliceIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Slice
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','enabled','omf_friendly','description','slice_url','site','max_slivers','service','network','serviceClass','creator','default_flavor','default_image','mount_data_sets','networks','networks',)
@@ -907,10 +829,7 @@ class NetworkSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Network
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','template','subnet','ports','labels','owner','guaranteed_bandwidth','permit_all_slices','topology_parameters','controller_url','controller_parameters','network_id','router_id','subnet_id','slices','slices','slivers','routers','routers',)
@@ -943,10 +862,7 @@ class NetworkIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Network
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','template','subnet','ports','labels','owner','guaranteed_bandwidth','permit_all_slices','topology_parameters','controller_url','controller_parameters','network_id','router_id','subnet_id','slices','slices','slivers','routers','routers',)
@@ -962,10 +878,7 @@ class ServiceSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Service
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','description','enabled','name','versionNumber','published',)
@@ -978,10 +891,7 @@ class ServiceIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Service
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','description','enabled','name','versionNumber','published',)
@@ -997,10 +907,7 @@ class ServiceClassSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ServiceClass
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','description','commitment','membershipFee','membershipFeeMonths','upgradeRequiresApproval',)
@@ -1013,10 +920,7 @@ class ServiceClassIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ServiceClass
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','description','commitment','membershipFee','membershipFeeMonths','upgradeRequiresApproval',)
@@ -1032,10 +936,7 @@ class PaymentSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Payment
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','account','amount','date',)
@@ -1048,10 +949,7 @@ class PaymentIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Payment
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','account','amount','date',)
@@ -1067,10 +965,7 @@ class ChargeSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Charge
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','account','slice','kind','state','date','object','amount','coreHours','invoice',)
@@ -1083,10 +978,7 @@ class ChargeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Charge
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','account','slice','kind','state','date','object','amount','coreHours','invoice',)
@@ -1102,10 +994,7 @@ class RoleSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Role
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role_type','role','description','content_type',)
@@ -1118,10 +1007,7 @@ class RoleIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Role
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role_type','role','description','content_type',)
@@ -1137,10 +1023,7 @@ class UsableObjectSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = UsableObject
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name',)
@@ -1153,10 +1036,7 @@ class UsableObjectIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = UsableObject
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name',)
@@ -1172,10 +1052,7 @@ class SiteRoleSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SiteRole
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role',)
@@ -1188,10 +1065,7 @@ class SiteRoleIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SiteRole
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role',)
@@ -1207,10 +1081,7 @@ class SliceCredentialSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SliceCredential
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','slice','name','key_id','enc_value',)
@@ -1223,10 +1094,7 @@ class SliceCredentialIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SliceCredential
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','slice','name','key_id','enc_value',)
@@ -1246,10 +1114,7 @@ class SliverSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Sliver
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','instance_id','instance_uuid','name','instance_name','ip','image','creator','slice','deployment','node','numberCores','flavor','userData','networks',)
@@ -1266,10 +1131,7 @@ class SliverIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Sliver
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','instance_id','instance_uuid','name','instance_name','ip','image','creator','slice','deployment','node','numberCores','flavor','userData','networks',)
@@ -1285,10 +1147,7 @@ class NodeSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Node
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','site_deployment','site',)
@@ -1301,10 +1160,7 @@ class NodeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Node
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','site_deployment','site',)
@@ -1328,10 +1184,7 @@ class DashboardViewSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = DashboardView
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','url','enabled','controllers','deployments',)
@@ -1352,10 +1205,7 @@ class DashboardViewIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = DashboardView
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','url','enabled','controllers','deployments',)
@@ -1371,10 +1221,7 @@ class ControllerNetworkSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerNetwork
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','network','controller','net_id','router_id','subnet_id','subnet',)
@@ -1387,10 +1234,7 @@ class ControllerNetworkIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerNetwork
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','network','controller','net_id','router_id','subnet_id','subnet',)
@@ -1406,10 +1250,7 @@ class ImageDeploymentsSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ImageDeployments
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','image','deployment',)
@@ -1422,10 +1263,7 @@ class ImageDeploymentsIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ImageDeployments
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','image','deployment',)
@@ -1441,10 +1279,7 @@ class ControllerUserSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerUser
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','controller','kuser_id',)
@@ -1457,10 +1292,7 @@ class ControllerUserIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerUser
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','controller','kuser_id',)
@@ -1476,10 +1308,7 @@ class ReservedResourceSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ReservedResource
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','sliver','resource','quantity','reservationSet',)
@@ -1492,10 +1321,7 @@ class ReservedResourceIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ReservedResource
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','sliver','resource','quantity','reservationSet',)
@@ -1511,10 +1337,7 @@ class NetworkSliceSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkSlice
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','network','slice',)
@@ -1527,10 +1350,7 @@ class NetworkSliceIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkSlice
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','network','slice',)
@@ -1546,10 +1366,7 @@ class UserDashboardViewSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = UserDashboardView
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','dashboardView','order',)
@@ -1562,10 +1379,7 @@ class UserDashboardViewIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = UserDashboardView
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','dashboardView','order',)
@@ -1585,10 +1399,7 @@ class ControllerSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Controller
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','backend_type','version','auth_url','admin_user','admin_password','admin_tenant','domain','deployment','dashboardviews',)
@@ -1605,10 +1416,7 @@ class ControllerIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Controller
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','backend_type','version','auth_url','admin_user','admin_password','admin_tenant','domain','deployment','dashboardviews',)
@@ -1624,10 +1432,7 @@ class UserSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = User
         fields = ('humanReadableName', 'validators', 'id','password','last_login','email','username','firstname','lastname','phone','user_url','site','public_key','is_active','is_admin','is_staff','is_readonly','is_registering','created','updated','enacted','policed','backend_status','deleted','timezone',)
@@ -1640,10 +1445,7 @@ class UserIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = User
         fields = ('humanReadableName', 'validators', 'id','password','last_login','email','username','firstname','lastname','phone','user_url','site','public_key','is_active','is_admin','is_staff','is_readonly','is_registering','created','updated','enacted','policed','backend_status','deleted','timezone',)
@@ -1675,10 +1477,7 @@ class DeploymentSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Deployment
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','accessControl','images','sites','flavors','dashboardviews',)
@@ -1707,10 +1506,7 @@ class DeploymentIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Deployment
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','accessControl','images','sites','flavors','dashboardviews',)
@@ -1726,10 +1522,7 @@ class ReservationSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Reservation
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','startTime','slice','duration',)
@@ -1742,10 +1535,7 @@ class ReservationIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Reservation
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','startTime','slice','duration',)
@@ -1761,10 +1551,7 @@ class SitePrivilegeSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SitePrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','site','role',)
@@ -1777,10 +1564,7 @@ class SitePrivilegeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SitePrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','site','role',)
@@ -1796,10 +1580,7 @@ class ControllerSliceSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerSlice
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','controller','slice','tenant_id',)
@@ -1812,10 +1593,7 @@ class ControllerSliceIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerSlice
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','controller','slice','tenant_id',)
@@ -1831,10 +1609,7 @@ class ControllerDashboardViewSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerDashboardView
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','controller','dashboardView','enabled','url',)
@@ -1847,10 +1622,7 @@ class ControllerDashboardViewIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerDashboardView
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','controller','dashboardView','enabled','url',)
@@ -1866,10 +1638,7 @@ class AccountSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Account
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','site',)
@@ -1882,10 +1651,7 @@ class AccountIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Account
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','site',)
@@ -1901,10 +1667,7 @@ class ControllerRoleSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerRole
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role',)
@@ -1917,10 +1680,7 @@ class ControllerRoleIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerRole
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role',)
@@ -1936,10 +1696,7 @@ class NetworkParameterTypeSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkParameterType
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','description',)
@@ -1952,10 +1709,7 @@ class NetworkParameterTypeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkParameterType
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','description',)
@@ -1971,10 +1725,7 @@ class SiteCredentialSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SiteCredential
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','site','name','key_id','enc_value',)
@@ -1987,10 +1738,7 @@ class SiteCredentialIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SiteCredential
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','site','name','key_id','enc_value',)
@@ -2006,10 +1754,7 @@ class DeploymentPrivilegeSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = DeploymentPrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','deployment','role',)
@@ -2022,10 +1767,7 @@ class DeploymentPrivilegeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = DeploymentPrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','deployment','role',)
@@ -2041,10 +1783,7 @@ class ControllerSlicePrivilegeSerializer(serializers.HyperlinkedModelSerializer)
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerSlicePrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','controller','slice_privilege','role_id',)
@@ -2057,10 +1796,7 @@ class ControllerSlicePrivilegeIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ControllerSlicePrivilege
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','controller','slice_privilege','role_id',)
@@ -2076,10 +1812,7 @@ class SiteDeploymentSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SiteDeployment
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','site','deployment','controller','availability_zone',)
@@ -2092,10 +1825,7 @@ class SiteDeploymentIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SiteDeployment
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','site','deployment','controller','availability_zone',)
@@ -2111,10 +1841,7 @@ class DeploymentRoleSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = DeploymentRole
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role',)
@@ -2127,10 +1854,7 @@ class DeploymentRoleIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = DeploymentRole
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','role',)
@@ -2146,10 +1870,7 @@ class UserCredentialSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = UserCredential
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','name','key_id','enc_value',)
@@ -2162,10 +1883,7 @@ class UserCredentialIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = UserCredential
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','user','name','key_id','enc_value',)
@@ -2181,10 +1899,7 @@ class SliceTagSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SliceTag
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','slice','name','value',)
@@ -2197,10 +1912,7 @@ class SliceTagIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = SliceTag
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','slice','name','value',)
@@ -2216,10 +1928,7 @@ class NetworkTemplateSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkTemplate
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','description','guaranteed_bandwidth','visibility','translation','shared_network_name','shared_network_id','topology_kind','controller_kind',)
@@ -2232,10 +1941,7 @@ class NetworkTemplateIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = NetworkTemplate
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','description','guaranteed_bandwidth','visibility','translation','shared_network_name','shared_network_id','topology_kind','controller_kind',)
@@ -2259,10 +1965,7 @@ class RouterSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Router
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','owner','networks','networks',)
@@ -2283,10 +1986,7 @@ class RouterIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = Router
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','name','owner','networks','networks',)
@@ -2302,10 +2002,7 @@ class ServiceResourceSerializer(serializers.HyperlinkedModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ServiceResource
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','serviceClass','name','maxUnitsDeployment','maxUnitsNode','maxDuration','bucketInRate','bucketMaxSize','cost','calendarReservable',)
@@ -2318,10 +2015,7 @@ class ServiceResourceIdSerializer(XOSModelSerializer):
     def getHumanReadableName(self, obj):
         return str(obj)
     def getValidators(self, obj):
-        try:
-            return obj.getValidators()
-        except:
-            return None
+        return get_validators(obj)
     class Meta:
         model = ServiceResource
         fields = ('humanReadableName', 'validators', 'id','created','updated','enacted','policed','backend_register','backend_status','deleted','serviceClass','name','maxUnitsDeployment','maxUnitsNode','maxDuration','bucketInRate','bucketMaxSize','cost','calendarReservable',)
@@ -2462,7 +2156,7 @@ class ServiceAttributeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ServiceAttribute.select_by_user(self.request.user)
+        return self.optimize_queryset(ServiceAttribute.select_by_user(self.request.user))
 
 
 class ServiceAttributeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2482,7 +2176,7 @@ class ServiceAttributeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ServiceAttribute.select_by_user(self.request.user)
+        return self.optimize_queryset(ServiceAttribute.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2509,7 +2203,7 @@ class ControllerImagesList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerImages.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerImages.select_by_user(self.request.user))
 
 
 class ControllerImagesDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2529,7 +2223,7 @@ class ControllerImagesDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerImages.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerImages.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2556,7 +2250,7 @@ class ControllerSitePrivilegeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerSitePrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerSitePrivilege.select_by_user(self.request.user))
 
 
 class ControllerSitePrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2576,7 +2270,7 @@ class ControllerSitePrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerSitePrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerSitePrivilege.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2603,7 +2297,7 @@ class ImageList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Image.select_by_user(self.request.user)
+        return self.optimize_queryset(Image.select_by_user(self.request.user))
 
 
 class ImageDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2623,7 +2317,7 @@ class ImageDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Image.select_by_user(self.request.user)
+        return self.optimize_queryset(Image.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2650,7 +2344,7 @@ class NetworkParameterList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkParameter.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkParameter.select_by_user(self.request.user))
 
 
 class NetworkParameterDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2670,7 +2364,7 @@ class NetworkParameterDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkParameter.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkParameter.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2697,7 +2391,7 @@ class SiteList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Site.select_by_user(self.request.user)
+        return self.optimize_queryset(Site.select_by_user(self.request.user))
 
 
 class SiteDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2717,7 +2411,7 @@ class SiteDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Site.select_by_user(self.request.user)
+        return self.optimize_queryset(Site.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2744,7 +2438,7 @@ class SliceRoleList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SliceRole.select_by_user(self.request.user)
+        return self.optimize_queryset(SliceRole.select_by_user(self.request.user))
 
 
 class SliceRoleDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2764,7 +2458,7 @@ class SliceRoleDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SliceRole.select_by_user(self.request.user)
+        return self.optimize_queryset(SliceRole.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2791,7 +2485,7 @@ class TagList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Tag.select_by_user(self.request.user)
+        return self.optimize_queryset(Tag.select_by_user(self.request.user))
 
 
 class TagDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2811,7 +2505,7 @@ class TagDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Tag.select_by_user(self.request.user)
+        return self.optimize_queryset(Tag.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2838,7 +2532,7 @@ class InvoiceList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Invoice.select_by_user(self.request.user)
+        return self.optimize_queryset(Invoice.select_by_user(self.request.user))
 
 
 class InvoiceDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2858,7 +2552,7 @@ class InvoiceDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Invoice.select_by_user(self.request.user)
+        return self.optimize_queryset(Invoice.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2885,7 +2579,7 @@ class SlicePrivilegeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SlicePrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(SlicePrivilege.select_by_user(self.request.user))
 
 
 class SlicePrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2905,7 +2599,7 @@ class SlicePrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SlicePrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(SlicePrivilege.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2932,7 +2626,7 @@ class NetworkSliverList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkSliver.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkSliver.select_by_user(self.request.user))
 
 
 class NetworkSliverDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2952,7 +2646,7 @@ class NetworkSliverDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkSliver.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkSliver.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -2979,7 +2673,7 @@ class FlavorList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Flavor.select_by_user(self.request.user)
+        return self.optimize_queryset(Flavor.select_by_user(self.request.user))
 
 
 class FlavorDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -2999,7 +2693,7 @@ class FlavorDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Flavor.select_by_user(self.request.user)
+        return self.optimize_queryset(Flavor.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3026,7 +2720,7 @@ class ControllerSiteList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerSite.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerSite.select_by_user(self.request.user))
 
 
 class ControllerSiteDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3046,7 +2740,7 @@ class ControllerSiteDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerSite.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerSite.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3073,7 +2767,7 @@ class ProjectList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Project.select_by_user(self.request.user)
+        return self.optimize_queryset(Project.select_by_user(self.request.user))
 
 
 class ProjectDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3093,7 +2787,7 @@ class ProjectDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Project.select_by_user(self.request.user)
+        return self.optimize_queryset(Project.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3120,7 +2814,7 @@ class SliceList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Slice.select_by_user(self.request.user)
+        return self.optimize_queryset(Slice.select_by_user(self.request.user))
 
 
 class SliceDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3140,7 +2834,7 @@ class SliceDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Slice.select_by_user(self.request.user)
+        return self.optimize_queryset(Slice.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3167,7 +2861,7 @@ class NetworkList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Network.select_by_user(self.request.user)
+        return self.optimize_queryset(Network.select_by_user(self.request.user))
 
 
 class NetworkDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3187,7 +2881,7 @@ class NetworkDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Network.select_by_user(self.request.user)
+        return self.optimize_queryset(Network.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3214,7 +2908,7 @@ class ServiceList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Service.select_by_user(self.request.user)
+        return self.optimize_queryset(Service.select_by_user(self.request.user))
 
 
 class ServiceDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3234,7 +2928,7 @@ class ServiceDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Service.select_by_user(self.request.user)
+        return self.optimize_queryset(Service.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3261,7 +2955,7 @@ class ServiceClassList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ServiceClass.select_by_user(self.request.user)
+        return self.optimize_queryset(ServiceClass.select_by_user(self.request.user))
 
 
 class ServiceClassDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3281,7 +2975,7 @@ class ServiceClassDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ServiceClass.select_by_user(self.request.user)
+        return self.optimize_queryset(ServiceClass.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3308,7 +3002,7 @@ class PaymentList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Payment.select_by_user(self.request.user)
+        return self.optimize_queryset(Payment.select_by_user(self.request.user))
 
 
 class PaymentDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3328,7 +3022,7 @@ class PaymentDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Payment.select_by_user(self.request.user)
+        return self.optimize_queryset(Payment.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3355,7 +3049,7 @@ class ChargeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Charge.select_by_user(self.request.user)
+        return self.optimize_queryset(Charge.select_by_user(self.request.user))
 
 
 class ChargeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3375,7 +3069,7 @@ class ChargeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Charge.select_by_user(self.request.user)
+        return self.optimize_queryset(Charge.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3402,7 +3096,7 @@ class RoleList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Role.select_by_user(self.request.user)
+        return self.optimize_queryset(Role.select_by_user(self.request.user))
 
 
 class RoleDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3422,7 +3116,7 @@ class RoleDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Role.select_by_user(self.request.user)
+        return self.optimize_queryset(Role.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3449,7 +3143,7 @@ class UsableObjectList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return UsableObject.select_by_user(self.request.user)
+        return self.optimize_queryset(UsableObject.select_by_user(self.request.user))
 
 
 class UsableObjectDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3469,7 +3163,7 @@ class UsableObjectDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return UsableObject.select_by_user(self.request.user)
+        return self.optimize_queryset(UsableObject.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3496,7 +3190,7 @@ class SiteRoleList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SiteRole.select_by_user(self.request.user)
+        return self.optimize_queryset(SiteRole.select_by_user(self.request.user))
 
 
 class SiteRoleDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3516,7 +3210,7 @@ class SiteRoleDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SiteRole.select_by_user(self.request.user)
+        return self.optimize_queryset(SiteRole.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3543,7 +3237,7 @@ class SliceCredentialList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SliceCredential.select_by_user(self.request.user)
+        return self.optimize_queryset(SliceCredential.select_by_user(self.request.user))
 
 
 class SliceCredentialDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3563,7 +3257,7 @@ class SliceCredentialDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SliceCredential.select_by_user(self.request.user)
+        return self.optimize_queryset(SliceCredential.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3590,7 +3284,7 @@ class SliverList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Sliver.select_by_user(self.request.user)
+        return self.optimize_queryset(Sliver.select_by_user(self.request.user))
 
 
 class SliverDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3610,7 +3304,7 @@ class SliverDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Sliver.select_by_user(self.request.user)
+        return self.optimize_queryset(Sliver.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3637,7 +3331,7 @@ class NodeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Node.select_by_user(self.request.user)
+        return self.optimize_queryset(Node.select_by_user(self.request.user))
 
 
 class NodeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3657,7 +3351,7 @@ class NodeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Node.select_by_user(self.request.user)
+        return self.optimize_queryset(Node.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3684,7 +3378,7 @@ class DashboardViewList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return DashboardView.select_by_user(self.request.user)
+        return self.optimize_queryset(DashboardView.select_by_user(self.request.user))
 
 
 class DashboardViewDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3704,7 +3398,7 @@ class DashboardViewDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return DashboardView.select_by_user(self.request.user)
+        return self.optimize_queryset(DashboardView.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3731,7 +3425,7 @@ class ControllerNetworkList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerNetwork.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerNetwork.select_by_user(self.request.user))
 
 
 class ControllerNetworkDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3751,7 +3445,7 @@ class ControllerNetworkDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerNetwork.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerNetwork.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3778,7 +3472,7 @@ class ImageDeploymentsList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ImageDeployments.select_by_user(self.request.user)
+        return self.optimize_queryset(ImageDeployments.select_by_user(self.request.user))
 
 
 class ImageDeploymentsDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3798,7 +3492,7 @@ class ImageDeploymentsDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ImageDeployments.select_by_user(self.request.user)
+        return self.optimize_queryset(ImageDeployments.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3825,7 +3519,7 @@ class ControllerUserList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerUser.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerUser.select_by_user(self.request.user))
 
 
 class ControllerUserDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3845,7 +3539,7 @@ class ControllerUserDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerUser.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerUser.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3872,7 +3566,7 @@ class ReservedResourceList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ReservedResource.select_by_user(self.request.user)
+        return self.optimize_queryset(ReservedResource.select_by_user(self.request.user))
 
 
 class ReservedResourceDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3892,7 +3586,7 @@ class ReservedResourceDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ReservedResource.select_by_user(self.request.user)
+        return self.optimize_queryset(ReservedResource.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3919,7 +3613,7 @@ class NetworkSliceList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkSlice.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkSlice.select_by_user(self.request.user))
 
 
 class NetworkSliceDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3939,7 +3633,7 @@ class NetworkSliceDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkSlice.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkSlice.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -3966,7 +3660,7 @@ class UserDashboardViewList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return UserDashboardView.select_by_user(self.request.user)
+        return self.optimize_queryset(UserDashboardView.select_by_user(self.request.user))
 
 
 class UserDashboardViewDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -3986,7 +3680,7 @@ class UserDashboardViewDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return UserDashboardView.select_by_user(self.request.user)
+        return self.optimize_queryset(UserDashboardView.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4013,7 +3707,7 @@ class ControllerList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Controller.select_by_user(self.request.user)
+        return self.optimize_queryset(Controller.select_by_user(self.request.user))
 
 
 class ControllerDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4033,7 +3727,7 @@ class ControllerDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Controller.select_by_user(self.request.user)
+        return self.optimize_queryset(Controller.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4060,7 +3754,7 @@ class UserList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return User.select_by_user(self.request.user)
+        return self.optimize_queryset(User.select_by_user(self.request.user))
 
 
 class UserDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4080,7 +3774,7 @@ class UserDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return User.select_by_user(self.request.user)
+        return self.optimize_queryset(User.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4107,7 +3801,7 @@ class DeploymentList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Deployment.select_by_user(self.request.user)
+        return self.optimize_queryset(Deployment.select_by_user(self.request.user))
 
 
 class DeploymentDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4127,7 +3821,7 @@ class DeploymentDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Deployment.select_by_user(self.request.user)
+        return self.optimize_queryset(Deployment.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4154,7 +3848,7 @@ class ReservationList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Reservation.select_by_user(self.request.user)
+        return self.optimize_queryset(Reservation.select_by_user(self.request.user))
 
 
 class ReservationDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4174,7 +3868,7 @@ class ReservationDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Reservation.select_by_user(self.request.user)
+        return self.optimize_queryset(Reservation.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4201,7 +3895,7 @@ class SitePrivilegeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SitePrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(SitePrivilege.select_by_user(self.request.user))
 
 
 class SitePrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4221,7 +3915,7 @@ class SitePrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SitePrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(SitePrivilege.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4248,7 +3942,7 @@ class ControllerSliceList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerSlice.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerSlice.select_by_user(self.request.user))
 
 
 class ControllerSliceDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4268,7 +3962,7 @@ class ControllerSliceDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerSlice.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerSlice.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4295,7 +3989,7 @@ class ControllerDashboardViewList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerDashboardView.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerDashboardView.select_by_user(self.request.user))
 
 
 class ControllerDashboardViewDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4315,7 +4009,7 @@ class ControllerDashboardViewDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerDashboardView.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerDashboardView.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4342,7 +4036,7 @@ class AccountList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Account.select_by_user(self.request.user)
+        return self.optimize_queryset(Account.select_by_user(self.request.user))
 
 
 class AccountDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4362,7 +4056,7 @@ class AccountDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Account.select_by_user(self.request.user)
+        return self.optimize_queryset(Account.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4389,7 +4083,7 @@ class ControllerRoleList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerRole.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerRole.select_by_user(self.request.user))
 
 
 class ControllerRoleDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4409,7 +4103,7 @@ class ControllerRoleDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerRole.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerRole.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4436,7 +4130,7 @@ class NetworkParameterTypeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkParameterType.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkParameterType.select_by_user(self.request.user))
 
 
 class NetworkParameterTypeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4456,7 +4150,7 @@ class NetworkParameterTypeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkParameterType.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkParameterType.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4483,7 +4177,7 @@ class SiteCredentialList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SiteCredential.select_by_user(self.request.user)
+        return self.optimize_queryset(SiteCredential.select_by_user(self.request.user))
 
 
 class SiteCredentialDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4503,7 +4197,7 @@ class SiteCredentialDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SiteCredential.select_by_user(self.request.user)
+        return self.optimize_queryset(SiteCredential.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4530,7 +4224,7 @@ class DeploymentPrivilegeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return DeploymentPrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(DeploymentPrivilege.select_by_user(self.request.user))
 
 
 class DeploymentPrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4550,7 +4244,7 @@ class DeploymentPrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return DeploymentPrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(DeploymentPrivilege.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4577,7 +4271,7 @@ class ControllerSlicePrivilegeList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerSlicePrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerSlicePrivilege.select_by_user(self.request.user))
 
 
 class ControllerSlicePrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4597,7 +4291,7 @@ class ControllerSlicePrivilegeDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ControllerSlicePrivilege.select_by_user(self.request.user)
+        return self.optimize_queryset(ControllerSlicePrivilege.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4624,7 +4318,7 @@ class SiteDeploymentList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SiteDeployment.select_by_user(self.request.user)
+        return self.optimize_queryset(SiteDeployment.select_by_user(self.request.user))
 
 
 class SiteDeploymentDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4644,7 +4338,7 @@ class SiteDeploymentDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SiteDeployment.select_by_user(self.request.user)
+        return self.optimize_queryset(SiteDeployment.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4671,7 +4365,7 @@ class DeploymentRoleList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return DeploymentRole.select_by_user(self.request.user)
+        return self.optimize_queryset(DeploymentRole.select_by_user(self.request.user))
 
 
 class DeploymentRoleDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4691,7 +4385,7 @@ class DeploymentRoleDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return DeploymentRole.select_by_user(self.request.user)
+        return self.optimize_queryset(DeploymentRole.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4718,7 +4412,7 @@ class UserCredentialList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return UserCredential.select_by_user(self.request.user)
+        return self.optimize_queryset(UserCredential.select_by_user(self.request.user))
 
 
 class UserCredentialDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4738,7 +4432,7 @@ class UserCredentialDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return UserCredential.select_by_user(self.request.user)
+        return self.optimize_queryset(UserCredential.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4765,7 +4459,7 @@ class SliceTagList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SliceTag.select_by_user(self.request.user)
+        return self.optimize_queryset(SliceTag.select_by_user(self.request.user))
 
 
 class SliceTagDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4785,7 +4479,7 @@ class SliceTagDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return SliceTag.select_by_user(self.request.user)
+        return self.optimize_queryset(SliceTag.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4812,7 +4506,7 @@ class NetworkTemplateList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkTemplate.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkTemplate.select_by_user(self.request.user))
 
 
 class NetworkTemplateDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4832,7 +4526,7 @@ class NetworkTemplateDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return NetworkTemplate.select_by_user(self.request.user)
+        return self.optimize_queryset(NetworkTemplate.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4859,7 +4553,7 @@ class RouterList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Router.select_by_user(self.request.user)
+        return self.optimize_queryset(Router.select_by_user(self.request.user))
 
 
 class RouterDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4879,7 +4573,7 @@ class RouterDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return Router.select_by_user(self.request.user)
+        return self.optimize_queryset(Router.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 
@@ -4906,7 +4600,7 @@ class ServiceResourceList(XOSListCreateAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ServiceResource.select_by_user(self.request.user)
+        return self.optimize_queryset(ServiceResource.select_by_user(self.request.user))
 
 
 class ServiceResourceDetail(XOSRetrieveUpdateDestroyAPIView):
@@ -4926,7 +4620,7 @@ class ServiceResourceDetail(XOSRetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         if (not self.request.user.is_authenticated()):
             raise XOSNotAuthenticated()
-        return ServiceResource.select_by_user(self.request.user)
+        return self.optimize_queryset(ServiceResource.select_by_user(self.request.user))
 
     # update() is handled by XOSRetrieveUpdateDestroyAPIView
 